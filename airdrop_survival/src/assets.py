@@ -0,0 +1,351 @@
+# src/assets.py
+# Shared image loading: every image is decoded once and scaled copies are cached
+
+import json
+import os
+from collections import OrderedDict
+
+import pygame
+
+import preload
+from atlas import SpriteAtlas
+
+try:
+    from settings import ASSET_CACHE_MAX_SURFACES
+except Exception:
+    ASSET_CACHE_MAX_SURFACES = 128
+
+ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'assets'))
+# Output of tools/bake_assets.py: pre-downscaled sprites plus manifest.json
+BAKED_DIR_NAME = 'baked'
+MANIFEST_NAME = 'manifest.json'
+
+
+def atlas_key_name(key):
+    """Manifest spelling of an atlas key: ('coin.png', (48, 48)) -> 'coin.png@48x48'."""
+    name, (w, h) = key
+    return f"{name}@{w}x{h}"
+
+
+def parse_atlas_key(text):
+    name, _, size = text.rpartition('@')
+    w, h = size.split('x')
+    return name, (int(w), int(h))
+
+
+def load_manifest(base=ASSETS_DIR):
+    """Read the baked-asset manifest, dropping entries whose source file changed.
+
+    An entry is kept only if its source still exists with the byte size it had
+    when baked, so editing a source PNG silently falls back to runtime scaling.
+    Returns (images, atlas): the per-image entries and the atlas section (or
+    None), with atlas sprites of stale sources removed. ({}, None) if there is
+    no usable manifest.
+    """
+    path = os.path.join(base, BAKED_DIR_NAME, MANIFEST_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return {}, None
+    images = {}
+    for name, entry in (data.get('images') or {}).items():
+        try:
+            if os.path.getsize(os.path.join(base, name)) == entry['source_bytes']:
+                images[name] = entry
+        except Exception:
+            continue
+    atlas = data.get('atlas')
+    if atlas:
+        sprites = {}
+        for text, rect in (atlas.get('sprites') or {}).items():
+            try:
+                key = parse_atlas_key(text)
+            except Exception:
+                continue
+            if key[0] in images:
+                sprites[key] = rect
+        atlas = {'file': atlas.get('file'), 'sprites': sprites} if sprites and atlas.get('file') else None
+    return images, atlas
+
+
+class AssetManager:
+    """Load images from assets/ once and hand out pre-scaled copies.
+
+    Source images are kept for the lifetime of the manager; a missing or
+    unreadable file is remembered as None so the disk is only probed once.
+    Scaled surfaces live in an LRU keyed by (name, (w, h)) holding at most
+    `max_scaled` entries. Callers must treat returned surfaces as read-only.
+
+    When tools/bake_assets.py has produced a variant at exactly the requested
+    size, that small file is loaded instead of decoding and scaling the source.
+
+    Sprites that live in the sprite atlas (baked, or packed at runtime by
+    ensure_atlas) are handed out as subsurfaces of the single atlas surface;
+    atlas() exposes the sheet and its rect index for batched blits.
+
+    prefetch() decodes the files behind a set of sprites on the preload
+    thread pool. Decoded surfaces are converted to the display format on the
+    main thread, by pump() or by the first call that needs them.
+    """
+
+    def __init__(self, base=ASSETS_DIR, max_scaled=ASSET_CACHE_MAX_SURFACES):
+        self.base = base
+        self.max_scaled = max(1, int(max_scaled))
+        self._images = {}
+        self._scaled = OrderedDict()
+        self._missing = set()
+        self._manifest, self._baked_atlas = load_manifest(base)
+        self._atlas = None
+        # path -> Future of the decoded (not yet converted) surface
+        self._decoding = {}
+        # path -> decoded surface converted by pump(), taken by _load()
+        self._decoded = {}
+
+    def register(self, name, surface):
+        """Add a generated surface (e.g. a procedural fallback icon) under `name`."""
+        self._images[name] = surface
+        self._manifest.pop(name, None)
+        self._drop_scaled(name)
+
+    def _load(self, path, alpha):
+        surf = self._decoded.pop(path, None)
+        if surf is not None:
+            return surf if alpha else surf.convert()
+        fut = self._decoding.pop(path, None)
+        try:
+            print(f"assets: loading image from {path}")
+            # a prefetched decode still in flight is waited for rather than repeated
+            surf = fut.result() if fut is not None and not fut.cancelled() else pygame.image.load(path)
+        except Exception:
+            print(f"assets: failed loading image from {path}")
+            return None
+        try:
+            return surf.convert_alpha() if alpha else surf.convert()
+        except pygame.error:
+            # no display mode yet; keep the unconverted surface
+            return surf
+
+    def image(self, name, alpha=True):
+        """Return the full-size surface for `name`, or None if it can't be loaded."""
+        if name in self._images:
+            return self._images[name]
+        surf = None
+        if self.exists(name):
+            surf = self._load(os.path.join(self.base, name), alpha)
+        self._images[name] = surf
+        return surf
+
+    def exists(self, name):
+        """True if `name` is registered, baked or present on disk (probed once)."""
+        if name in self._images:
+            return self._images[name] is not None
+        if name in self._manifest:
+            return True
+        if name in self._missing:
+            return False
+        if os.path.exists(os.path.join(self.base, name)):
+            return True
+        self._missing.add(name)
+        return False
+
+    def first(self, *names):
+        """Return the first of `names` that is available, or None if none are."""
+        for name in names:
+            if self.exists(name):
+                return name
+        return None
+
+    def size(self, name):
+        """Return the source (w, h) of `name` without decoding it when it was baked."""
+        entry = self._manifest.get(name)
+        if entry is not None and name not in self._images:
+            return tuple(entry['source_size'])
+        src = self.image(name)
+        return src.get_size() if src is not None else None
+
+    def scaled(self, name, size, alpha=True):
+        """Return `name` smoothscaled to `size` (w, h), cached; None if missing."""
+        key = (name, (max(1, int(size[0])), max(1, int(size[1]))))
+        surf = self._scaled.get(key)
+        if surf is not None:
+            self._scaled.move_to_end(key)
+            return surf
+        atlas = self.atlas()
+        if atlas is not None and key in atlas:
+            surf = atlas.sprite(key)
+        else:
+            surf = self._baked(name, key[1], alpha)
+        if surf is not None:
+            self._store(key, surf)
+            return surf
+        src = self.image(name, alpha=alpha)
+        if src is None:
+            return None
+        if src.get_size() == key[1]:
+            surf = src
+        else:
+            try:
+                surf = pygame.transform.smoothscale(src, key[1])
+            except Exception:
+                # smoothscale needs 24/32-bit surfaces; plain scale works for the rest
+                surf = pygame.transform.scale(src, key[1])
+        self._store(key, surf)
+        return surf
+
+    def _baked(self, name, size, alpha):
+        entry = self._manifest.get(name)
+        if entry is None:
+            return None
+        rel = (entry.get('variants') or {}).get(f"{size[0]}x{size[1]}")
+        if rel is None:
+            return None
+        return self._load(os.path.join(self.base, BAKED_DIR_NAME, rel), alpha)
+
+    def _path_for(self, name, size=None):
+        """File that image(name) (size None) or scaled(name, size) would read; None if cached or missing."""
+        if size is None:
+            if name in self._images or not self.exists(name):
+                return None
+            return os.path.join(self.base, name)
+        key = (name, (int(size[0]), int(size[1])))
+        if key in self._scaled or (self._atlas is not None and key in self._atlas):
+            return None
+        if self._baked_atlas is not None and key in self._baked_atlas['sprites']:
+            return os.path.join(self.base, BAKED_DIR_NAME, self._baked_atlas['file'])
+        entry = self._manifest.get(name)
+        rel = (entry.get('variants') or {}).get(f"{key[1][0]}x{key[1][1]}") if entry else None
+        if rel is not None:
+            return os.path.join(self.base, BAKED_DIR_NAME, rel)
+        return self._path_for(name)
+
+    def prefetch(self, keys):
+        """Decode the files behind `keys` (names or (name, (w, h))) in the background."""
+        for key in keys:
+            name, size = (key, None) if isinstance(key, str) else key
+            path = self._path_for(name, size)
+            if path is not None and path not in self._decoding and path not in self._decoded:
+                self._decoding[path] = preload.submit(pygame.image.load, path)
+
+    def pump(self):
+        """Convert finished background decodes to the display format; call from the main loop."""
+        for path in [p for p, fut in self._decoding.items() if fut.done()]:
+            fut = self._decoding.pop(path)
+            try:
+                surf = fut.result()
+            except Exception:
+                # _load reports the failure when the image is asked for
+                continue
+            try:
+                surf = surf.convert_alpha()
+            except pygame.error:
+                pass
+            self._decoded[path] = surf
+
+    def ready(self, name, size=None):
+        """False while a background decode needed for image(name)/scaled(name, size) is running."""
+        path = self._path_for(name, size)
+        return path is None or path not in self._decoding
+
+    def atlas(self):
+        """Return the current SpriteAtlas, loading the baked one on first use."""
+        if self._atlas is None and self._baked_atlas is not None:
+            entry, self._baked_atlas = self._baked_atlas, None
+            sheet = self._load(os.path.join(self.base, BAKED_DIR_NAME, entry['file']), True)
+            if sheet is not None:
+                rects = {key: pygame.Rect(r) for key, r in entry['sprites'].items()}
+                self._atlas = SpriteAtlas(sheet, rects)
+        return self._atlas
+
+    def ensure_atlas(self, keys):
+        """Make sure every (name, (w, h)) in `keys` is in the atlas; repack if not.
+
+        Missing assets are skipped. Returns the atlas (None if nothing to pack).
+        """
+        atlas = self.atlas()
+        wanted = [(name, (int(w), int(h))) for name, (w, h) in keys]
+        if atlas is not None and all(k in atlas or not self.exists(k[0]) for k in wanted):
+            return atlas
+        surfaces = {}
+        if atlas is not None:
+            for key in atlas.rects:
+                surfaces[key] = atlas.sprite(key).copy()
+        for key in wanted:
+            if key not in surfaces:
+                surf = self.scaled(*key)
+                if surf is not None:
+                    surfaces[key] = surf
+        if not surfaces:
+            return atlas
+        self._atlas = SpriteAtlas.from_surfaces(surfaces)
+        # hand out views into the new sheet from now on
+        for key in self._atlas.rects:
+            self._scaled.pop(key, None)
+        return self._atlas
+
+    def _store(self, key, surf):
+        self._scaled[key] = surf
+        while len(self._scaled) > self.max_scaled:
+            self._scaled.popitem(last=False)
+
+    def _drop_scaled(self, name):
+        for key in [k for k in self._scaled if k[0] == name]:
+            del self._scaled[key]
+
+    def clear(self):
+        self._images.clear()
+        self._scaled.clear()
+        self._missing.clear()
+        self._atlas = None
+        self._decoding.clear()
+        self._decoded.clear()
+
+
+_MANAGER = None
+
+
+def get_manager():
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = AssetManager()
+    return _MANAGER
+
+
+def image(name, alpha=True):
+    return get_manager().image(name, alpha=alpha)
+
+
+def exists(name):
+    return get_manager().exists(name)
+
+
+def size(name):
+    return get_manager().size(name)
+
+
+def first(*names):
+    return get_manager().first(*names)
+
+
+def scaled(name, size, alpha=True):
+    return get_manager().scaled(name, size, alpha=alpha)
+
+
+def register(name, surface):
+    get_manager().register(name, surface)
+
+
+def ensure_atlas(keys):
+    return get_manager().ensure_atlas(keys)
+
+
+def prefetch(keys):
+    get_manager().prefetch(keys)
+
+
+def pump():
+    get_manager().pump()
+
+
+def ready(name, size=None):
+    return get_manager().ready(name, size)
@@ -0,0 +1,69 @@
+# src/atlas.py
+# Sprite atlas: many small sprites packed into one surface, drawn by sub-rect
+
+import pygame
+
+
+def pack(surfaces, padding=1, max_width=512):
+    """Shelf-pack surfaces into one SRCALPHA surface.
+
+    `surfaces` maps key -> Surface. Returns (atlas_surface, {key: Rect}).
+    Sprites are placed tallest first, left to right, starting a new shelf when
+    a row would exceed max_width (or the widest sprite, if that is larger).
+    """
+    order = sorted(surfaces.items(), key=lambda kv: (-kv[1].get_height(), -kv[1].get_width()))
+    width = max([max_width] + [s.get_width() + padding * 2 for _, s in order])
+    rects = {}
+    x = y = padding
+    shelf_h = 0
+    for key, surf in order:
+        w, h = surf.get_size()
+        if x + w + padding > width:
+            x = padding
+            y += shelf_h + padding
+            shelf_h = 0
+        rects[key] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    height = max(1, y + shelf_h + padding)
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+    try:
+        sheet = sheet.convert_alpha()
+    except pygame.error:
+        pass
+    sheet.fill((0, 0, 0, 0))
+    for key, surf in order:
+        sheet.blit(surf, rects[key])
+    return sheet, rects
+
+
+class SpriteAtlas:
+    """One atlas surface plus a rect index keyed like the asset cache: (name, (w, h))."""
+
+    def __init__(self, surface, rects):
+        self.surface = surface
+        self.rects = dict(rects)
+
+    @classmethod
+    def from_surfaces(cls, surfaces, padding=1):
+        sheet, rects = pack(surfaces, padding=padding)
+        return cls(sheet, rects)
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def sprite(self, key):
+        """Return a subsurface view of `key` (shares pixels with the atlas)."""
+        return self.surface.subsurface(self.rects[key])
+
+    def blit(self, screen, key, pos):
+        return screen.blit(self.surface, pos, self.rects[key])
+
+    def blits(self, screen, items, doreturn=False):
+        """Draw many (key, pos) pairs with a single Surface.blits call.
+
+        Returns the list of screen rects drawn when doreturn is true.
+        """
+        sheet = self.surface
+        rects = self.rects
+        return screen.blits([(sheet, pos, rects[key]) for key, pos in items], doreturn=doreturn)
@@ -1,292 +1,351 @@
 from __future__ import annotations
+import hashlib
+import json
 import os
+import time
+
+# Bump whenever a render function below changes its output, so cached files
+# made by the old code are regenerated
+GENERATOR_VERSION = 3
+
+try:
+    from settings import AUDIO_CACHE_DIR
+except Exception:
+    AUDIO_CACHE_DIR = None
+try:
+    from settings import URGENT_BGM_SECONDS
+except Exception:
+    URGENT_BGM_SECONDS = 8.0
+# Generated audio lives here, named by cache key, listed in index.json
+CACHE_DIR = AUDIO_CACHE_DIR or os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '..', 'assets', 'cache', 'audio'))
+INDEX_NAME = 'index.json'
+INDEX_VERSION = 1
+
+# Inputs of the urgent BGM synthesis; any change gives a new cache key
+URGENT_BGM_PARAMS = {
+    'sample_rate': 44100,
+    'duration': float(URGENT_BGM_SECONDS),
+    'seed': 424242,
+    'arp_freqs': [220.0, 233.08, 196.0],
+    'arp_step': 0.25,
+    # arpeggio steps per phrase; each phrase gets its own note rotation
+    'arp_phrase': 16,
+    'hit_interval': 0.5,
+    'hit_duration': 0.10,
+    'reverb_delay': 0.03,
+}
+
+# Stereo variants derived from the mono BGM, built on first request
+URGENT_BGM_VARIANTS = {
+    # slight level offset, right channel a 2 ms delayed, attenuated copy
+    'punchy': {'delay': 0.002, 'left_gain': 1.0, 'right_gain': 0.92},
+    # right channel delayed 12 ms with a slow tremolo for groove
+    'rhythmic': {'delay': 0.012, 'left_gain': 0.98, 'tremolo_hz': 2.5},
+    # right channel ring-modulated, then high-passed by removing a moving average
+    'metallic_stereo': {'ring_hz': 880.0, 'highpass_window': 0.02, 'left_gain': 0.9},
+    # transient boost, tempo-synced tremolo and a detuned ping-pong right channel
+    'dynamic': {'delay': 0.01, 'tremolo_hz': 3.2, 'pan_hz': 0.25, 'detune': 0.9995},
+}
+
+
+def cache_key(generator: str, params: dict) -> str:
+    """Hash of (generator name, GENERATOR_VERSION, params) naming a cached file."""
+    blob = json.dumps({'generator': generator, 'version': GENERATOR_VERSION, 'params': params},
+                      sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:20]
+
+
+def file_digest(path: str) -> str:
+    """Content hash of a file (identifies a user-supplied base track)."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            h.update(block)
+    return h.hexdigest()[:20]
+
+
+class AudioCache:
+    """Content-addressed store of generated WAVs.
+
+    Files are named <generator>-<key>.wav; index.json records for each key
+    the generator, its parameters and the file size. An entry whose file is
+    missing or has a different size is rebuilt. When a generator gets a new
+    key its older files are deleted, so the directory holds one file per
+    generator/variant.
+    """
 
-def ensure_urgent_bgm(path: str) -> str:
-    if os.path.exists(path):
-        return path
-
-    parent = os.path.dirname(path)
-    if parent and not os.path.exists(parent):
+    def __init__(self, directory: str = CACHE_DIR):
+        self.dir = directory
+        self._index = None
+
+    def _index_path(self) -> str:
+        return os.path.join(self.dir, INDEX_NAME)
+
+    def index(self) -> dict:
+        if self._index is None:
+            try:
+                with open(self._index_path(), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._index = data.get('entries', {}) if data.get('version') == INDEX_VERSION else {}
+            except Exception:
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        tmp = self._index_path() + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'entries': self.index()}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp, self._index_path())
+
+    def lookup(self, key: str) -> str | None:
+        """Path of the cached file for `key`, or None if absent or damaged."""
+        entry = self.index().get(key)
+        if entry is None:
+            return None
+        path = os.path.join(self.dir, entry['file'])
         try:
-            os.makedirs(parent)
-        except Exception:
+            if os.path.getsize(path) == entry['bytes']:
+                return path
+        except OSError:
             pass
+        return None
 
-    try:
-        import numpy as np
-        import wave
+    def get(self, generator: str, params: dict, render) -> str:
+        """Return the cached file for (generator, params), calling render(path) to make it if needed.
 
-        sr = 44100
-        duration = 8.0
-        t = np.linspace(0.0, duration, int(sr * duration), endpoint=False)
-        rng = np.random.RandomState(424242)
-
-        # Bass envelope for smoothness
-        bass_env = 0.6 + 0.4 * np.sin(2 * np.pi * 0.05 * t)
-
-        # Sub and drone layers
-        sub = 0.35 * np.sin(2 * np.pi * 27.5 * t) * bass_env
-        drone = 0.55 * np.sin(2 * np.pi * 55.0 * t) * bass_env
-        drone += 0.18 * np.sin(2 * np.pi * 58.5 * t) * bass_env
-
-        # Pulse rhythm
-        pulse_base = np.sin(2 * np.pi * 2.8 * t)
-        pulse_env = (np.abs(np.sin(2 * np.pi * 2.8 * t)) ** 0.45)
-        pulse = 0.28 * pulse_base * pulse_env
-
-        # Arpeggiated dissonant tones
-        arp = np.zeros_like(t)
-        freqs = [220.0, 233.08, 196.0]
-        step_len = int(sr * 0.25)
-        for i in range(0, len(t), step_len):
-            idx = i
-            dur = min(step_len, len(t) - idx)
-            f = freqs[(i // step_len) % len(freqs)] * (1.0 + 0.02 * ((i // step_len) % 3))
-            arp[idx:idx + dur] += 0.09 * np.sin(2 * np.pi * f * t[idx:idx + dur]) * np.exp(-np.linspace(0, 3.0, dur))
-
-        # Combine base layers
-        signal = sub + drone + pulse + arp
-
-        # Add low harmony fill
-        low_harmony = 0.2 * np.sin(2 * np.pi * 85.0 * t) + 0.15 * np.sin(2 * np.pi * 95.0 * t)
-        signal += low_harmony * (np.sin(2 * np.pi * 0.2 * t) + 1.0) * 0.5
-
-        # Add kick and snare rhythm
-        kick = 0.3 * np.sin(2 * np.pi * 60 * t) * (np.sin(2 * np.pi * 1.0 * t) > 0).astype(float)
-        snare_env = (np.sin(2 * np.pi * 4.0 * t) > 0).astype(float)
-        snare = 0.15 * rng.randn(len(t)) * snare_env
-        signal += kick + snare
-
-        # Metallic hits
-        hit_interval = 0.5
-        hit_dur = 0.10
-        for offset in [0.0, 0.25]:
-            for beat in np.arange(offset, duration, hit_interval):
-                start = int(beat * sr)
-                end = min(len(t), start + int(hit_dur * sr))
-                if start >= len(t):
-                    break
-                burst = rng.randn(end - start) * np.exp(-np.linspace(0.0, 5.0, end - start))
-                carrier = np.sin(2 * np.pi * 900.0 * t[start:end])
-                metal = (burst * carrier) * (1.0 + 0.3 * np.sin(2 * np.pi * 60.0 * t[start:end]))
-                signal[start:end] += metal * 1.2
-
-        # High-frequency shimmer
-        hf = 0.08 * (rng.randn(len(t)) * 0.4) * (np.sin(2 * np.pi * 0.15 * t) + 1.0)
-        signal += hf
-
-        # Harmonic synth layer
-        harmony = 0.1 * np.sin(2 * np.pi * 330.0 * t) + 0.08 * np.sin(2 * np.pi * 440.0 * t)
-        signal += harmony * (np.sin(2 * np.pi * 0.5 * t) + 1.0) * 0.5
-
-        # Volume envelope
-        volume_env = 0.85 + 0.15 * np.sin(2 * np.pi * 0.1 * t)
-        signal *= volume_env
-
-        # Low-frequency reverb (delay)
-        delay = int(sr * 0.03)
-        reverb = np.zeros_like(signal)
-        reverb[delay:] = signal[:-delay] * 0.3
-        signal += reverb
-
-        # Smoothing with Hanning window
-        try:
-            kernel = np.hanning(32)
-            kernel /= kernel.sum()
-            signal = np.convolve(signal, kernel, mode='same')
-        except Exception:
-            pass
+        render writes a WAV to the path it is given; it is written to a
+        temporary name first so an interrupted run never leaves a partial file.
+        """
+        key = cache_key(generator, params)
+        path = self.lookup(key)
+        if path is not None:
+            return path
+        os.makedirs(self.dir, exist_ok=True)
+        name = f"{generator}-{key}.wav"
+        path = os.path.join(self.dir, name)
+        tmp = path + '.tmp'
+        render(tmp)
+        os.replace(tmp, path)
+        index = self.index()
+        # drop older files of the same generator
+        for old_key, entry in list(index.items()):
+            if entry.get('generator') == generator and old_key != key:
+                try:
+                    os.remove(os.path.join(self.dir, entry['file']))
+                except OSError:
+                    pass
+                del index[old_key]
+        index[key] = {
+            'generator': generator,
+            'file': name,
+            'params': params,
+            'bytes': os.path.getsize(path),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        self._save_index()
+        return path
 
-        # Stereo-like detune
-        try:
-            detune = 0.997
-            signal += 0.06 * np.sin(2 * np.pi * 55.0 * t * detune)
-        except Exception:
-            pass
 
-        # Normalize and convert to PCM
-        maxv = np.max(np.abs(signal))
-        norm = signal if maxv < 1e-9 else signal / maxv * 0.95
-        pcm = (norm * 32767.0).astype(np.int16)
+_CACHE = None
+
+
+def get_cache() -> AudioCache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = AudioCache()
+    return _CACHE
+
 
+def ensure_urgent_bgm(path: str | None = None) -> str:
+    """Return a WAV of the urgent BGM, synthesizing it only if it isn't cached yet.
+
+    `path` is the legacy location (assets/sounds/urgent_bgm.wav): a file there
+    is used as is, so a hand-made track can replace the synthesized one.
+    Otherwise the track comes from the audio cache, keyed by
+    URGENT_BGM_PARAMS. Without numpy a few seconds of silence are returned
+    (not cached, so the real track is made once numpy is available).
+    """
+    if path and os.path.exists(path):
+        return path
+    try:
+        import numpy  # noqa: F401
+        return get_cache().get('urgent_bgm', URGENT_BGM_PARAMS,
+                               lambda out: _render_urgent_bgm(out, URGENT_BGM_PARAMS))
+    except Exception:
+        return _write_silence(os.path.join(CACHE_DIR, 'urgent_bgm_silent.wav'))
+
+
+def _write_silence(path: str) -> str:
+    try:
+        import wave
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sr = 22050
+        frames = b'\x00\x00' * (sr * 4)
         with wave.open(path, 'wb') as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(sr)
-            wf.writeframes(pcm.tobytes())
-        return path
-
+            wf.writeframes(frames)
     except Exception:
-        try:
-            import wave
-            sr = 22050
-            frames = b'\x00\x00' * (sr * 4)
-            with wave.open(path, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(sr)
-                wf.writeframes(frames)
-            return path
-        except Exception:
-            return path
+        pass
+    return path
+
 
+def _render_urgent_bgm(path: str, params: dict) -> None:
+    # streamed block by block (synth.py), so long tracks cost no extra memory
+    import synth
+    synth.render_wav(path, params)
 
-def ensure_urgent_bgm_variants(base_mono_path: str) -> list[str]:
-    """Create multiple variations from the mono urgent BGM.
 
-    This function ensures the mono base exists (calling `ensure_urgent_bgm`),
-    then produces three variants in the same directory:
-      - urgent_bgm_punchy.wav       (stereo subtle widen, slightly louder left)
-      - urgent_bgm_rhythmic.wav     (stereo with a delayed right channel giving groove)
-      - urgent_bgm_metallic_stereo.wav (stereo with ring-modulated right for industrial sheen)
+def urgent_bgm_variant(kind: str, base_mono_path: str | None = None) -> str:
+    """Return the cached stereo variant `kind` (see URGENT_BGM_VARIANTS), building it on first request.
 
-    Returns list of created file paths (may include the base mono path).
+    The variant's key covers the base track (its cache key, or the content
+    hash of a user-supplied base) and the variant parameters, so changing
+    either rebuilds it. Raises if the variant can't be made.
     """
-    created = []
-    try:
-        # ensure base mono exists
-        base = ensure_urgent_bgm(base_mono_path)
-        created.append(base)
-        import wave
-        import numpy as _np
-
-        # read mono PCM
-        with wave.open(base, 'rb') as wf:
-            nch = wf.getnchannels()
-            sampw = wf.getsampwidth()
-            sr = wf.getframerate()
-            frames = wf.readframes(wf.getnframes())
-        if sampw != 2:
-            # unexpected sample width; skip variant generation
-            return created
-        mono = _np.frombuffer(frames, dtype=_np.int16).astype(_np.float32) / 32767.0
-
-        # helper to write stereo wav from two float32 channels (-1..1)
-        def write_stereo(path, left, right, sr=sr):
-            # clamp
-            L = _np.clip(left, -1.0, 1.0)
-            R = _np.clip(right, -1.0, 1.0)
-            interleaved = _np.empty((L.size + R.size,), dtype=_np.int16)
-            # convert to int16 and interleave
-            Li = (L * 32767.0).astype(_np.int16)
-            Ri = (R * 32767.0).astype(_np.int16)
-            interleaved[0::2] = Li
-            interleaved[1::2] = Ri
-            with wave.open(path, 'wb') as wf:
-                wf.setnchannels(2)
-                wf.setsampwidth(2)
-                wf.setframerate(sr)
-                wf.writeframes(interleaved.tobytes())
-
-        # Variant 1: punchy widen (slight level offset and tiny detune via resample shift)
-        # right channel is a slightly delayed/attenuated copy
-        delay_samples = int(0.002 * sr)  # 2ms
-        right = _np.concatenate((_np.zeros(delay_samples), mono[:-delay_samples])) * 0.92
-        left = mono * 1.0
-        p_path = base.replace('.wav', '_punchy.wav')
-        write_stereo(p_path, left, right)
-        created.append(p_path)
-
-        # Variant 2: rhythmic (right channel delayed and amplitude-modulated)
-        delay_samples = int(0.012 * sr)  # 12ms
-        right = _np.concatenate((_np.zeros(delay_samples), mono[:-delay_samples]))
+    params = URGENT_BGM_VARIANTS[kind]
+    base = ensure_urgent_bgm(base_mono_path)
+    if base_mono_path and base == base_mono_path:
+        base_id = file_digest(base)
+    else:
+        base_id = cache_key('urgent_bgm', URGENT_BGM_PARAMS)
+    return get_cache().get(f'urgent_bgm_{kind}', dict(params, base=base_id),
+                           lambda out: _render_variant(kind, base, out, params))
+
+
+def _read_mono(path: str):
+    import wave
+    import numpy as _np
+    with wave.open(path, 'rb') as wf:
+        sampw = wf.getsampwidth()
+        sr = wf.getframerate()
+        frames = wf.readframes(wf.getnframes())
+    if sampw != 2:
+        raise ValueError(f"{path}: expected 16-bit samples, got {sampw * 8}-bit")
+    mono = _np.frombuffer(frames, dtype=_np.int16).astype(_np.float32)
+    mono /= 32767.0
+    return mono, sr
+
+
+def _write_stereo(path: str, left, right, sr: int) -> None:
+    import wave
+    import dsp
+    # clips and scales left/right in place
+    frames = dsp.interleave_pcm16(left, right)
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(sr)
+        wf.writeframes(frames.tobytes())
+
+
+def _render_variant(kind: str, base: str, path: str, p: dict) -> None:
+    import numpy as _np
+    import dsp
+    mono, sr = _read_mono(base)
+    n = len(mono)
+    # every stage writes into these float32 buffers instead of allocating temporaries
+    left, right, tmp = (_np.empty(n, dtype=_np.float32) for _ in range(3))
+
+    if kind == 'punchy':
+        dsp.delay(mono, int(p['delay'] * sr), right)
+        right *= p['right_gain']
+        _np.multiply(mono, p['left_gain'], out=left)
+    elif kind == 'rhythmic':
+        dsp.delay(mono, int(p['delay'] * sr), right)
         # apply slow tremolo on right channel to add groove
-        trem = 0.85 + 0.25 * _np.sin(2 * _np.pi * 2.5 * _np.arange(len(right)) / sr)
-        right = right * trem
-        left = mono * 0.98
-        r_path = base.replace('.wav', '_rhythmic.wav')
-        write_stereo(r_path, left, right)
-        created.append(r_path)
-
-        # Variant 3: metallic_stereo (right is ring-modulated + highpass-ish)
-        # ring modulation: multiply by a sine at ~900Hz; then slightly high-pass
-        carrier = _np.sin(2 * _np.pi * 880.0 * _np.arange(len(mono)) / sr)
-        right = mono * carrier * 0.9
-        # simple high-pass by subtracting a low-moving-average
-        window = int(sr * 0.02)
-        if window < 1:
-            window = 1
-        try:
-            avg = _np.convolve(right, _np.ones(window) / window, mode='same')
-            right = right - 0.6 * avg
-        except Exception:
-            pass
-        left = mono * 0.9
-        m_path = base.replace('.wav', '_metallic_stereo.wav')
-        write_stereo(m_path, left, right)
-        created.append(m_path)
+        right *= dsp.lfo(tmp, p['tremolo_hz'], sr, 0.85, 0.25)
+        _np.multiply(mono, p['left_gain'], out=left)
+    elif kind == 'metallic_stereo':
+        # ring modulation, then a slight high-pass
+        _np.multiply(mono, dsp.sine(tmp, p['ring_hz'], sr), out=right)
+        right *= 0.9
+        # simple high-pass by subtracting a low moving average
+        dsp.moving_average(right, int(sr * p['highpass_window']), tmp)
+        tmp *= 0.6
+        right -= tmp
+        _np.multiply(mono, p['left_gain'], out=left)
+    elif kind == 'dynamic':
+        # stronger transient emphasis using short-time novelty (derivative of abs)
+        _np.abs(mono, out=tmp)
+        smooth = dsp.moving_average(tmp, 256, _np.empty(n, dtype=_np.float32))
+        t_env = tmp
+        t_env[0] = 0.0
+        _np.subtract(smooth[1:], smooth[:-1], out=t_env[1:])
+        _np.maximum(t_env, 0.0, out=t_env)
+        # transient boost envelope (normalized): 1 + 4 * novelty / max
+        top = float(t_env.max()) if n else 0.0
+        if top > 1e-9:
+            t_env *= 4.0 / top
+            t_env += 1.0
+        else:
+            t_env.fill(1.0)
+        # rhythmic gating: a tempo-synced tremolo for extra groove
+        trem = dsp.lfo(smooth, p['tremolo_hz'], sr, 0.7, 0.6, rectify=True)
+        # left = mono * 0.9 * trem * (0.8 + 0.5 * t_env)
+        _np.multiply(t_env, 0.5, out=left)
+        left += 0.8
+        left *= trem
+        left *= mono
+        left *= 0.9
+        # right channel: delayed, slightly detuned with ping-pong panning LFO
+        dsp.delay(mono, int(p['delay'] * sr), right)
+        positions = _np.arange(n, dtype=_np.float64)
+        right[:] = _np.interp(positions * p['detune'], positions, right)
+        del positions
+        t_env *= 0.6
+        t_env += 0.7
+        right *= t_env
+        right *= trem
+        right *= 0.85
+        # pan gain 0.6 + 0.8 * (0.5 + 0.5 * sin) = 1.0 + 0.4 * sin
+        right *= dsp.lfo(tmp, p['pan_hz'], sr, 1.0, 0.4)
+        # subtle stereo widening: add inverse-phase small band to each channel
+        hf = dsp.fir(mono, (1.0, -0.5, 0.25), smooth)
+        hf *= 0.04
+        left += hf
+        right -= hf
+        dsp.normalize((left, right), 0.95)
+    else:
+        raise ValueError(f"unknown urgent BGM variant {kind!r}")
+    _write_stereo(path, left, right, sr)
+
+
+def ensure_urgent_bgm_variants(base_mono_path: str | None = None) -> list[str]:
+    """Return the mono urgent BGM plus its punchy, rhythmic and metallic_stereo variants.
+
+      - punchy:          stereo subtle widen, slightly louder left
+      - rhythmic:        stereo with a delayed right channel giving groove
+      - metallic_stereo: stereo with ring-modulated right for industrial sheen
 
+    Each comes from the audio cache and is built only the first time. Returns
+    the paths available (may be just the base if a variant fails).
+    """
+    created = []
+    try:
+        created.append(ensure_urgent_bgm(base_mono_path))
+        for kind in ('punchy', 'rhythmic', 'metallic_stereo'):
+            created.append(urgent_bgm_variant(kind, base_mono_path))
     except Exception:
         # if anything fails, just return whatever we managed to create
         return created
     return created
 
 
-def ensure_urgent_bgm_dynamic(base_mono_path: str) -> str:
-    """Create a more 'dynamic' stereo variant emphasizing transients and movement.
+def ensure_urgent_bgm_dynamic(base_mono_path: str | None = None) -> str:
+    """Return the 'dynamic' stereo variant emphasizing transients and movement.
 
-    Returns the path to the created dynamic file or the base if creation failed.
+    Returns the base track if the variant can't be made.
     """
     try:
-        base = ensure_urgent_bgm(base_mono_path)
-        import wave
-        import numpy as _np
-
-        with wave.open(base, 'rb') as wf:
-            sampw = wf.getsampwidth()
-            sr = wf.getframerate()
-            frames = wf.readframes(wf.getnframes())
-        if sampw != 2:
-            return base
-        mono = _np.frombuffer(frames, dtype=_np.int16).astype(_np.float32) / 32767.0
-
-        # create stronger transient emphasis using short-time novelty (derivative of abs)
-        abs_sig = _np.abs(mono)
-        # novelty proxy: derivative of smoothed absolute
-        smooth = _np.convolve(abs_sig, _np.ones(256) / 256.0, mode='same')
-        novelty = _np.clip(_np.concatenate(([0.0], _np.diff(smooth))), 0.0, None)
-        # transient boost envelope (normalized)
-        if novelty.max() > 1e-9:
-            t_env = 1.0 + 4.0 * (novelty / novelty.max())
-        else:
-            t_env = 1.0
-
-        # rhythmic gating: create a tempo-synced tremolo (3.2Hz) for extra groove
-        trem = 0.7 + 0.6 * _np.abs(_np.sin(2 * _np.pi * 3.2 * _np.arange(len(mono)) / sr))
-
-        # apply transient boost and tremolo to emphasize movement
-        left = mono * (0.9 * trem * (0.8 + 0.5 * t_env))
+        return urgent_bgm_variant('dynamic', base_mono_path)
+    except Exception:
+        return ensure_urgent_bgm(base_mono_path)
 
-        # right channel: delayed, slightly detuned with ping-pong panning LFO
-        delay = int(0.01 * sr)  # 10ms
-        right_base = _np.concatenate((_np.zeros(delay), mono[:-delay]))
-        detune = 0.9995
-        right_detuned = _np.interp(_np.arange(0, len(right_base)) * detune, _np.arange(len(right_base)), right_base)
-        pan_lfo = 0.5 + 0.5 * _np.sin(2 * _np.pi * 0.25 * _np.arange(len(mono)) / sr)
-        right = right_detuned * (0.85 * trem * (0.7 + 0.6 * t_env)) * (0.6 + 0.8 * pan_lfo)
 
-        # subtle stereo widening: add inverse-phase small band to each channel
-        hf = _np.convolve(mono, _np.array([1, -0.5, 0.25]), mode='same') * 0.04
-        left = left + hf
-        right = right - hf
-
-        # normalize channels
-        peak = max(_np.max(_np.abs(left)), _np.max(_np.abs(right)), 1e-9)
-        left = left / peak * 0.95
-        right = right / peak * 0.95
-
-        # write stereo file
-        dyn_path = base.replace('.wav', '_dynamic.wav')
-        interleaved = _np.empty((left.size + right.size,), dtype=_np.int16)
-        Li = (left * 32767.0).astype(_np.int16)
-        Ri = (right * 32767.0).astype(_np.int16)
-        interleaved[0::2] = Li
-        interleaved[1::2] = Ri
-        with wave.open(dyn_path, 'wb') as wf:
-            wf.setnchannels(2)
-            wf.setsampwidth(2)
-            wf.setframerate(sr)
-            wf.writeframes(interleaved.tobytes())
-        return dyn_path
-    except Exception:
-        return base_mono_path
+def warm_cache() -> list[str]:
+    """Synthesize the base BGM into the cache ahead of time (tools/bake_assets.py)."""
+    return [ensure_urgent_bgm()]
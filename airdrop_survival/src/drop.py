@@ -3,43 +3,55 @@
 import pygame
 import random
 import os
-from settings import WIDTH, DROP_SIZE, DROP_TYPES, DROP_WEIGHTS, DROP_BASE_SPEED_MIN, DROP_BASE_SPEED_MAX, DROP_SPEED_INCREASE_PER_MIN, BOMB_SPEED_MULTIPLIER, DROP_TIME_SCALE_START, DROP_TIME_SCALE_RAMP_SEC, DROP_TIME_STAGE1_SEC, DROP_TIME_STAGE1_SCALE
-from settings import USE_PER_TYPE_SPEED_MULTIPLIERS, COIN_SPEED_MULTIPLIER, HEALTH_SPEED_MULTIPLIER
+import itertools
+import assets
+from settings import WIDTH, DROP_SIZE, DROP_TYPES, DROP_WEIGHTS, DROP_BASE_SPEED_MIN, DROP_BASE_SPEED_MAX
+from speed_curve import SpeedCurve
+from soundbank import SoundBank
 
-# Module-level image cache
-_IMG_BOMB = None
-_IMG_COIN = None
-_IMG_HEALTH = None
+# Sound effects (loaded by init_sounds into a SoundBank)
+_BANK = None
+
+_SOUNDS_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds')
+# name -> (channel group, volume, max concurrent voices)
+_SOUND_SPECS = {
+    'coin_pickup': ('pickup', 0.7, 3),
+    'heal_pickup': ('pickup', 0.8, 2),
+    'bomb_explosion': ('hazard', 1.0, 2),
+}
+_SOUND_NAMES = tuple(_SOUND_SPECS)
+
+
+def _sound_file(name):
+    """assets/sounds/<name>.wav, else .mp3; None if neither exists."""
+    for ext in ('.wav', '.mp3'):
+        p = os.path.join(_SOUNDS_DIR, name + ext)
+        if os.path.exists(p):
+            return p
+    return None
+
+
+def sound_paths():
+    """Files init_sounds() will load (for preload.prefetch_sounds)."""
+    return [p for p in (_sound_file(n) for n in _SOUND_NAMES) if p]
 
-# Module-level sound cache (initialized by init_sounds)
-_COIN_SOUND = None
-_BOMB_SOUND = None
-_HEAL_SOUND = None
-_SUCCESS_SOUND = None
-_FAIL_SOUND = None
 
 def init_sounds():
-    """Initialize pygame mixer and load pickup/explosion sounds from assets/sounds/"""
-    global _COIN_SOUND, _BOMB_SOUND, _HEAL_SOUND
+    """Initialize pygame mixer and preload pickup/explosion sounds from assets/sounds/
+
+    The bank is built once per mixer session; later calls (every new Game)
+    return the existing one.
+    """
+    global _BANK
     try:
         if not pygame.mixer.get_init():
             pygame.mixer.init()
     except Exception:
         pass
-    base = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds')
-    def _load(name, vol=0.8):
-        wav = os.path.join(base, name + '.wav')
-        mp3 = os.path.join(base, name + '.mp3')
-        for p in (wav, mp3):
-            if os.path.exists(p):
-                try:
-                    s = pygame.mixer.Sound(p)
-                    s.set_volume(vol)
-                    print(f"drop: loaded sound {p}")
-                    return s
-                except Exception:
-                    print(f"drop: failed to load sound {p}")
+    if not pygame.mixer.get_init():
         return None
+    if _BANK is not None and not _BANK.closed:
+        return _BANK
 
     # apply global volume/mute from settings if available
     try:
@@ -51,154 +63,263 @@ def init_sounds():
     def _vol(v):
         return 0.0 if SOUND_MUTED else max(0.0, min(1.0, float(v) * float(SOUND_VOLUME)))
 
-    _COIN_SOUND = _load('coin_pickup', vol=_vol(0.7))
-    _BOMB_SOUND = _load('bomb_explosion', vol=_vol(1.0))
-    _HEAL_SOUND = _load('heal_pickup', vol=_vol(0.8))
-    # optional level sounds
-    _SUCCESS_SOUND = _load('success', vol=_vol(0.9))
-    _FAIL_SOUND = _load('failure', vol=_vol(0.9))
+    bank = SoundBank()
+    for name, (group, vol, voices) in _SOUND_SPECS.items():
+        p = _sound_file(name)
+        if p is None:
+            continue
+        # decoded in the background if the intro prefetched it
+        if bank.load(name, p, group, volume=_vol(vol), max_voices=voices):
+            print(f"drop: loaded sound {p}")
+        else:
+            print(f"drop: failed to load sound {p}")
+    _BANK = bank
+    return bank
 
-def play_coin():
+
+def _forget_bank():
+    # the bank's Sounds and channels belong to the mixer being shut down
+    global _BANK
+    if _BANK is not None:
+        try:
+            _BANK.close()
+        except Exception:
+            pass
+        _BANK = None
+
+
+pygame.register_quit(_forget_bank)
+
+
+def sound_bank():
+    """The SoundBank built by init_sounds(), or None without audio."""
+    return _BANK
+
+
+def _play(name):
     try:
-        if _COIN_SOUND:
-            _COIN_SOUND.play()
+        if _BANK is not None:
+            _BANK.play(name)
     except Exception:
         pass
 
+
+def play_coin():
+    _play('coin_pickup')
+
+
 def play_bomb():
-    try:
-        if _BOMB_SOUND:
-            _BOMB_SOUND.play()
-    except Exception:
-        pass
+    _play('bomb_explosion')
+
 
 def play_heal():
+    _play('heal_pickup')
+
+
+def _play_music(name):
+    # the level ending tunes are music tracks (music.py), crossfaded from the BGM
     try:
-        if _HEAL_SOUND:
-            _HEAL_SOUND.play()
+        import music
+        manager = music.get_manager()
+        if manager is not None:
+            manager.transition_to(name, loop=False)
     except Exception:
         pass
 
+
 def play_success():
-    try:
-        if _SUCCESS_SOUND:
-            _SUCCESS_SOUND.play()
-    except Exception:
-        pass
+    _play_music('success')
 
 
 def play_failure():
-    try:
-        if _FAIL_SOUND:
-            _FAIL_SOUND.play()
-    except Exception:
-        pass
+    _play_music('failure')
 
-def _load_images():
-    global _IMG_BOMB, _IMG_COIN, _IMG_HEALTH
-    base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-    base = os.path.normpath(base)
-    try:
-        p = os.path.join(base, 'bomb.png')
-        print(f"drop: loading bomb image from {p}")
-        _IMG_BOMB = pygame.image.load(p).convert_alpha()
-    except Exception:
-        import traceback
-        print(f"drop: failed loading bomb image from {p}")
-        traceback.print_exc()
-        _IMG_BOMB = None
-    try:
-        p = os.path.join(base, 'coin.png')
-        print(f"drop: loading coin image from {p}")
-        _IMG_COIN = pygame.image.load(p).convert_alpha()
-    except Exception:
-        import traceback
-        print(f"drop: failed loading coin image from {p}")
-        traceback.print_exc()
-        _IMG_COIN = None
+
+# Image used for each drop type (drawn at DROP_SIZE via the shared asset cache)
+_TYPE_IMAGES = {
+    'bomb': 'bomb.png',
+    'coin': 'coin.png',
+    'health_pack': 'health_pack.png',
+}
+
+
+def atlas_keys():
+    """Sprite keys (name, size) the drops draw with, for packing into the atlas."""
+    return [(name, (DROP_SIZE, DROP_SIZE)) for name in _TYPE_IMAGES.values()]
+
+
+def draw_drops(screen, drops, alpha=1.0):
+    """Draw all drops; those whose sprite is in the atlas go out in one blits call.
+
+    `alpha` interpolates each drop between its previous and current step.
+    Returns the list of screen rects drawn.
+    """
+    atlas = assets.get_manager().atlas()
+    keys = {t: (name, (DROP_SIZE, DROP_SIZE)) for t, name in _TYPE_IMAGES.items()}
+    fallback = keys['health_pack']
+    items = []
+    drawn = []
+    if hasattr(drops, 'snapshot'):
+        entries = drops.snapshot(alpha)
+    else:
+        entries = [(drop.type, drop.x, drop.draw_y(alpha)) for drop in drops]
+    for drop_type, x, y in entries:
+        key = keys.get(drop_type, fallback)
+        if atlas is not None and key in atlas:
+            items.append((key, (x, y)))
+        else:
+            drawn.append(_draw_one(screen, drop_type, x, y))
+    if items:
+        drawn.extend(atlas.blits(screen, items, doreturn=True))
+    return drawn
+
+
+def _draw_one(screen, drop_type, x, y):
+    # the asset cache hands the image out already at DROP_SIZE
+    img = assets.scaled(_TYPE_IMAGES.get(drop_type, 'health_pack.png'), (DROP_SIZE, DROP_SIZE))
+    if img:
+        return screen.blit(img, (x, y))
+    # Fallback: draw a simple circle if image missing
+    color = (200, 0, 0) if drop_type == "bomb" else (212, 175, 55) if drop_type == "coin" else (0, 200, 0)
+    return pygame.draw.circle(screen, color, (int(x) + DROP_SIZE // 2, int(y) + DROP_SIZE // 2), DROP_SIZE // 2)
+
+
+def new_drop_store():
+    """Empty drop container for Game, chosen by settings.DROP_ENGINE.
+
+    'numpy' gives a drop_arrays.DropArrays (falls back to a list if NumPy is
+    missing); anything else a plain list of Drop objects.
+    """
     try:
-        p = os.path.join(base, 'health_pack.png')
-        print(f"drop: loading health image from {p}")
-        _IMG_HEALTH = pygame.image.load(p).convert_alpha()
+        from settings import DROP_ENGINE
     except Exception:
-        import traceback
-        print(f"drop: failed loading health image from {p}")
-        traceback.print_exc()
-        _IMG_HEALTH = None
+        DROP_ENGINE = 'objects'
+    if DROP_ENGINE == 'numpy':
+        try:
+            from drop_arrays import DropArrays
+            return DropArrays()
+        except ImportError as e:
+            print(f"drop: numpy drop engine unavailable ({e}), using Drop objects")
+    return []
+
+
+# Free list of Drop objects removed from play, reused by spawn_drop()
+_POOL = []
+
+
+def spawn_drop(drops, elapsed_seconds=0, level_speed_multiplier=1.0, curve=None):
+    """Roll a new drop and add it to `drops` (a list or a DropArrays)."""
+    if isinstance(drops, list):
+        if _POOL:
+            drop = _POOL.pop()
+            drop.reset(elapsed_seconds, level_speed_multiplier, curve)
+        else:
+            drop = Drop(elapsed_seconds, level_speed_multiplier, curve)
+        drops.append(drop)
+    else:
+        drops.spawn(*sample_drop(elapsed_seconds, level_speed_multiplier, curve))
+
+
+def step_drops(drops, player_rect, bottom):
+    """Move every drop one step; remove and return the types caught by `player_rect`.
+
+    Drops falling past `bottom` are removed as well. The returned types are in
+    the store's order, so callers can apply pickups one by one. Removal from a
+    list is swap-and-pop (order is not preserved) and recycles the Drop.
+    """
+    if not isinstance(drops, list):
+        return drops.step(player_rect, bottom)
+    picked = []
+    gone = None
+    for i, drop in enumerate(drops):
+        drop.update()
+        if drop.rect.colliderect(player_rect):
+            picked.append(drop.type)
+        elif drop.y <= bottom:
+            continue
+        if gone is None:
+            gone = []
+        gone.append(i)
+    if gone:
+        # swap-and-pop from the highest index down, so the drop moved into a
+        # freed slot is never one that is itself being removed
+        for i in reversed(gone):
+            drop = drops[i]
+            last = drops.pop()
+            if i < len(drops):
+                drops[i] = last
+            _POOL.append(drop)
+    return picked
+
+
+def clear_drops(drops):
+    """Remove every drop (recycling Drop objects into the pool)."""
+    if isinstance(drops, list):
+        _POOL.extend(drops)
+    drops.clear()
+
+
+# Cumulative DROP_WEIGHTS for random.choices (same draw as weights=, without re-summing)
+try:
+    _CUM_WEIGHTS = list(itertools.accumulate(DROP_WEIGHTS))
+    if len(_CUM_WEIGHTS) != len(DROP_TYPES):
+        _CUM_WEIGHTS = None
+except Exception:
+    _CUM_WEIGHTS = None
+
+# SpeedCurve per level multiplier, for callers that don't pass their own
+_CURVES = {}
+
+
+def speed_curve(level_speed_multiplier=1.0):
+    """Shared SpeedCurve for `level_speed_multiplier` (compiled on first use)."""
+    key = float(level_speed_multiplier)
+    curve = _CURVES.get(key)
+    if curve is None:
+        curve = _CURVES[key] = SpeedCurve(key)
+    return curve
+
+
+def sample_drop(elapsed_seconds=0, level_speed_multiplier=1.0, curve=None):
+    """Roll a new drop: returns (x, speed, type) for a spawn at `elapsed_seconds`.
+
+    `curve` is the level's compiled SpeedCurve (looked up from
+    level_speed_multiplier if omitted).
+    """
+    if curve is None:
+        curve = speed_curve(level_speed_multiplier)
+    x = random.randint(0, WIDTH - DROP_SIZE)
+    base = random.uniform(DROP_BASE_SPEED_MIN, DROP_BASE_SPEED_MAX)
+    if _CUM_WEIGHTS is not None:
+        drop_type = random.choices(DROP_TYPES, cum_weights=_CUM_WEIGHTS, k=1)[0]
+    else:
+        drop_type = random.choice(DROP_TYPES)
+    return x, curve.speed(elapsed_seconds, drop_type, base), drop_type
 
 
 class Drop:
-    def __init__(self, elapsed_seconds=0, level_speed_multiplier=1.0):
-        if _IMG_BOMB is None and _IMG_COIN is None and _IMG_HEALTH is None:
-            _load_images()
+    __slots__ = ('x', 'y', 'prev_y', 'speed', 'type', 'rect')
+
+    def __init__(self, elapsed_seconds=0, level_speed_multiplier=1.0, curve=None):
+        self.rect = pygame.Rect(0, 0, DROP_SIZE, DROP_SIZE)
+        self.reset(elapsed_seconds, level_speed_multiplier, curve)
 
-        self.x = random.randint(0, WIDTH - DROP_SIZE)
+    def reset(self, elapsed_seconds=0, level_speed_multiplier=1.0, curve=None):
+        """Re-roll this drop as a fresh spawn at the top of the screen (for pooling)."""
+        self.x, self.speed, self.type = sample_drop(elapsed_seconds, level_speed_multiplier, curve)
         self.y = 0
-        # base speed random in range, then increase with elapsed minutes
-        base = random.uniform(DROP_BASE_SPEED_MIN, DROP_BASE_SPEED_MAX)
-        increase = (elapsed_seconds / 60.0) * DROP_SPEED_INCREASE_PER_MIN
-        # apply time-scaling: start slightly slower, ramp to 1.0 by DROP_TIME_SCALE_RAMP_SEC
-        time_scale = 1.0
-        try:
-            # piecewise: stage1 constant scale, then ramp from stage1_scale -> DROP_TIME_SCALE_START -> 1.0
-            if elapsed_seconds <= DROP_TIME_STAGE1_SEC:
-                time_scale = DROP_TIME_STAGE1_SCALE
-            else:
-                # after stage1, interpolate between DROP_TIME_SCALE_START and 1.0 over remaining ramp
-                if DROP_TIME_SCALE_RAMP_SEC > DROP_TIME_STAGE1_SEC:
-                    t_after = max(0.0, elapsed_seconds - DROP_TIME_STAGE1_SEC)
-                    ramp_duration = float(DROP_TIME_SCALE_RAMP_SEC - DROP_TIME_STAGE1_SEC)
-                    frac_t = min(1.0, t_after / ramp_duration) if ramp_duration > 0 else 1.0
-                    time_scale = DROP_TIME_SCALE_START + (1.0 - DROP_TIME_SCALE_START) * frac_t
-                else:
-                    time_scale = 1.0
-        except Exception:
-            time_scale = 1.0
-        self.speed = (base + increase) * time_scale
-        try:
-            # use weighted random choices if weights are provided
-            self.type = random.choices(DROP_TYPES, weights=DROP_WEIGHTS, k=1)[0]
-        except Exception:
-            self.type = random.choice(DROP_TYPES)
-        # apply configured multipliers: either per-type or a single global multiplier
-        try:
-            if USE_PER_TYPE_SPEED_MULTIPLIERS:
-                if self.type == 'coin':
-                    self.speed *= COIN_SPEED_MULTIPLIER
-                elif self.type == 'health_pack':
-                    self.speed *= HEALTH_SPEED_MULTIPLIER
-                else:
-                    self.speed *= BOMB_SPEED_MULTIPLIER
-            else:
-                # legacy: apply single bomb multiplier to all
-                self.speed *= BOMB_SPEED_MULTIPLIER
-        except Exception:
-            pass
-        # apply per-level multiplier last so it scales the final speed
-        try:
-            self.speed *= float(level_speed_multiplier)
-        except Exception:
-            pass
-        self.rect = pygame.Rect(self.x, self.y, DROP_SIZE, DROP_SIZE)
+        # y at the previous simulation step, for interpolated drawing
+        self.prev_y = 0
+        self.rect.topleft = (self.x, 0)
 
     def update(self):
+        self.prev_y = self.y
         self.y += self.speed
         self.rect.y = self.y
 
-    def draw(self, screen):
-        # Choose image based on type and blit scaled to DROP_SIZE
-        img = None
-        if self.type == "bomb":
-            img = _IMG_BOMB
-        elif self.type == "coin":
-            img = _IMG_COIN
-        else:
-            img = _IMG_HEALTH
+    def draw_y(self, alpha=1.0):
+        """y to draw at, `alpha` of the way from the previous step to the current one."""
+        return self.prev_y + (self.y - self.prev_y) * alpha
 
-        if img:
-            surf = pygame.transform.smoothscale(img, (DROP_SIZE, DROP_SIZE))
-            screen.blit(surf, (self.x, self.y))
-        else:
-            # Fallback: draw a simple circle if image missing
-            color = (200, 0, 0) if self.type == "bomb" else (212, 175, 55) if self.type == "coin" else (0, 200, 0)
-            pygame.draw.circle(screen, color, self.rect.center, DROP_SIZE // 2)
+    def draw(self, screen, alpha=1.0):
+        return _draw_one(screen, self.type, self.x, self.draw_y(alpha))
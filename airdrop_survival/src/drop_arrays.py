@@ -0,0 +1,97 @@
+# src/drop_arrays.py
+# Struct-of-arrays drop store: all falling drops advanced and collided with NumPy
+
+import numpy as np
+
+from settings import DROP_SIZE, DROP_TYPES
+
+
+class DropArrays:
+    """Drops kept as parallel arrays (x, y, prev_y, speed, type code).
+
+    A drop-in alternative to the list of Drop objects for Game: spawn() adds
+    one drop, step() moves every drop by its speed, resolves overlap with the
+    player and off-screen culling as boolean masks and returns the picked-up
+    types in spawn order, snapshot() lists (type, x, y) for drawing. Drops are
+    compacted in place, so the arrays stay dense and in spawn order.
+    """
+
+    def __init__(self, capacity=256):
+        self.types = list(DROP_TYPES)
+        self._codes = {t: i for i, t in enumerate(self.types)}
+        self.n = 0
+        self._alloc(max(1, int(capacity)))
+
+    def _alloc(self, capacity):
+        old = getattr(self, 'x', None)
+        x = np.zeros(capacity, dtype=np.int32)
+        y = np.zeros(capacity, dtype=np.float64)
+        prev_y = np.zeros(capacity, dtype=np.float64)
+        speed = np.zeros(capacity, dtype=np.float64)
+        kind = np.zeros(capacity, dtype=np.int8)
+        if old is not None:
+            n = self.n
+            x[:n] = self.x[:n]
+            y[:n] = self.y[:n]
+            prev_y[:n] = self.prev_y[:n]
+            speed[:n] = self.speed[:n]
+            kind[:n] = self.kind[:n]
+        self.x, self.y, self.prev_y, self.speed, self.kind = x, y, prev_y, speed, kind
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def spawn(self, x, speed, drop_type):
+        """Add a drop at the top of the screen."""
+        if self.n == len(self.x):
+            self._alloc(len(self.x) * 2)
+        i = self.n
+        self.x[i] = x
+        self.y[i] = 0.0
+        self.prev_y[i] = 0.0
+        self.speed[i] = speed
+        # unknown types draw/behave like the last type, same as Drop.draw's fallback
+        self.kind[i] = self._codes.get(drop_type, len(self.types) - 1)
+        self.n = i + 1
+
+    def step(self, player_rect, bottom):
+        """Advance one simulation step; return the types picked up by `player_rect`.
+
+        Drops overlapping the player (same test as Rect.colliderect on the
+        drop's rounded position) are picked up, drops whose top has passed
+        `bottom` are discarded; both are removed.
+        """
+        n = self.n
+        if n == 0:
+            return []
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_y[:n] = y
+        y += self.speed[:n]
+        top = np.floor(y + 0.5)
+        pr = player_rect
+        hit = (x < pr.right) & (x + DROP_SIZE > pr.left) & (top < pr.bottom) & (top + DROP_SIZE > pr.top)
+        gone = hit | (y > bottom)
+        if not gone.any():
+            return []
+        types = self.types
+        picked = [types[k] for k in self.kind[:n][hit].tolist()]
+        keep = np.flatnonzero(~gone)
+        m = len(keep)
+        for arr in (self.x, self.y, self.prev_y, self.speed, self.kind):
+            arr[:m] = arr[:n][keep]
+        self.n = m
+        return picked
+
+    def snapshot(self, alpha=1.0):
+        """[(type, x, y)] for every drop, y interpolated by `alpha` between steps."""
+        n = self.n
+        if n == 0:
+            return []
+        prev = self.prev_y[:n]
+        ys = prev + (self.y[:n] - prev) * alpha
+        types = self.types
+        return [(types[k], x, y) for k, x, y in zip(self.kind[:n].tolist(), self.x[:n].tolist(), ys.tolist())]
@@ -0,0 +1,144 @@
+# src/dsp.py
+# Vectorized DSP kernels (numpy) shared by the audio generators; they write into caller-owned buffers
+
+import numpy as np
+
+_TWO_PI = 2.0 * np.pi
+
+
+def sine(out, hz, sr, start=0):
+    """Fill `out` with sin(2*pi*hz*t) for samples start .. start+len(out).
+
+    The phase is computed from the sample index and wrapped in float64
+    before sin() is taken at the buffer's precision, so long signals stay
+    exact and the result does not depend on how the range is split.
+    """
+    ph = np.arange(start, start + len(out), dtype=np.float64)
+    ph *= hz / sr
+    ph -= np.floor(ph)
+    ph *= _TWO_PI
+    out[:] = ph
+    return np.sin(out, out=out)
+
+
+def osc_bank(out, freqs, sr, start=0):
+    """sin() of several oscillators at once into `out`, shape (len(freqs), n).
+
+    Same phase handling as sine(); one call for the whole bank.
+    """
+    n = out.shape[1]
+    inc = np.asarray(freqs, dtype=np.float64) / sr
+    ph = np.multiply.outer(inc, np.arange(start, start + n, dtype=np.float64))
+    ph -= np.floor(ph)
+    ph *= _TWO_PI
+    out[...] = ph
+    return np.sin(out, out=out)
+
+
+def lfo(out, hz, sr, offset, depth, start=0, rectify=False):
+    """Fill `out` with offset + depth * sin (|sin| with rectify), e.g. a tremolo gain."""
+    sine(out, hz, sr, start)
+    if rectify:
+        np.abs(out, out=out)
+    out *= depth
+    out += offset
+    return out
+
+
+def delay(x, samples, out):
+    """`x` delayed by `samples` (zeros shifted in) into `out`; `out` must not be `x`."""
+    samples = min(int(samples), len(x))
+    out[:samples] = 0.0
+    out[samples:] = x[:len(x) - samples]
+    return out
+
+
+class DelayLine:
+    """Streaming delay by a fixed number of samples, for signals built block by block."""
+
+    def __init__(self, samples, dtype=np.float64):
+        self.samples = max(1, int(samples))
+        self._hist = np.zeros(self.samples, dtype=dtype)
+
+    def process(self, x, out):
+        """Write `x` delayed into `out` (same length, not `x`) and keep its tail for the next block."""
+        n, d = len(x), self.samples
+        if n >= d:
+            out[:d] = self._hist
+            out[d:] = x[:n - d]
+            self._hist[:] = x[n - d:]
+        else:
+            out[:] = self._hist[:n]
+            self._hist[:d - n] = self._hist[n:]
+            self._hist[d - n:] = x
+        return out
+
+
+def moving_average(x, window, out, scratch=None):
+    """Centered boxcar average of `x` into `out`, aligned like np.convolve(mode='same').
+
+    A running sum (cumsum) makes it O(n) whatever the window, where the
+    convolution was O(n * window). Samples past either end count as zero.
+    The sums are differenced in float64; `scratch` (float64, at least
+    2 * len(x) + 1) avoids allocating them.
+    """
+    n = len(x)
+    window = max(1, int(window))
+    if scratch is None:
+        scratch = np.empty(2 * n + 1, dtype=np.float64)
+    c, acc = scratch[:n + 1], scratch[n + 1:2 * n + 1]
+    c[0] = 0.0
+    np.cumsum(x, out=c[1:])
+    # out[i] = c[i + hi] - c[i - lo], indices clamped to the signal
+    hi = (window - 1) // 2 + 1
+    lo = window - hi
+    m = max(0, min(n, n - hi + 1))
+    acc[:m] = c[hi:hi + m]
+    acc[m:] = c[n]
+    if lo < n:
+        acc[lo:] -= c[:n - lo]
+    acc /= window
+    out[:] = acc
+    return out
+
+
+def fir(x, taps, out):
+    """Short FIR (a few taps) applied with shifted adds, aligned like np.convolve(mode='same')."""
+    n = len(x)
+    centre = (len(taps) - 1) // 2
+    out[:] = 0.0
+    for j, tap in enumerate(taps):
+        shift = centre - j  # out[i] += tap * x[i + shift]
+        if shift >= 0:
+            out[:n - shift] += tap * x[shift:]
+        else:
+            out[-shift:] += tap * x[:n + shift]
+    return out
+
+
+def normalize(channels, peak=0.95):
+    """Scale all `channels` in place by one gain so the loudest sample reaches `peak`."""
+    top = max(float(np.max(np.abs(c))) if len(c) else 0.0 for c in channels)
+    gain = peak / max(top, 1e-9)
+    for c in channels:
+        c *= gain
+    return gain
+
+
+def to_pcm16(x, gain=1.0, channels=1):
+    """Scale, clip and convert a float signal to interleaved int16 bytes (mono duplicated to `channels`)."""
+    pcm = (np.clip(x * gain, -1.0, 1.0) * 32767.0).astype(np.int16)
+    if channels > 1:
+        pcm = np.repeat(pcm, channels)
+    return pcm.tobytes()
+
+
+def interleave_pcm16(left, right, out=None):
+    """Clip both channels to [-1, 1] (in place) and interleave them as int16 L/R frames into `out`."""
+    if out is None:
+        out = np.empty(len(left) * 2, dtype=np.int16)
+    for ch, dst in ((left, out[0::2]), (right, out[1::2])):
+        np.clip(ch, -1.0, 1.0, out=ch)
+        ch *= 32767.0
+        dst[:] = ch  # truncates toward zero, like astype(int16)
+    return out
@@ -0,0 +1,54 @@
+# src/fonts.py
+# Font registry and a bounded cache of rendered text surfaces
+
+from collections import OrderedDict
+
+import pygame
+
+try:
+    from settings import TEXT_CACHE_MAX_SURFACES
+except Exception:
+    TEXT_CACHE_MAX_SURFACES = 256
+
+# (face, size, bold) -> pygame.font.Font
+_FONTS = {}
+# (font, text, color, antialias) -> Surface, least recently used first
+_RENDERED = OrderedDict()
+
+
+def _clear():
+    # Font objects die with pygame.quit(); drop everything so a later
+    # pygame.init() starts from fresh fonts
+    _FONTS.clear()
+    _RENDERED.clear()
+
+
+pygame.register_quit(_clear)
+
+
+def get_font(face=None, size=24, bold=False):
+    """Return a shared SysFont for (face, size, bold), creating it on first use."""
+    key = (face, int(size), bool(bold))
+    font = _FONTS.get(key)
+    if font is None:
+        font = pygame.font.SysFont(face, int(size), bold=bool(bold))
+        _FONTS[key] = font
+    return font
+
+
+def render(font, text, antialias, color):
+    """Cached font.render(text, antialias, color).
+
+    The returned surface is shared: callers that change its alpha must
+    restore it (set_alpha(None)) after blitting.
+    """
+    key = (font, text, tuple(color), bool(antialias))
+    surf = _RENDERED.get(key)
+    if surf is not None:
+        _RENDERED.move_to_end(key)
+        return surf
+    surf = font.render(text, antialias, color)
+    _RENDERED[key] = surf
+    while len(_RENDERED) > TEXT_CACHE_MAX_SURFACES:
+        _RENDERED.popitem(last=False)
+    return surf
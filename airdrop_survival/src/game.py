@@ -1,72 +1,122 @@
 # src/game.py
 
+import math
 import pygame
 import random
+from collections import defaultdict
+import assets
+import fonts
+import music
+import preload
+import time
+import tracer
 from settings import WIDTH, HEIGHT, PLAYER_HEIGHT
 from player import Player
-from drop import Drop
-from ui import draw_status, draw_gameover
+from drop import clear_drops, draw_drops, new_drop_store, spawn_drop, step_drops
+from perf_hud import PerfHud, TOGGLE_KEY as PERF_HUD_KEY
+from ui import CAN_ICON_SIZE, StatusHud, draw_gameover
 from settings import LEVELS, CAN_IMAGE
+from settings import SIM_STEP_MS, RENDER_FPS, MAX_FRAME_MS
+from spawner import SpawnScheduler
+from speed_curve import SpeedCurve
+from settings import DROP_TIME_SCALE_RAMP_SEC
+
+# crossfade (ms) from the BGM to the success/failure tune when a level ends
+ENDING_FADE_MS = 400
+
+
+# pygame.key.get_pressed()-like mappings for scripted movement: -1 left, 0 none, 1 right
+_MOVE_KEYS = {
+    -1: defaultdict(bool, {pygame.K_LEFT: True}),
+    0: defaultdict(bool),
+    1: defaultdict(bool, {pygame.K_RIGHT: True}),
+}
+
+
+def _move_keys(direction):
+    return _MOVE_KEYS[(direction > 0) - (direction < 0)]
 
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        # initialize sounds for drops and pickups (safe to call even if mixer already init)
-        try:
-            import drop as drop_module
-            drop_module.init_sounds()
-        except Exception:
-            pass
-        # Try to start background music if available (prefer user bgm.mp3, else urgent_bgm.wav)
-        try:
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
+    def __init__(self, headless=False, seed=None):
+        """Set up a game session.
+
+        headless=True runs the logic without a visible window or audio (SDL
+        dummy drivers), skips music, sound effects and all blocking overlays,
+        and is meant to be driven by step() rather than run(). `seed` seeds
+        the `random` module so a session can be replayed exactly.
+        """
+        self.headless = bool(headless)
+        if self.headless:
             import os
-            sounds_base = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds')
-            # Prefer a user-provided bgm.mp3 if present
-            preferred_bgm = os.path.join(sounds_base, 'bgm.mp3')
-            bgm_path = None
-            if os.path.exists(preferred_bgm):
-                bgm_path = preferred_bgm
-            else:
-                try:
-                    # Fallback: ensure or synthesize urgent_bgm.wav
-                    from audio import ensure_urgent_bgm
-                    bgm_path = ensure_urgent_bgm(os.path.join(sounds_base, 'urgent_bgm.wav'))
-                except Exception:
-                    bgm_path = None
-            if bgm_path:
-                try:
-                    pygame.mixer.music.load(bgm_path)
-                    try:
-                        from settings import SOUND_VOLUME, SOUND_MUTED
-                        vol = 0.6 * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
-                    except Exception:
-                        vol = 0.6
-                    pygame.mixer.music.set_volume(vol)
-                    pygame.mixer.music.play(loops=-1)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+            # must be set before the display/audio subsystems are initialised
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        if seed is not None:
+            random.seed(seed)
+        # display, font and (unless headless) mixer only; see preload.init_subsystems
+        preload.init_subsystems(audio=not self.headless)
+        if not self.headless:
+            # initialize sounds for drops and pickups (safe to call even if mixer already init)
+            try:
+                import drop as drop_module
+                drop_module.init_sounds()
+            except Exception:
+                pass
+        # music tracks are decoded in the background (the Intro starts that early);
+        # the BGM fades in as soon as it is ready (prefers user bgm.mp3, else urgent_bgm.wav)
+        self.music = None if self.headless else music.get_manager()
+        if self.music is not None:
+            try:
+                self.music.transition_to('bgm')
+            except Exception:
+                pass
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Airdrop Survival")
+        # pack drop, HUD and player sprites into one atlas (no-op if the baked atlas covers them)
+        if not self.headless:
+            try:
+                import drop as drop_module
+                import player as player_module
+                import ui as ui_module
+                assets.ensure_atlas(drop_module.atlas_keys() + ui_module.atlas_keys() + player_module.atlas_keys())
+            except Exception:
+                pass
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 36)
+        self.font = fonts.get_font(None, 36)
+        # retained HUD: re-laid out only when hearts/coins/goal/displayed second change
+        self.hud = StatusHud(self.font)
         # position player so its bottom sits slightly above the bottom of the screen
         self.player = Player(WIDTH // 2, HEIGHT - PLAYER_HEIGHT - 10)
-        self.drops = []
+        # list of Drop objects or a NumPy DropArrays (settings.DROP_ENGINE)
+        self.drops = new_drop_store()
         self.hearts = 3
         self.coins = 0
         self.running = True
-        # track start time (milliseconds)
-        self.start_ticks = pygame.time.get_ticks()
+        # session statistics (see stats())
+        self.ticks = 0
+        self.coins_collected = 0
+        self.bombs_hit = 0
+        self.levels_cleared = 0
+        # 'cleared', 'timeout' or 'died' once the session has ended
+        self.outcome = None
+        # keys held for the next step when driven by step(); None reads the keyboard
+        self._held_keys = None
+        # simulation clock (milliseconds): advanced by exactly one fixed step per
+        # update(), so gameplay timing does not depend on the render frame rate
+        self.sim_ticks = pygame.time.get_ticks()
+        self._accumulator_ms = 0.0
+        # track start time (milliseconds, simulation clock)
+        self.start_ticks = self.sim_ticks
+        # simulation steps since the level started; spawn times are scheduled in steps
+        self.level_steps = 0
+        self.spawner = SpawnScheduler()
         # level state
         self.level_index = 0
         self.level = LEVELS[self.level_index] if LEVELS else None
         self.level_end_time = self.start_ticks + (self.level['time_seconds'] * 1000) if self.level else None
         self.level_active = True if self.level else False
+        self.speed_curve = self._level_speed_curve()
     # Skip level-start banner; jump directly into gameplay
         # visual feedback: floating pop texts as list of tuples
         # tuple formats supported for backward compatibility:
@@ -75,124 +125,96 @@ class Game:
         #  (x, start_y, start_ms, text, (r,g,b))    -> explicit color
         self.coin_pops = []
         # small font for coin pop text (increased to 30 per user request)
-        self.font_small = pygame.font.SysFont(None, 30)
+        self.font_small = fonts.get_font(None, 30)
         # control hint: show shortly after entering the game (concise implementation)
         self.control_hint_duration_ms = 5000
-        self.control_hint_end = pygame.time.get_ticks() + self.control_hint_duration_ms
-        self.control_hint_font = pygame.font.SysFont(None, 28)
+        self.control_hint_end = self.sim_ticks + self.control_hint_duration_ms
+        self.control_hint_font = fonts.get_font(None, 28)
         # Use a single compact ASCII hint to avoid complex font probing
         self.control_hint_text = "PRESS <-/-> OR A/D TO MOVE"
-        # Keep a reference to an ending Sound if we fall back to Sound playback
-        self._ending_sound = None
+        # per-phase frame tracing (AIRDROP_TRACE=path or main.py --trace); None when off
+        self.tracer = None if self.headless else tracer.get_tracer()
+        # live FPS / frame-time overlay, toggled with F3 (perf_hud.TOGGLE_KEY)
+        self.perf_hud = None if self.headless else PerfHud(fonts.get_font(None, 20))
+        # Optional dirty-rectangle presentation (settings.DIRTY_RECT_RENDERING)
+        self.renderer = None
+        try:
+            from settings import DIRTY_RECT_RENDERING
+        except Exception:
+            DIRTY_RECT_RENDERING = False
+        if DIRTY_RECT_RENDERING and not self.headless:
+            from render import DirtyRectRenderer
+            from ui import get_background
+            self.renderer = DirtyRectRenderer(self.screen, get_background(WIDTH, HEIGHT))
         # When handing off to a new game session from the back-to-menu overlay,
         # avoid quitting pygame in this instance's teardown.
         self._handoff_to_new_session = False
 
-    def _play_ending_music(self, filename, loop=False):
-        """Try to fade current music and play an ending music file from assets/sounds."""
+    def _level_speed_curve(self):
+        """Compile the drop speed curve for the current level (level 0 -> x1.0)."""
         try:
-            # ensure mixer initialized
-            try:
-                if not pygame.mixer.get_init():
-                    pygame.mixer.init()
-            except Exception:
-                pass
-            import os
-            base = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds')
-            p = os.path.join(base, filename)
-
-            if os.path.exists(p):
-                try:
-                    # try a short fadeout of any current music (urgent_bgm)
-                    try:
-                        pygame.mixer.music.fadeout(400)
-                    except Exception:
-                        pass
-                    # ensure music is stopped so the ending track won't be masked
-                    try:
-                        pygame.mixer.music.stop()
-                    except Exception:
-                        pass
-                    # do not stop all mixer channels here; only stop music to avoid masking
-                except Exception:
-                    try:
-                        # ensure music is stopped if fadeout is unavailable
-                        pygame.mixer.music.stop()
-                    except Exception:
-                        pass
-                # desired volume
-                try:
-                    from settings import SOUND_VOLUME, SOUND_MUTED
-                    vol = 1.0 * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
-                except Exception:
-                    vol = 1.0
-                # First try streaming music API; if it fails (e.g., unknown WAVE format),
-                # fall back to Sound playback which supports more codecs in some builds.
-                played = False
-                try:
-                    pygame.mixer.music.load(p)
-                    try:
-                        pygame.mixer.music.set_volume(vol)
-                    except Exception:
-                        pass
-                    pygame.mixer.music.play(loops=-1 if loop else 0)
-                    played = True
-                    try:
-                        print(f"[ending-music] music.play {filename} (loop={loop})")
-                    except Exception:
-                        pass
-                except Exception as e:
-                    try:
-                        print(f"[ending-music] music.load failed, falling back to Sound: {e}")
-                    except Exception:
-                        pass
-                if not played:
-                    try:
-                        # Stop any prior ending Sound
-                        if getattr(self, '_ending_sound', None) is not None:
-                            try:
-                                self._ending_sound.stop()
-                            except Exception:
-                                pass
-                        snd = pygame.mixer.Sound(p)
-                        try:
-                            snd.set_volume(vol)
-                        except Exception:
-                            pass
-                        snd.play(loops=-1 if loop else 0)
-                        self._ending_sound = snd
-                        try:
-                            print(f"[ending-music] sound.play {filename} (loop={loop})")
-                        except Exception:
-                            pass
-                    except Exception as e2:
-                        try:
-                            print(f"[ending-music] sound fallback failed: {e2}")
-                        except Exception:
-                            pass
-            else:
-                try:
-                    print(f"[ending-music] file not found: {p}")
-                except Exception:
-                    pass
+            from settings import LEVEL_SPEED_INCREASE_PER_LEVEL
+            level_mult = 1.0 + self.level_index * LEVEL_SPEED_INCREASE_PER_LEVEL
         except Exception:
-            pass
+            level_mult = 1.0
+        duration = self.level['time_seconds'] if self.level else DROP_TIME_SCALE_RAMP_SEC
+        return SpeedCurve(level_mult, duration)
+
+    def _coins_required(self):
+        return self.level.get('coins_required', 0) if self.level else None
 
     def run(self):
+        tr = self.tracer
+        first_frame = True
         while self.running:
-            self.clock.tick(60)
-            # draw procedural background (sky gradient + ground)
-            from ui import draw_background
-            draw_background(self.screen, WIDTH, HEIGHT)
+            if tr is not None:
+                frame_start = t = tr.now()
+            # render at RENDER_FPS; simulate in fixed SIM_STEP_MS steps to catch up
+            # with real time (clamped so a stall doesn't trigger a burst of steps)
+            frame_ms = self.clock.tick(RENDER_FPS)
+            self._accumulator_ms += min(frame_ms, MAX_FRAME_MS)
+            if self.perf_hud is not None:
+                self.perf_hud.record(time.perf_counter())
+            # start a music track whose background decode just finished
+            if self.music is not None:
+                self.music.update()
+            if tr is not None:
+                t = tr.span(tracer.TICK, t)
+            if self.renderer is not None:
+                # restore only last frame's rects from the cached background
+                self.renderer.begin_frame()
+            else:
+                # draw procedural background (sky gradient + ground)
+                from ui import draw_background
+                draw_background(self.screen, WIDTH, HEIGHT)
+            if tr is not None:
+                t = tr.span(tracer.BACKGROUND, t)
             self.handle_events()
-            self.update()
+            if tr is not None:
+                t = tr.span(tracer.EVENTS, t)
+            while self.running and self._accumulator_ms >= SIM_STEP_MS:
+                self.update()
+                self._accumulator_ms -= SIM_STEP_MS
+                if tr is not None:
+                    t = tr.span(tracer.UPDATE, t)
             # if update() turned off running (e.g. death/game-over sequence),
             # skip the regular draw/flip so we don't render a normal player frame.
             if not self.running:
                 break
             try:
-                self.draw()
-                pygame.display.flip()
+                rects = self.draw(self._accumulator_ms / SIM_STEP_MS)
+                if tr is not None:
+                    t = tr.span(tracer.DRAW, t)
+                if self.renderer is not None:
+                    self.renderer.present(rects)
+                else:
+                    pygame.display.flip()
+                if first_frame:
+                    preload.mark('first_game_frame')
+                    first_frame = False
+                if tr is not None:
+                    tr.span(tracer.PRESENT, t)
+                    tr.span(tracer.FRAME, frame_start)
             except pygame.error as e:
                 # If the display surface was quit (window closed) we should exit cleanly.
                 msg = str(e).lower()
@@ -202,26 +224,84 @@ class Game:
                 else:
                     # re-raise unexpected pygame errors
                     raise
+        if tr is not None:
+            try:
+                tr.dump()
+            except Exception as e:
+                print(f"tracer: failed to write trace: {e}")
         # fade out music if playing, then quit (unless handing off to a new session)
         if not getattr(self, '_handoff_to_new_session', False):
             try:
-                try:
-                    pygame.mixer.music.fadeout(800)
-                except Exception:
-                    try:
-                        pygame.mixer.music.stop()
-                    except Exception:
-                        pass
+                if self.music is not None:
+                    self.music.stop(800)
             except Exception:
                 pass
             pygame.quit()
 
+    def step(self, ticks=1, policy=None):
+        """Advance up to `ticks` simulation steps without rendering or throttling.
+
+        `policy(game)` is called before each step and returns -1 (move left),
+        0 (stand still) or 1 (move right); without one the player stands still
+        (headless) or follows the keyboard. Stops early once the session ends.
+        Returns stats().
+        """
+        remaining = int(ticks)
+        while remaining > 0 and self.running:
+            if policy is None and self.headless and not self.drops:
+                # nothing moves until the next spawn: jump straight to it
+                skipped = self._skip_idle(remaining - 1)
+                remaining -= skipped
+                if skipped:
+                    continue
+            remaining -= 1
+            if policy is not None:
+                self._held_keys = _move_keys(policy(self))
+            elif self.headless:
+                self._held_keys = _move_keys(0)
+            self.update()
+        return self.stats()
+
+    def _skip_idle(self, limit):
+        """Advance the clocks over up to `limit` steps in which nothing can happen.
+
+        Only valid with no drops in play and a player standing still: stops
+        one step before the next scheduled spawn or the level deadline.
+        Returns the number of steps skipped.
+        """
+        idle = min(limit, self.spawner.next_spawn() - self.level_steps - 1)
+        if self.level_active and self.level_end_time is not None:
+            idle = min(idle, math.ceil((self.level_end_time - self.sim_ticks) / SIM_STEP_MS) - 1)
+        if idle <= 0:
+            return 0
+        self.sim_ticks += idle * SIM_STEP_MS
+        self.ticks += idle
+        self.level_steps += idle
+        return idle
+
+    def stats(self):
+        """Summary of the session so far (final once `running` is False)."""
+        return {
+            'outcome': self.outcome,
+            'coins': self.coins,
+            'hearts': self.hearts,
+            'level': self.level_index + 1,
+            'levels_cleared': self.levels_cleared,
+            'coins_collected': self.coins_collected,
+            'bombs_hit': self.bombs_hit,
+            'ticks': self.ticks,
+            'sim_seconds': self.ticks * SIM_STEP_MS / 1000.0,
+        }
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             # keydown for buying food
             elif event.type == pygame.KEYDOWN:
+                if event.key == PERF_HUD_KEY and self.perf_hud is not None:
+                    self.perf_hud.toggle()
+                    continue
                 # debug: print A/D keydowns to verify input
                 try:
                     if event.key in (pygame.K_a, pygame.K_d):
@@ -230,75 +310,82 @@ class Game:
                     pass
 
     def update(self):
-        keys = pygame.key.get_pressed()
+        """Advance the simulation by one fixed step (SIM_STEP_MS of game time)."""
+        self.sim_ticks += SIM_STEP_MS
+        self.ticks += 1
+        keys = self._held_keys if self._held_keys is not None else pygame.key.get_pressed()
         self.player.move(keys)
+        tr = self.tracer
+        if tr is not None:
+            t = tr.now()
+
+        # spawns come from the scheduler (spawn interval shrinks over the level)
+        self.level_steps += 1
+        elapsed_seconds = (self.sim_ticks - self.start_ticks) / 1000.0
+        for _ in range(self.spawner.due(self.level_steps)):
+            spawn_drop(self.drops, elapsed_seconds=elapsed_seconds, curve=self.speed_curve)
+        if tr is not None:
+            t = tr.span(tracer.SPAWN, t)
+
+        # move all drops; apply pickups in spawn order
+        for kind in step_drops(self.drops, self.player.rect, HEIGHT):
+            if kind == "bomb":
+                self.hearts -= 1
+                self.bombs_hit += 1
+                # play bomb explosion sound
+                try:
+                    import drop as drop_module
+                    drop_module.play_bomb()
+                except Exception:
+                    pass
+                # show hurt overlay for ~2 seconds
+                self.player.set_hurt(2, now=self.sim_ticks)
+                # floating red -1 feedback above player
+                try:
+                    self.coin_pops.append((self.player.rect.centerx, self.player.rect.top, self.sim_ticks, "-1", (200, 30, 30)))
+                except Exception:
+                    pass
+            elif kind == "coin":
+                self.coins += 1
+                self.coins_collected += 1
+                # play coin pickup sound
+                try:
+                    import drop as drop_module
+                    drop_module.play_coin()
+                except Exception:
+                    pass
+                # add coin pop at player's position
+                self.coin_pops.append((self.player.rect.centerx, self.player.rect.top, self.sim_ticks, "+1"))
+            elif kind == "health_pack" and self.hearts < 3:
+                self.hearts += 1
+                # play heal pickup sound
+                try:
+                    import drop as drop_module
+                    drop_module.play_heal()
+                except Exception:
+                    pass
+                # floating green +1 feedback for heal
+                try:
+                    self.coin_pops.append((self.player.rect.centerx, self.player.rect.top, self.sim_ticks, "+1", (50, 200, 50)))
+                except Exception:
+                    pass
 
-        # dynamic spawn interval: decreases over time to increase spawn frequency
-        elapsed_seconds = (pygame.time.get_ticks() - self.start_ticks) / 1000.0
-        from settings import DROP_SPAWN_INTERVAL_BASE, DROP_SPAWN_INTERVAL_MIN, DROP_SPAWN_DECREASE_PER_MIN
-        # compute current interval
-        decrease = (elapsed_seconds / 60.0) * DROP_SPAWN_DECREASE_PER_MIN
-        interval = max(DROP_SPAWN_INTERVAL_MIN, int(DROP_SPAWN_INTERVAL_BASE - decrease))
-        if random.randint(1, interval) == 1:
-            # compute per-level speed multiplier (level 0 -> 1.0)
-            try:
-                from settings import LEVEL_SPEED_INCREASE_PER_LEVEL
-                level_mult = 1.0 + (self.level_index * LEVEL_SPEED_INCREASE_PER_LEVEL) if hasattr(self, 'level_index') else 1.0
-            except Exception:
-                level_mult = 1.0
-            self.drops.append(Drop(elapsed_seconds=elapsed_seconds, level_speed_multiplier=level_mult))
-
-        for drop in self.drops[:]:
-            drop.update()
-            if drop.rect.colliderect(self.player.rect):
-                if drop.type == "bomb":
-                    self.hearts -= 1
-                    # play bomb explosion sound
-                    try:
-                        import drop as drop_module
-                        drop_module.play_bomb()
-                    except Exception:
-                        pass
-                    # show hurt overlay for ~2 seconds
-                    self.player.set_hurt(2)
-                    # floating red -1 feedback above player
-                    try:
-                        self.coin_pops.append((self.player.rect.centerx, self.player.rect.top, pygame.time.get_ticks(), "-1", (200, 30, 30)))
-                    except Exception:
-                        pass
-                elif drop.type == "coin":
-                    self.coins += 1
-                    # play coin pickup sound
-                    try:
-                        import drop as drop_module
-                        drop_module.play_coin()
-                    except Exception:
-                        pass
-                    # add coin pop at player's position
-                    self.coin_pops.append((self.player.rect.centerx, self.player.rect.top, pygame.time.get_ticks(), "+1"))
-                elif drop.type == "health_pack" and self.hearts < 3:
-                    self.hearts += 1
-                    # play heal pickup sound
-                    try:
-                        import drop as drop_module
-                        drop_module.play_heal()
-                    except Exception:
-                        pass
-                    # floating green +1 feedback for heal
-                    try:
-                        self.coin_pops.append((self.player.rect.centerx, self.player.rect.top, pygame.time.get_ticks(), "+1", (50, 200, 50)))
-                    except Exception:
-                        pass
-                self.drops.remove(drop)
-            elif drop.y > HEIGHT:
-                self.drops.remove(drop)
+        if tr is not None:
+            t = tr.span(tracer.DROPS, t)
 
         # prune expired coin pops (duration ms)
-        now = pygame.time.get_ticks()
+        now = self.sim_ticks
         COIN_POP_DURATION = 800
         # coin_pops now contain tuples (x, start_y, t0, text)
         self.coin_pops = [p for p in self.coin_pops if now - p[2] < COIN_POP_DURATION]
-
+        if tr is not None:
+            t = tr.span(tracer.POPS, t)
+        self._level_check(now)
+        if tr is not None:
+            tr.span(tracer.LEVEL, t)
+
+    def _level_check(self, now):
+        """End the level when its timer runs out and end the session on death."""
         # ...hunger system removed...
 
         # Level timer check: if level active and time reached, evaluate outcome
@@ -307,79 +394,87 @@ class Game:
             coins_required = self.level.get('coins_required', 0)
             reward = self.level.get('reward', {})
             from ui import draw_level_result
-            # try to load reward image from assets
-            reward_img = None
-            try:
-                import os
-                base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-                p = os.path.join(base, reward.get('image', CAN_IMAGE))
-                if os.path.exists(p):
-                    reward_img = pygame.image.load(p).convert_alpha()
-            except Exception:
-                reward_img = None
 
             if self.coins >= coins_required:
                 # success: consume coins
                 self.coins -= coins_required
-                # play success music (uses assets/sounds/success.wav if present)
-                try:
-                    # use tracked/known filename for success music
-                    self._play_ending_music('success.wav', loop=False)
-                except Exception:
-                    pass
-                # show success UI with can image
-                draw_level_result(self.screen, self.font, f"Congratulations! You got a {reward.get('type', 'can')}", success=True, reward_image=reward_img)
+                self.levels_cleared += 1
+                if not self.headless:
+                    # crossfade from the BGM to the success tune (assets/sounds/success.wav)
+                    try:
+                        if self.music is not None:
+                            self.music.transition_to('success', ENDING_FADE_MS, loop=False)
+                    except Exception:
+                        pass
+                    # show success UI with can image (from the shared asset cache, None if missing)
+                    reward_img = assets.first(reward.get('image', CAN_IMAGE))
+                    draw_level_result(self.screen, self.font, f"Congratulations! You got a {reward.get('type', 'can')}", success=True, reward_image=reward_img)
                 # advance to next level if available
                 if self.level_index + 1 < len(LEVELS):
                     self.level_index += 1
                     self.level = LEVELS[self.level_index]
                     # reset timers: start_ticks and level_end_time based on now
-                    self.start_ticks = pygame.time.get_ticks()
+                    self.start_ticks = self.sim_ticks
+                    self.level_steps = 0
+                    self.spawner.reset()
+                    self.speed_curve = self._level_speed_curve()
                     self.level_end_time = self.start_ticks + (self.level['time_seconds'] * 1000)
                     self.level_active = True
                     # clear drops to give the player a fresh start for next level
-                    self.drops.clear()
+                    clear_drops(self.drops)
+                    if self.headless:
+                        return
                     # show level start hint for the new level
                     try:
                         from ui import draw_level_start_hint
                         reward = self.level.get('reward', {})
-                        reward_img = None
-                        import os
-                        base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-                        p = os.path.join(base, reward.get('image', CAN_IMAGE))
-                        if os.path.exists(p):
-                            reward_img = pygame.image.load(p).convert_alpha()
+                        reward_img = assets.first(reward.get('image', CAN_IMAGE))
                         draw_level_start_hint(self.screen, self.font, self.level.get('coins_required', 0), reward.get('type', 'can'), reward_image=reward_img)
                     except Exception:
                         pass
+                    # the result/hint overlays covered the whole screen
+                    if self.renderer is not None:
+                        self.renderer.invalidate()
+                    # the overlays blocked in real time; don't simulate that pause
+                    self._accumulator_ms = 0.0
+                    self.clock.tick()
                 else:
                     # no more levels: end game — show back-to-menu overlay
-                    self._show_back_to_menu("All levels cleared!", (0, 220, 0))
+                    self.outcome = 'cleared'
+                    if not self.headless:
+                        self._show_back_to_menu("All levels cleared!", (0, 220, 0))
                     self.running = False
                     return
             else:
-                # failure: play failure music then show message
-                try:
-                    # use tracked/known filename for failure music
-                    self._play_ending_music('failure.wav', loop=False)
-                except Exception:
-                    pass
-                draw_level_result(self.screen, self.font, "Time's up! Not enough coins, challenge failed.", success=False, reward_image=None)
+                self.outcome = 'timeout'
                 self.level_active = False
-                # show game over after failure with back-to-menu option
-                self._show_back_to_menu("GAME OVER", (255, 0, 0))
+                if not self.headless:
+                    # failure: crossfade to the failure tune then show message
+                    try:
+                        if self.music is not None:
+                            self.music.transition_to('failure', ENDING_FADE_MS, loop=False)
+                    except Exception:
+                        pass
+                    draw_level_result(self.screen, self.font, "Time's up! Not enough coins, challenge failed.", success=False, reward_image=None)
+                    # show game over after failure with back-to-menu option
+                    self._show_back_to_menu("GAME OVER", (255, 0, 0))
                 self.running = False
                 return
         if self.hearts <= 0:
+            self.outcome = 'died'
+            if self.headless:
+                # skip the death animation and the back-to-menu overlay
+                self.running = False
+                return
             # set dead overlay and show a rising halo above the player
             # total death display target: ~7000ms (animation + final pause)
             # we keep the final pause at 1500ms, so animation loop is 5500ms
             DEATH_MS = 5500
             self.player.set_dead(DEATH_MS / 1000)
-            # play failure music at start of death sequence
+            # crossfade to the failure tune at start of death sequence
             try:
-                # play failure music on death
-                self._play_ending_music('failure.wav', loop=False)
+                if self.music is not None:
+                    self.music.transition_to('failure', ENDING_FADE_MS, loop=False)
             except Exception:
                 pass
             start = pygame.time.get_ticks()
@@ -399,9 +494,8 @@ class Game:
                 from ui import draw_background
                 draw_background(self.screen, WIDTH, HEIGHT)
                 # draw drops and status then player so halo can be drawn on top
-                for drop in self.drops:
-                    drop.draw(self.screen)
-                draw_status(self.screen, self.font, self.hearts, self.coins)
+                draw_drops(self.screen, self.drops)
+                self.hud.draw(self.screen, self.hearts, self.coins, self._coins_required())
                 # draw player (dead sprite will be drawn by player.draw)
                 self.player.draw(self.screen, (0, 0, 0))
 
@@ -458,6 +552,8 @@ class Game:
                     # after fade window, stop drawing halo
 
                 pygame.display.flip()
+                if self.music is not None:
+                    self.music.update()
                 self.clock.tick(30)
 
             # after the death animation, convert screen to grayscale if possible
@@ -482,25 +578,59 @@ class Game:
             self.running = False
 
 
-    def draw(self):
-        self.player.draw(self.screen, (0, 0, 0))
-        for drop in self.drops:
-            drop.draw(self.screen)
+    def draw(self, alpha=1.0):
+        """Draw the frame over the background; returns the list of rects drawn.
+
+        `alpha` (0..1) is how far the render time lies between the previous and
+        the current simulation step; moving objects are interpolated by it.
+        """
+        tr = self.tracer
+        if tr is not None:
+            t = tr.now()
+        rects = [self.player.draw(self.screen, (0, 0, 0), alpha=alpha, now=self.sim_ticks)]
+        if tr is not None:
+            t = tr.span(tracer.PLAYER, t)
+        rects.extend(draw_drops(self.screen, self.drops, alpha))
+        if tr is not None:
+            t = tr.span(tracer.DROPS_DRAW, t)
         # compute remaining level time if active
         time_left = None
         if self.level_active and self.level_end_time is not None:
-            ms_left = max(0, self.level_end_time - pygame.time.get_ticks())
+            ms_left = max(0, self.level_end_time - self.sim_ticks)
             time_left = int(ms_left / 1000)
-        draw_status(self.screen, self.font, self.hearts, self.coins)
-        # show centered countdown message about starvation
-        if time_left is not None:
-            try:
-                from ui import draw_center_countdown
-                draw_center_countdown(self.screen, self.font, time_left)
-            except Exception:
-                pass
+        # HUD and centered starvation countdown in one cached layout
+        rects.append(self.hud.draw(self.screen, self.hearts, self.coins, self._coins_required(), time_left))
+        if tr is not None:
+            t = tr.span(tracer.HUD, t)
         # draw coin pop effects
-        now = pygame.time.get_ticks()
+        rects.extend(self.draw_pops())
+        if tr is not None:
+            t = tr.span(tracer.POPS_DRAW, t)
+
+        # show a brief control hint at game start (after Intro) — larger font, slightly up
+        try:
+            now_hint = self.sim_ticks
+            if getattr(self, 'control_hint_end', 0) and now_hint < self.control_hint_end:
+                hint_s = fonts.render(self.control_hint_font, self.control_hint_text, True, (255, 230, 180))
+                shadow = fonts.render(self.control_hint_font, self.control_hint_text, True, (30, 30, 30))
+                hx = WIDTH // 2 - hint_s.get_width() // 2
+                hy = HEIGHT // 2 - 10
+                rects.append(self.screen.blit(shadow, (hx + 2, hy + 2)))
+                rects.append(self.screen.blit(hint_s, (hx, hy)))
+        except Exception:
+            pass
+        if tr is not None:
+            tr.span(tracer.HINT, t)
+        if self.perf_hud is not None and self.perf_hud.visible:
+            # left of the can/goal column in the top-right corner
+            rects.append(self.perf_hud.draw(self.screen, len(self.drops), len(self.coin_pops),
+                                            topright=(WIDTH - CAN_ICON_SIZE - 24, 8)))
+        return rects
+
+    def draw_pops(self):
+        """Draw the floating +1/-1 pop texts; returns the rects drawn."""
+        rects = []
+        now = self.sim_ticks
         COIN_POP_DURATION = 800
         for p in self.coin_pops:
             # support tuples:
@@ -525,26 +655,16 @@ class Game:
                 frac = elapsed / COIN_POP_DURATION
                 y = start_y - int(frac * 30)
                 alpha = max(0, 255 - int(255 * frac))
-                txt = self.font_small.render(text, True, color)
+                # cached surface is shared: fade it for this blit only
+                txt = fonts.render(self.font_small, text, True, color)
                 try:
                     txt.set_alpha(alpha)
                 except Exception:
                     pass
                 rect = txt.get_rect(center=(x, y))
-                self.screen.blit(txt, rect)
-
-        # show a brief control hint at game start (after Intro) — larger font, slightly up
-        try:
-            now_hint = pygame.time.get_ticks()
-            if getattr(self, 'control_hint_end', 0) and now_hint < self.control_hint_end:
-                hint_s = self.control_hint_font.render(self.control_hint_text, True, (255, 230, 180))
-                shadow = self.control_hint_font.render(self.control_hint_text, True, (30, 30, 30))
-                hx = WIDTH // 2 - hint_s.get_width() // 2
-                hy = HEIGHT // 2 - 10
-                self.screen.blit(shadow, (hx + 2, hy + 2))
-                self.screen.blit(hint_s, (hx, hy))
-        except Exception:
-            pass
+                rects.append(self.screen.blit(txt, rect))
+                txt.set_alpha(None)
+        return rects
 
     def _show_back_to_menu(self, message, color):
         """Display an overlay with a Back to Menu button and Quit option.
@@ -557,9 +677,9 @@ class Game:
             overlay.fill((0, 0, 0, 180))
 
             # Match intro ENTER GAME styling: font size, color, padding, border
-            big_font = pygame.font.SysFont(None, 32)
-            label = big_font.render('BACK TO MENU', True, (10, 10, 10))
-            quit_label = big_font.render('QUIT', True, (10, 10, 10))
+            big_font = fonts.get_font(None, 32)
+            label = fonts.render(big_font, 'BACK TO MENU', True, (10, 10, 10))
+            quit_label = fonts.render(big_font, 'QUIT', True, (10, 10, 10))
             padx, pady = 20, 14
             bw = label.get_width() + padx * 2
             bh = label.get_height() + pady * 2
@@ -574,7 +694,7 @@ class Game:
             button_rect = pygame.Rect(bx, by, bw, bh)
             quit_rect = pygame.Rect(qx, qy, qw, qh)
 
-            text_surf = self.font.render(message, True, color)
+            text_surf = fonts.render(self.font, message, True, color)
 
             waiting = True
             while waiting:
@@ -642,10 +762,12 @@ class Game:
                 pygame.draw.rect(self.screen, (60, 60, 60), quit_rect, border_radius=10)
                 pygame.draw.rect(self.screen, (255, 230, 140), quit_rect, width=3, border_radius=10)
                 # render quit label in the former bg color for contrast
-                quit_label = big_font.render('QUIT', True, (255, 230, 140))
+                quit_label = fonts.render(big_font, 'QUIT', True, (255, 230, 140))
                 self.screen.blit(quit_label, (qx + padx, qy + pady - 1))
 
                 pygame.display.flip()
+                if self.music is not None:
+                    self.music.update()
                 self.clock.tick(30)
         except Exception:
             try:
@@ -9,162 +9,140 @@ Behavior:
 """
 import os
 import pygame
+import assets
+import fonts
+import music
+import preload
 from ui import draw_background
 from settings import WIDTH, HEIGHT, DROP_SIZE, INTRO_DROP_PAUSE, INTRO_DROP_PAUSE_MS, INTRO_DROP_TRIGGER_ADVANCE
 
-
-def _load_asset(name):
-    base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-    p = os.path.join(base, name)
-    try:
-        if os.path.exists(p):
-            return pygame.image.load(p).convert_alpha()
-    except Exception:
-        pass
-    return None
+# Plane is drawn at 30% of its source size; the can hint at 1.5x a drop
+PLANE_SCALE = 0.3
+CAN_HINT_SIZE = int(DROP_SIZE * 1.5)
 
 
 class Intro:
     def __init__(self):
-        # initialize basic pygame subsystems (Game also does this, but safe here)
-        pygame.init()
-        # ensure mixer is initialized (some platforms require explicit init)
-        try:
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
-        except Exception:
-            # if mixer init fails, continue without sound
-            pass
+        # only display, font and mixer (Game does the same)
+        preload.init_subsystems()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption('Airdrop Survival - Intro')
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 34)
-        self.small_font = pygame.font.SysFont(None, 22)
+        self.font = fonts.get_font(None, 34)
+        self.small_font = fonts.get_font(None, 22)
         # title font for intro
-        self.title_font = pygame.font.SysFont(None, 48, bold=True)
+        self.title_font = fonts.get_font(None, 48, bold=True)
 
         # load assets (use names that exist in the project's assets folder)
         self.bg = None  # background will be loaded via ui.draw_background which prefers assets/background.png
-        self.plane_img = _load_asset('airplane.png') or _load_asset('plane.png')
-        self.coin_img = _load_asset('coin.png')
-        self.health_img = _load_asset('health_pack.png') or _load_asset('medkit.png')
-        self.bomb_img = _load_asset('bomb.png')
+        # images are referenced by asset name; the shared cache decodes and scales them once
+        self.plane_name = assets.first('airplane.png', 'plane.png')
+        self.coin_name = assets.first('coin.png')
+        self.health_name = assets.first('health_pack.png', 'medkit.png')
+        self.bomb_name = assets.first('bomb.png')
+        if self.plane_name is None:
+            # fallback simple plane
+            plane = pygame.Surface((140, 80), pygame.SRCALPHA)
+            pygame.draw.polygon(plane, (40, 120, 140), [(0, 40), (110, 10), (130, 40), (110, 70)])
+            self.plane_name = 'intro:plane'
+            assets.register(self.plane_name, plane)
+        # scale plane down so it flies in the sky area (smaller than player);
+        # the size comes from the baked manifest without decoding the source
+        pw, ph = assets.size(self.plane_name)
+        self.plane_size = (int(pw * PLANE_SCALE), int(ph * PLANE_SCALE))
 
-        # load sounds from assets/sounds/
+        # sounds placed by the user in assets/sounds/: the first existing of
+        # (path, volume, whether SOUND_VOLUME/SOUND_MUTED apply) is used
+        base = os.path.join(os.path.dirname(__file__), '..', 'assets')
+        sounds_dir = os.path.join(base, 'sounds')
+        self._plane_sound_file = self._pick_sound(
+            (os.path.join(sounds_dir, 'plane_loop.mp3'), 0.28, True),
+            (os.path.join(sounds_dir, 'plane_loop.wav'), 0.35, True),
+            (os.path.join(base, 'airplane-engine-sound-2-67757.mp3'), 0.28, True),
+        )
+        self._drop_sound_file = self._pick_sound(
+            (os.path.join(sounds_dir, 'drop_thud.mp3'), 0.95, True),
+            (os.path.join(sounds_dir, 'drop_thud.wav'), 0.95, True),
+            (os.path.join(base, 'impact-258054.mp3'), 0.9, False),
+        )
         self.plane_sound = None
         self.drop_sound = None
-        try:
-            base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-            # sound files placed by user in assets/sounds/ (prefer these mp3s)
-            sounds_dir = os.path.join(base, 'sounds')
-            plane_mp3 = os.path.join(sounds_dir, 'plane_loop.mp3')
-            plane_wav = os.path.join(sounds_dir, 'plane_loop.wav')
-            drop_mp3 = os.path.join(sounds_dir, 'drop_thud.mp3')
-            drop_wav = os.path.join(sounds_dir, 'drop_thud.wav')
-
-            # Load plane sound: prefer plane_loop.mp3 -> plane_loop.wav -> assets/airplane-engine-sound-2-67757.mp3
-            if os.path.exists(plane_mp3):
-                try:
-                    print(f"intro: loading plane sound from {plane_mp3}")
-                    self.plane_sound = pygame.mixer.Sound(plane_mp3)
-                    # apply global volume/mute
-                    try:
-                        from settings import SOUND_VOLUME, SOUND_MUTED
-                    except Exception:
-                        SOUND_VOLUME = 1.0; SOUND_MUTED = False
-                    vol = 0.28 * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
-                    self.plane_sound.set_volume(vol)
-                    # store base plane volume for fade calculations
-                    self._plane_base_vol = vol
-                except Exception:
-                    print("intro: failed to load plane_loop.mp3")
-                    self.plane_sound = None
-            elif os.path.exists(plane_wav):
-                try:
-                    print(f"intro: loading plane sound from {plane_wav}")
-                    self.plane_sound = pygame.mixer.Sound(plane_wav)
-                    try:
-                        from settings import SOUND_VOLUME, SOUND_MUTED
-                    except Exception:
-                        SOUND_VOLUME = 1.0; SOUND_MUTED = False
-                    vol = 0.35 * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
-                    self.plane_sound.set_volume(vol)
-                    self._plane_base_vol = vol
-                except Exception:
-                    print("intro: failed to load plane_loop.wav")
-                    self.plane_sound = None
-            else:
-                preferred_mp3 = os.path.join(base, 'airplane-engine-sound-2-67757.mp3')
-                if os.path.exists(preferred_mp3):
-                    try:
-                        print(f"intro: loading fallback plane sound from {preferred_mp3}")
-                        self.plane_sound = pygame.mixer.Sound(preferred_mp3)
-                        try:
-                            from settings import SOUND_VOLUME, SOUND_MUTED
-                        except Exception:
-                            SOUND_VOLUME = 1.0; SOUND_MUTED = False
-                        vol = 0.28 * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
-                        self.plane_sound.set_volume(vol)
-                        self._plane_base_vol = vol
-                    except Exception:
-                        print("intro: failed to load fallback airplane mp3")
-                        self.plane_sound = None
+        # music.MusicManager, created after the first frame (starts decoding the game's tracks)
+        self.music = None
 
-            # Load drop sound: prefer drop_thud.mp3 -> drop_thud.wav -> assets/impact-258054.mp3
-            if os.path.exists(drop_mp3):
-                try:
-                    print(f"intro: loading drop sound from {drop_mp3}")
-                    self.drop_sound = pygame.mixer.Sound(drop_mp3)
-                    try:
-                        from settings import SOUND_VOLUME, SOUND_MUTED
-                    except Exception:
-                        SOUND_VOLUME = 1.0; SOUND_MUTED = False
-                    vol = 0.95 * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
-                    self.drop_sound.set_volume(vol)
-                except Exception:
-                    print("intro: failed to load drop_thud.mp3")
-                    self.drop_sound = None
-            elif os.path.exists(drop_wav):
-                try:
-                    print(f"intro: loading drop sound from {drop_wav}")
-                    self.drop_sound = pygame.mixer.Sound(drop_wav)
-                    try:
-                        from settings import SOUND_VOLUME, SOUND_MUTED
-                    except Exception:
-                        SOUND_VOLUME = 1.0; SOUND_MUTED = False
-                    vol = 0.95 * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
-                    self.drop_sound.set_volume(vol)
-                except Exception:
-                    print("intro: failed to load drop_thud.wav")
-                    self.drop_sound = None
-            else:
-                impact_mp3 = os.path.join(base, 'impact-258054.mp3')
-                if os.path.exists(impact_mp3):
-                    try:
-                        print(f"intro: loading fallback drop sound from {impact_mp3}")
-                        self.drop_sound = pygame.mixer.Sound(impact_mp3)
-                        self.drop_sound.set_volume(0.9)
-                    except Exception:
-                        print("intro: failed to load fallback impact mp3")
-                        self.drop_sound = None
+        # decode what the intro draws on the preload pool; run() draws straight
+        # away and picks images and sounds up as they become ready
+        keys = [(self.plane_name, self.plane_size), ('can.png', (CAN_HINT_SIZE, CAN_HINT_SIZE))]
+        keys += [(name, (DROP_SIZE, DROP_SIZE)) for name in (self.coin_name, self.health_name, self.bomb_name) if name]
+        assets.prefetch(keys)
+        sound_files = [f[0] for f in (self._plane_sound_file, self._drop_sound_file) if f]
+        try:
+            import drop as drop_module
+            sound_files += drop_module.sound_paths()
         except Exception:
-            self.plane_sound = None
-            self.drop_sound = None
+            pass
+        preload.prefetch_sounds(sound_files)
         # fade control state
         self.plane_fade_start = None
         self.PLANE_FADE_MS = 800
+
+    def _prefetch_game_sprites(self):
+        """Start decoding the game's atlas sprites (after the first intro frame:
+        without baked assets their sizes need the source images)."""
+        try:
+            import drop as drop_module
+            import player as player_module
+            import ui as ui_module
+            assets.prefetch(drop_module.atlas_keys() + ui_module.atlas_keys() + player_module.atlas_keys())
+        except Exception:
+            pass
+
+    @staticmethod
+    def _pick_sound(*candidates):
+        """First (path, volume, use_global_volume) whose file exists, or None."""
+        for cand in candidates:
+            if os.path.exists(cand[0]):
+                return cand
+        return None
+
+    def _take_sound(self, what, cand):
+        """Load a picked sound (prefetched if possible) at its volume; None on failure."""
+        path, vol, scaled = cand
+        try:
+            print(f"intro: loading {what} sound from {path}")
+            snd = preload.sound(path)
+            if scaled:
+                try:
+                    from settings import SOUND_VOLUME, SOUND_MUTED
+                except Exception:
+                    SOUND_VOLUME = 1.0; SOUND_MUTED = False
+                vol = vol * (0.0 if SOUND_MUTED else float(SOUND_VOLUME))
+            snd.set_volume(vol)
+            if what == 'plane':
+                # store base plane volume for fade calculations
+                self._plane_base_vol = vol
+            return snd
+        except Exception:
+            print(f"intro: failed to load {what} sound {path}")
+            return None
+
+    def _poll_sounds(self):
+        """Pick up background-decoded sounds; returns True when the plane sound just arrived."""
+        arrived = False
+        if self._plane_sound_file is not None and preload.sound_ready(self._plane_sound_file[0]):
+            self.plane_sound = self._take_sound('plane', self._plane_sound_file)
+            self._plane_sound_file = None
+            arrived = self.plane_sound is not None
+        if self._drop_sound_file is not None and preload.sound_ready(self._drop_sound_file[0]):
+            self.drop_sound = self._take_sound('drop', self._drop_sound_file)
+            self._drop_sound_file = None
+        return arrived
+
     def run(self):
-        # prepare plane surface
-        plane = self.plane_img
-        if plane is None:
-            # fallback simple plane
-            plane = pygame.Surface((140, 80), pygame.SRCALPHA)
-            pygame.draw.polygon(plane, (40, 120, 140), [(0, 40), (110, 10), (130, 40), (110, 70)])
-        # scale plane down so it flies in the sky area (smaller than player)
-        # changed to 0.3 to use 30% of original size and placed at the very top of the screen
-        SCALE = 0.3
-        plane = pygame.transform.smoothscale(plane, (int(plane.get_width() * SCALE), int(plane.get_height() * SCALE)))
-        plane_w, plane_h = plane.get_width(), plane.get_height()
+        # the plane sprite arrives from the preload pool; until then it isn't drawn
+        plane_key = (self.plane_name, self.plane_size)
+        plane = None
+        plane_w, plane_h = self.plane_size
         plane_x = -plane_w
         # position plane at the very top of the screen
         plane_y = 0
@@ -181,16 +159,20 @@ class Intro:
         button_rect = None
         show_button = False
         dark_shown_at = None
-        # play looping plane sound if available
         plane_channel = None
-        try:
-            if self.plane_sound is not None:
-                plane_channel = self.plane_sound.play(loops=-1)
-                # some pygame builds return None for channel; guard usage later
-        except Exception:
-            plane_channel = None
+        first_frame = True
 
         while running:
+            # convert finished image decodes; start the looping plane sound once it's loaded
+            assets.pump()
+            if plane is None and assets.ready(*plane_key):
+                plane = assets.scaled(*plane_key)
+            if self._poll_sounds():
+                try:
+                    plane_channel = self.plane_sound.play(loops=-1)
+                    # some pygame builds return None for channel; guard usage later
+                except Exception:
+                    plane_channel = None
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
@@ -238,15 +220,16 @@ class Intro:
             draw_background(self.screen, WIDTH, HEIGHT)
 
             # draw plane
-            self.screen.blit(plane, (plane_x, plane_y))
+            if plane is not None:
+                self.screen.blit(plane, (plane_x, plane_y))
             # Draw centered game title during intro while plane is still on-screen
             try:
                 if plane_x <= WIDTH:
-                    title_surf = self.title_font.render('Airdrop Survival', True, (255, 240, 200))
+                    title_surf = fonts.render(self.title_font, 'Airdrop Survival', True, (255, 240, 200))
                     tx = WIDTH // 2 - title_surf.get_width() // 2
                     ty = HEIGHT // 2 - title_surf.get_height() // 2
                     # draw a subtle shadow for readability
-                    shadow = self.title_font.render('Airdrop Survival', True, (30, 30, 30))
+                    shadow = fonts.render(self.title_font, 'Airdrop Survival', True, (30, 30, 30))
                     self.screen.blit(shadow, (tx + 2, ty + 2))
                     self.screen.blit(title_surf, (tx, ty))
             except Exception:
@@ -274,24 +257,22 @@ class Intro:
                 dark_overlay.fill((0, 0, 0))
                 self.screen.blit(dark_overlay, (0, 0))
                 # Can icon (can.png) — move the icon and hint down slightly to vertically align with the buttons
-                can_img = _load_asset('can.png')
+                can_img = assets.scaled('can.png', (CAN_HINT_SIZE, CAN_HINT_SIZE))
                 if can_img:
-                    scale = int(DROP_SIZE * 1.5)
-                    can_img = pygame.transform.smoothscale(can_img, (scale, scale))
                     can_x = WIDTH // 2 - can_img.get_width() // 2
                     # Move down about 40 pixels (closer to center), aligning with the button group
                     can_y = HEIGHT // 2 - 80
                     self.screen.blit(can_img, (can_x, can_y))
                 # Hint text (only the objective). Move it down a bit so it sits closer to the can icon and button group
-                t1 = self.font.render('COLLECT 20 COINS FOR A CAN', True, (255, 230, 180))
+                t1 = fonts.render(self.font, 'COLLECT 20 COINS FOR A CAN', True, (255, 230, 180))
                 # Move from HEIGHT//2 - 20 to HEIGHT//2 + 10
                 self.screen.blit(t1, (WIDTH // 2 - t1.get_width() // 2, HEIGHT // 2 + 10))
                 # Don't show the movement hint in the intro (it will be shown in-game)
                 # Delay showing the button
                 if pygame.time.get_ticks() - dark_shown_at > 900:
                     # Use a larger font
-                    big_font = pygame.font.SysFont(None, 32)
-                    label = big_font.render('ENTER GAME', True, (10, 10, 10))
+                    big_font = fonts.get_font(None, 32)
+                    label = fonts.render(big_font, 'ENTER GAME', True, (10, 10, 10))
                     padx, pady = 20, 14  # increase inner padding
                     bw = label.get_width() + padx * 2
                     bh = label.get_height() + pady * 2
@@ -301,10 +282,17 @@ class Intro:
                     pygame.draw.rect(self.screen, (255, 230, 140), button_rect, border_radius=10)
                     pygame.draw.rect(self.screen, (60, 60, 60), button_rect, width=3, border_radius=10)
                     self.screen.blit(label, (bx + padx, by + pady - 1))
+                    if not show_button:
+                        preload.mark('intro_interactive', button=button_rect.center)
                     show_button = True
 
 
             pygame.display.flip()
+            if first_frame:
+                preload.first_frame()
+                first_frame = False
+                self._prefetch_game_sprites()
+                self.music = music.get_manager()
             self.clock.tick(60)
 
             # if plane completely leaves right and button not shown, force show
@@ -334,25 +322,22 @@ class Intro:
                         pass
         except Exception:
             pass
+        # the game BGM fades in under the plane's fade-out (started by Game if still decoding)
+        try:
+            if self.music is not None:
+                self.music.transition_to('bgm')
+        except Exception:
+            pass
 
     def _spawn_drops(self, cx, cy, drops):
         # spawn bomb (left), coin(center), health(right)
-        bomb = self.bomb_img = getattr(self, 'bomb_img', None)
-        coin = getattr(self, 'coin_img', None)
-        health = getattr(self, 'health_img', None)
+        bomb = self.bomb_name = getattr(self, 'bomb_name', None)
+        coin = getattr(self, 'coin_name', None)
+        health = getattr(self, 'health_name', None)
         # scale assets to DROP_SIZE to match in-game icons and ensure spacing
-        try:
-            sb = pygame.transform.smoothscale(bomb, (DROP_SIZE, DROP_SIZE)) if bomb else None
-        except Exception:
-            sb = bomb
-        try:
-            sc = pygame.transform.smoothscale(coin, (DROP_SIZE, DROP_SIZE)) if coin else None
-        except Exception:
-            sc = coin
-        try:
-            sh = pygame.transform.smoothscale(health, (DROP_SIZE, DROP_SIZE)) if health else None
-        except Exception:
-            sh = health
+        sb = assets.scaled(bomb, (DROP_SIZE, DROP_SIZE)) if bomb else None
+        sc = assets.scaled(coin, (DROP_SIZE, DROP_SIZE)) if coin else None
+        sh = assets.scaled(health, (DROP_SIZE, DROP_SIZE)) if health else None
 
         spacing = max(16, DROP_SIZE + 8)
         drops.append({'surf': sb, 'x': cx - spacing, 'y': cy, 'vy': 2.6, 'type': 'bomb'})
@@ -371,10 +356,10 @@ class Intro:
         """
         import random
 
-        assets = [
-            ('bomb', getattr(self, 'bomb_img', None)),
-            ('coin', getattr(self, 'coin_img', None)),
-            ('health', getattr(self, 'health_img', None))
+        choices = [
+            ('bomb', getattr(self, 'bomb_name', None)),
+            ('coin', getattr(self, 'coin_name', None)),
+            ('health', getattr(self, 'health_name', None))
         ]
         count = random.randint(2, 4)
         # use horizontal spacing based on DROP_SIZE to avoid overlap
@@ -382,18 +367,14 @@ class Intro:
         # center the set around cx
         start = - (count - 1) * 0.5 * spacing
         for i in range(count):
-            kind, surf = random.choice(assets)
+            kind, name = random.choice(choices)
             # small jitter on top of spaced positions
             jitter = random.randint(-8, 8)
             pos_x = int(cx + start + i * spacing + jitter)
             # initial vy moderate so items fall at similar pace to game
             vy = random.uniform(1.2, 2.0)
-            # scale surf to DROP_SIZE if available
-            s = None
-            try:
-                s = pygame.transform.smoothscale(surf, (DROP_SIZE, DROP_SIZE)) if surf else None
-            except Exception:
-                s = surf
+            # cached copy already scaled to DROP_SIZE (None if the asset is missing)
+            s = assets.scaled(name, (DROP_SIZE, DROP_SIZE)) if name else None
             drops.append({
                 'surf': s,
                 'x': pos_x,
@@ -1,6 +1,12 @@
 # src/main.py
 
-from game import Game
+import time
+
+# taken before the heavy imports so time-to-first-frame covers them
+STARTED = time.perf_counter()
+
+import preload  # noqa: E402
+from game import Game  # noqa: E402
 try:
     from intro import Intro
 except Exception:
@@ -13,6 +19,13 @@ except Exception:
 
 
 if __name__ == "__main__":
+    preload.START = STARTED
+    # --trace[=path]: record per-phase frame timings and write a Chrome trace on exit
+    import os
+    import sys
+    for arg in sys.argv[1:]:
+        if arg == '--trace' or arg.startswith('--trace='):
+            os.environ['AIRDROP_TRACE'] = arg.partition('=')[2] or 'airdrop_trace.json'
     # Only play Intro the first time (unless state is missing, then behave like before)
     played_intro = False
     if state is not None and Intro is not None:
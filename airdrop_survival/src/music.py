@@ -0,0 +1,225 @@
+# src/music.py
+# Music tracks decoded ahead of time and switched with non-blocking crossfades (transition_to)
+
+import io
+import os
+
+import pygame
+
+import preload
+from soundbank import release_channels, reserve_channels
+
+try:
+    from settings import SOUND_VOLUME, SOUND_MUTED
+except Exception:
+    SOUND_VOLUME = 1.0
+    SOUND_MUTED = False
+try:
+    from settings import MUSIC_FADE_MS
+except Exception:
+    MUSIC_FADE_MS = 800
+
+_SOUNDS_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds')
+
+
+def _bgm_path():
+    """The user's bgm.mp3, else the synthesized urgent BGM (may synthesize it)."""
+    preferred = os.path.join(_SOUNDS_DIR, 'bgm.mp3')
+    if os.path.exists(preferred):
+        return preferred
+    from audio import ensure_urgent_bgm
+    return ensure_urgent_bgm(os.path.join(_SOUNDS_DIR, 'urgent_bgm.wav'))
+
+
+# name -> (file in assets/sounds or a function returning a path, volume before
+# SOUND_VOLUME, streamed). Streamed tracks (the long BGM) play through
+# pygame.mixer.music from their file bytes read ahead of time; the short
+# stingers are decoded to Sounds in full.
+TRACKS = {
+    'bgm': (_bgm_path, 0.6, True),
+    'success': ('success.wav', 1.0, False),
+    'failure': ('failure.wav', 1.0, False),
+}
+
+
+def _prepare(source, stream):
+    """(path, Sound or None, file bytes or None) for a track; runs on the preload pool."""
+    path = source() if callable(source) else os.path.join(_SOUNDS_DIR, source)
+    if not path or not os.path.exists(path):
+        raise FileNotFoundError(path)
+    if not stream:
+        try:
+            return path, pygame.mixer.Sound(path), None
+        except Exception:
+            # e.g. a non-PCM WAV: streamed with mixer.music instead
+            pass
+    with open(path, 'rb') as f:
+        return path, None, f.read()
+
+
+class MusicManager:
+    """Plays one music track at a time and crossfades between them without blocking.
+
+    Tracks are prepared on the preload pool as soon as they are added, so
+    switching never reads or decodes a file on the game thread. Short
+    stingers are decoded to Sounds and played on two reserved channels
+    ("decks"); long tracks are streamed with pygame.mixer.music from their
+    file bytes, so a minutes-long BGM isn't held in memory as PCM. A file
+    that can't be decoded as a Sound is streamed too.
+
+    transition_to() starts the new track (on the idle deck, or the stream)
+    with a fade-in while the playing one fades out, so music and stingers
+    crossfade into each other. Both volume ramps are scheduled on the mixer
+    (fade_ms / fadeout), which applies them block by block in the audio
+    thread, so they keep running through frames that block (result
+    overlays, pygame.time.wait). There is only one stream: switching
+    between two streamed tracks cuts the old one instead.
+
+    A transition to a track still being prepared fades the current one out
+    at once and starts the new one from update() when it is ready; call
+    update() once per frame.
+    """
+
+    def __init__(self, fade_ms=None):
+        self.fade_ms = MUSIC_FADE_MS if fade_ms is None else int(fade_ms)
+        # name -> {'future', 'volume', 'path', 'sound', 'data'}
+        self._tracks = {}
+        self._decks = reserve_channels('music', 2)
+        # file object the stream is playing from (kept alive while it plays)
+        self._stream_src = None
+        # deck index (or 'stream') playing the current track
+        self._deck = None
+        self.current = None
+        # (name, fade_ms, loop) waiting for its decode
+        self._pending = None
+
+    def add(self, name, source, volume=1.0, stream=False):
+        """Register track `name` and start preparing it in the background (once)."""
+        if name in self._tracks:
+            return
+        vol = 0.0 if SOUND_MUTED else max(0.0, min(1.0, float(volume) * float(SOUND_VOLUME)))
+        self._tracks[name] = {'future': preload.submit(_prepare, source, stream), 'volume': vol,
+                              'path': None, 'sound': None, 'data': None}
+
+    def add_defaults(self):
+        for name, (source, volume, stream) in TRACKS.items():
+            self.add(name, source, volume, stream)
+        return self
+
+    def ready(self, name):
+        track = self._tracks.get(name)
+        return track is not None and track['future'].done()
+
+    def playing(self):
+        """True while the current track is audible (a one-shot track may have ended)."""
+        if self._deck == 'stream':
+            return pygame.mixer.music.get_busy()
+        return self._deck is not None and self._decks[self._deck].get_busy()
+
+    def transition_to(self, name, fade_ms=None, loop=True):
+        """Crossfade to track `name` (None: fade to silence) over `fade_ms`; returns at once.
+
+        Asking for the track that is already playing does nothing.
+        """
+        fade_ms = self.fade_ms if fade_ms is None else max(0, int(fade_ms))
+        if name is not None and name == self.current and self._pending is None and self.playing():
+            return
+        if name is not None and name not in self._tracks:
+            raise KeyError(f"unknown music track {name!r}")
+        self._fade_out(fade_ms)
+        self.current = name
+        self._pending = None if name is None else (name, fade_ms, loop)
+        self.update()
+
+    def stop(self, fade_ms=0):
+        self.transition_to(None, fade_ms)
+
+    def update(self):
+        """Start a pending track whose decode has finished (call once per frame)."""
+        if self._pending is None or not self.ready(self._pending[0]):
+            return
+        name, fade_ms, loop = self._pending
+        self._pending = None
+        track = self._tracks[name]
+        try:
+            if track['path'] is None:
+                track['path'], track['sound'], track['data'] = track['future'].result()
+            self._fade_in(track, fade_ms, -1 if loop else 0)
+        except Exception as e:
+            print(f"music: can't play {name}: {e}")
+            self._deck = None
+
+    def _fade_out(self, fade_ms):
+        if self._deck == 'stream':
+            if fade_ms > 0:
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
+        elif self._deck is not None:
+            ch = self._decks[self._deck]
+            if fade_ms > 0 and ch.get_busy():
+                ch.fadeout(fade_ms)
+            else:
+                ch.stop()
+        self._deck = None
+
+    def _fade_in(self, track, fade_ms, loops):
+        if track['sound'] is None:
+            # only one stream exists: a stream still fading out is cut here
+            self._stream_src = io.BytesIO(track['data'])
+            pygame.mixer.music.load(self._stream_src, os.path.splitext(track['path'])[1].lstrip('.'))
+            pygame.mixer.music.set_volume(track['volume'])
+            pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
+            self._deck = 'stream'
+            return
+        # the idle deck; if both are still busy (quick successive switches) cut the older fade
+        idle = [i for i, ch in enumerate(self._decks) if not ch.get_busy()]
+        deck = idle[0] if idle else 0
+        ch = self._decks[deck]
+        ch.stop()
+        ch.set_volume(1.0)
+        track['sound'].set_volume(track['volume'])
+        ch.play(track['sound'], loops=loops, fade_ms=fade_ms)
+        self._deck = deck
+
+    def close(self):
+        """Stop all music and release the decks."""
+        try:
+            self._fade_out(0)
+            for ch in self._decks:
+                ch.stop()
+        except Exception:
+            pass
+        release_channels('music')
+        self._tracks.clear()
+        self._pending = None
+        self.current = None
+
+
+_MANAGER = None
+
+
+def _reset():
+    # the manager's Sounds and decks belong to the mixer being shut down
+    global _MANAGER
+    if _MANAGER is not None:
+        _MANAGER.close()
+        _MANAGER = None
+
+
+pygame.register_quit(_reset)
+
+
+def get_manager():
+    """The shared MusicManager with TRACKS registered; None if the mixer isn't available.
+
+    A manager left over from a mixer that was shut down (mixer.quit) is
+    dropped and a new one built once the mixer is back.
+    """
+    global _MANAGER
+    if not pygame.mixer.get_init():
+        _MANAGER = None
+        return None
+    if _MANAGER is None:
+        _MANAGER = MusicManager().add_defaults()
+    return _MANAGER
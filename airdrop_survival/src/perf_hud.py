@@ -0,0 +1,141 @@
+# src/perf_hud.py
+# In-game performance overlay: FPS, frame-time percentiles and a rolling frame-time graph
+
+import time
+from array import array
+
+import pygame
+
+try:
+    from settings import PERF_HUD_WINDOW_SECONDS, PERF_HUD_REFRESH_MS
+except Exception:
+    PERF_HUD_WINDOW_SECONDS = 5
+    PERF_HUD_REFRESH_MS = 250
+
+# Key that shows/hides the overlay (handled in Game.handle_events)
+TOGGLE_KEY = pygame.K_F3
+# Frame times kept; enough for the stats window at up to 240 fps
+CAPACITY = 2048
+GRAPH_FRAMES = 120
+GRAPH_SIZE = (240, 48)
+# Graph full scale in ms; the guide line marks a 60 fps frame
+GRAPH_MAX_MS = 50.0
+TARGET_MS = 1000.0 / 60.0
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, int(round((len(sorted_values) - 1) * q / 100.0)))
+    return sorted_values[i]
+
+
+class PerfHud:
+    """Frame-time recorder plus an overlay panel rebuilt a few times per second.
+
+    record() is called once per frame (always on, so the numbers are warm
+    when the overlay is opened). draw() blits one cached panel surface; the
+    panel (text and graph) is only re-rendered every PERF_HUD_REFRESH_MS, so
+    showing it costs a single blit on most frames.
+    """
+
+    def __init__(self, font, window_seconds=PERF_HUD_WINDOW_SECONDS, refresh_ms=PERF_HUD_REFRESH_MS):
+        self.font = font
+        self.window_ms = float(window_seconds) * 1000.0
+        self.refresh_ms = float(refresh_ms)
+        self.visible = False
+        self._times = array('d', [0.0]) * CAPACITY
+        self._next = 0
+        self._count = 0
+        self._last = None
+        self._panel = None
+        self._built_at = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._panel = None
+
+    def record(self, now=None):
+        """Note the start of a frame (perf_counter seconds); stores the gap to the previous one."""
+        now = time.perf_counter() if now is None else now
+        if self._last is not None:
+            self._times[self._next] = (now - self._last) * 1000.0
+            self._next = (self._next + 1) % CAPACITY
+            if self._count < CAPACITY:
+                self._count += 1
+        self._last = now
+
+    def recent(self):
+        """Frame times (ms) covering the last window_ms, oldest first."""
+        out = []
+        total = 0.0
+        i = self._next
+        for _ in range(self._count):
+            i = (i - 1) % CAPACITY
+            ms = self._times[i]
+            out.append(ms)
+            total += ms
+            if total >= self.window_ms:
+                break
+        out.reverse()
+        return out
+
+    def stats(self):
+        frames = self.recent()
+        if not frames:
+            return {'fps': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'frames': frames}
+        ordered = sorted(frames)
+        return {
+            'fps': 1000.0 * len(frames) / max(1e-6, sum(frames)),
+            'p50': _percentile(ordered, 50),
+            'p95': _percentile(ordered, 95),
+            'p99': _percentile(ordered, 99),
+            'frames': frames,
+        }
+
+    def _build(self, drops, pops):
+        s = self.stats()
+        # rendered straight from the font, not via fonts.render: these strings
+        # change every refresh and would only churn the shared text cache
+        lines = [
+            f"FPS {s['fps']:5.1f}",
+            f"frame ms  p50 {s['p50']:5.1f}  p95 {s['p95']:5.1f}  p99 {s['p99']:5.1f}",
+            f"drops {drops}  pops {pops}",
+        ]
+        texts = [self.font.render(line, True, (235, 235, 235)) for line in lines]
+        pad = 6
+        gw, gh = GRAPH_SIZE
+        w = max([gw] + [t.get_width() for t in texts]) + pad * 2
+        h = sum(t.get_height() for t in texts) + gh + pad * 3
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = pad
+        for t in texts:
+            panel.blit(t, (pad, y))
+            y += t.get_height()
+        y += pad
+        graph = pygame.Rect(pad, y, gw, gh)
+        pygame.draw.rect(panel, (40, 40, 40, 200), graph)
+        frames = s['frames'][-GRAPH_FRAMES:]
+        bar_w = gw / float(GRAPH_FRAMES)
+        for k, ms in enumerate(frames):
+            bh = max(1, int(min(ms, GRAPH_MAX_MS) / GRAPH_MAX_MS * gh))
+            color = (90, 200, 90) if ms <= TARGET_MS * 1.2 else (230, 200, 60) if ms <= TARGET_MS * 2 else (230, 70, 60)
+            x = graph.left + int(k * bar_w)
+            pygame.draw.line(panel, color, (x, graph.bottom - 1), (x, graph.bottom - bh))
+        ty = graph.bottom - 1 - int(TARGET_MS / GRAPH_MAX_MS * gh)
+        pygame.draw.line(panel, (200, 200, 200), (graph.left, ty), (graph.right - 1, ty))
+        try:
+            panel = panel.convert_alpha()
+        except pygame.error:
+            pass
+        return panel
+
+    def draw(self, screen, drops=0, pops=0, topright=None):
+        """Blit the overlay (top-right corner unless `topright` is given); returns the rect drawn."""
+        now = time.perf_counter() * 1000.0
+        if self._panel is None or now - self._built_at >= self.refresh_ms:
+            self._panel = self._build(drops, pops)
+            self._built_at = now
+        dest = self._panel.get_rect(topright=topright or (screen.get_width() - 8, 8))
+        return screen.blit(self._panel, dest)
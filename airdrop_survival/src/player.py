@@ -1,37 +1,84 @@
 # src/player.py
 
 import pygame
-import os
+import assets
 from settings import PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, HEIGHT, WIDTH
 from settings import PLAYER_DRAW_SCALE, PLAYER_VERTICAL_RAISE
 
-_PLAYER_IMG = None
-_HURT_IMG = None
-_DEAD_IMG = None
+# Candidate image names per state; newer names first, older chara_* names as fallback
+_STATE_IMAGES = {
+    'normal': ('player.png',),
+    'hurt': ('player_hurt.png', 'chara_hurt.png'),
+    'dead': ('player_dead.png', 'chara_dead.png'),
+}
 
-def _load_player_images():
-    global _PLAYER_IMG, _HURT_IMG, _DEAD_IMG
-    base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-    base = os.path.normpath(base)
-    try:
-        _PLAYER_IMG = pygame.image.load(os.path.join(base, 'player.png')).convert_alpha()
-    except Exception:
-        _PLAYER_IMG = None
-    try:
-        # prefer user-supplied newer names, fall back to older ones
-        hurt_path = os.path.join(base, 'player_hurt.png')
-        if not os.path.exists(hurt_path):
-            hurt_path = os.path.join(base, 'chara_hurt.png')
-        _HURT_IMG = pygame.image.load(hurt_path).convert_alpha()
-    except Exception:
-        _HURT_IMG = None
+
+def sprite_draw_size(src_size, rect_size, draw_scale=PLAYER_DRAW_SCALE):
+    """Size a sprite is drawn at: aspect-fit inside rect_size, times draw_scale."""
+    iw, ih = src_size
+    rw, rh = rect_size
+    scale = min(rw / iw, rh / ih) * draw_scale
+    return max(1, int(iw * scale)), max(1, int(ih * scale))
+
+
+def atlas_keys():
+    """Sprite keys (name, size) for the normal/hurt/dead states, for packing into the atlas."""
+    keys = []
+    for candidates in _STATE_IMAGES.values():
+        name = assets.first(*candidates)
+        if name:
+            keys.append((name, sprite_draw_size(assets.size(name), (PLAYER_WIDTH, PLAYER_HEIGHT))))
+    return keys
+
+
+def outline_sprite(surf, color, width):
+    """Return a copy of `surf` padded by `width` px with a solid outline behind it.
+
+    The outline is the sprite's alpha mask dilated by a disk of radius
+    `width` (pygame.mask), so it follows the silhouette at any thickness.
+    """
+    width = max(0, int(width))
+    w, h = surf.get_size()
+    out = pygame.Surface((w + width * 2, h + width * 2), pygame.SRCALPHA)
     try:
-        dead_path = os.path.join(base, 'player_dead.png')
-        if not os.path.exists(dead_path):
-            dead_path = os.path.join(base, 'chara_dead.png')
-        _DEAD_IMG = pygame.image.load(dead_path).convert_alpha()
-    except Exception:
-        _DEAD_IMG = None
+        out = out.convert_alpha()
+    except pygame.error:
+        pass
+    out.fill((0, 0, 0, 0))
+    if width:
+        mask = pygame.mask.from_surface(surf)
+        grown = pygame.mask.Mask(out.get_size())
+        r2 = width * width
+        for dx in range(-width, width + 1):
+            for dy in range(-width, width + 1):
+                if dx * dx + dy * dy <= r2:
+                    grown.draw(mask, (width + dx, width + dy))
+        rgba = tuple(color)[:3] + (255,)
+        grown.to_surface(out, setcolor=rgba, unsetcolor=None)
+    out.blit(surf, (width, width))
+    return out
+
+
+def build_state_sprites(rect_size, draw_scale=PLAYER_DRAW_SCALE, outline=False, outline_color=(0, 0, 0), outline_width=0):
+    """Scale (and optionally outline) every available state sprite once.
+
+    Returns {state: Surface}; states whose image is missing are left out.
+    """
+    sprites = {}
+    for state, candidates in _STATE_IMAGES.items():
+        name = assets.first(*candidates)
+        if not name:
+            continue
+        surf = assets.scaled(name, sprite_draw_size(assets.size(name), rect_size, draw_scale))
+        if surf is None:
+            continue
+        if outline and outline_width > 0:
+            try:
+                surf = outline_sprite(surf, outline_color, outline_width)
+            except Exception:
+                pass
+        sprites[state] = surf
+    return sprites
 
 
 class Player:
@@ -42,8 +89,14 @@ class Player:
         self.outline_color = (0, 0, 0)  # black outline
         self.outline_width = 3  # outline width
         self.rect = pygame.Rect(x, y - PLAYER_VERTICAL_RAISE, PLAYER_WIDTH, PLAYER_HEIGHT)
-        if _PLAYER_IMG is None and _HURT_IMG is None and _DEAD_IMG is None:
-            _load_player_images()
+        # x at the previous simulation step, for interpolated drawing
+        self.prev_x = self.rect.x
+        # sprite size multiplier relative to the collision rect
+        self.draw_scale = PLAYER_DRAW_SCALE
+        # per-state sprites with the outline baked in; rebuilt by _state_sprites()
+        # whenever the outline settings or draw scale change
+        self._sprites = {}
+        self._sprites_key = None
 
         # overlay state (milliseconds timestamp)
         self.hurt_until = 0
@@ -53,58 +106,48 @@ class Player:
         # support arrow keys and A/D for left/right movement
         left_pressed = keys[pygame.K_LEFT] or keys[pygame.K_a]
         right_pressed = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+        self.prev_x = self.rect.x
         if left_pressed and self.rect.left > 0:
             self.rect.x -= PLAYER_SPEED
         if right_pressed and self.rect.right < WIDTH:
             self.rect.x += PLAYER_SPEED
 
-    def set_hurt(self, duration_seconds):
-        self.hurt_until = pygame.time.get_ticks() + int(duration_seconds * 1000)
+    def set_hurt(self, duration_seconds, now=None):
+        now = pygame.time.get_ticks() if now is None else now
+        self.hurt_until = now + int(duration_seconds * 1000)
+
+    def set_dead(self, duration_seconds, now=None):
+        now = pygame.time.get_ticks() if now is None else now
+        self.dead_until = now + int(duration_seconds * 1000)
+
+    def _state_sprites(self):
+        key = (self.rect.size, self.draw_scale, bool(self.outline), tuple(self.outline_color), int(self.outline_width))
+        if key != self._sprites_key:
+            self._sprites = build_state_sprites(self.rect.size, self.draw_scale, self.outline, self.outline_color, self.outline_width)
+            self._sprites_key = key
+        return self._sprites
 
-    def set_dead(self, duration_seconds):
-        self.dead_until = pygame.time.get_ticks() + int(duration_seconds * 1000)
+    def draw(self, screen, color, alpha=1.0, now=None):
+        """Draw the current state sprite (with optional outline); returns the rect covered.
 
-    def draw(self, screen, color):
+        `alpha` interpolates x between the previous and current simulation step;
+        `now` is the clock hurt/dead timers are compared against (wall clock if None).
+        """
         # choose which sprite to draw: dead > hurt > normal
-        now = pygame.time.get_ticks()
-        sprite = None
-        if now < self.dead_until and _DEAD_IMG:
-            sprite = _DEAD_IMG
-        elif now < self.hurt_until and _HURT_IMG:
-            sprite = _HURT_IMG
-        elif _PLAYER_IMG:
-            sprite = _PLAYER_IMG
-
-        if sprite:
-            # preserve aspect ratio: scale sprite to fit inside rect
-            iw, ih = sprite.get_width(), sprite.get_height()
-            rw, rh = self.rect.width, self.rect.height
-            # apply draw-scale multiplier so sprite can be visually larger than collision rect
-            scale = min(rw / iw, rh / ih) * PLAYER_DRAW_SCALE
-            target_w = max(1, int(iw * scale))
-            target_h = max(1, int(ih * scale))
-            surf = pygame.transform.smoothscale(sprite, (target_w, target_h))
-            # center the sprite on the player's rect
-            dest = surf.get_rect(center=self.rect.center)
-            # optional outline: draw a slightly enlarged filled version behind the sprite
-            if self.outline:
-                try:
-                    outline_surf = pygame.Surface((surf.get_width() + self.outline_width * 2, surf.get_height() + self.outline_width * 2), pygame.SRCALPHA)
-                    # draw the sprite's alpha as a mask by blitting the sprite multiple times in the outline color
-                    mask = surf.copy()
-                    mask.fill(self.outline_color + (0,), special_flags=pygame.BLEND_RGBA_MULT)
-                    # draw multiple shifted blits to create a solid outline
-                    ox, oy = self.outline_width, self.outline_width
-                    for dx in range(-self.outline_width, self.outline_width + 1, max(1, self.outline_width)):
-                        for dy in range(-self.outline_width, self.outline_width + 1, max(1, self.outline_width)):
-                            outline_surf.blit(mask, (ox + dx, oy + dy))
-                    # then blit the outline and the sprite onto the screen
-                    outline_pos = (dest.left - self.outline_width, dest.top - self.outline_width)
-                    screen.blit(outline_surf, outline_pos)
-                except Exception:
-                    # fallback: draw a simple rect behind the player
-                    back = pygame.Rect(dest.left - self.outline_width, dest.top - self.outline_width, surf.get_width() + self.outline_width * 2, surf.get_height() + self.outline_width * 2)
-                    pygame.draw.rect(screen, self.outline_color, back)
-            screen.blit(surf, dest.topleft)
-        else:
-            pygame.draw.rect(screen, color, self.rect)
+        now = pygame.time.get_ticks() if now is None else now
+        sprites = self._state_sprites()
+        surf = None
+        if now < self.dead_until:
+            surf = sprites.get('dead')
+        if surf is None and now < self.hurt_until:
+            surf = sprites.get('hurt')
+        if surf is None:
+            surf = sprites.get('normal')
+        rect = self.rect
+        if alpha < 1.0 and self.prev_x != rect.x:
+            rect = rect.copy()
+            rect.x = round(self.prev_x + (self.rect.x - self.prev_x) * alpha)
+        if surf is not None:
+            # center the sprite (plus its outline padding) on the player's rect
+            return screen.blit(surf, surf.get_rect(center=rect.center))
+        return pygame.draw.rect(screen, color, rect)
@@ -0,0 +1,113 @@
+# src/preload.py
+# Startup helpers: minimal pygame init, background decoding of images/sounds, time-to-first-frame
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+try:
+    from settings import PRELOAD_WORKERS, FIRST_FRAME_TARGET_MS
+except Exception:
+    PRELOAD_WORKERS = 2
+    FIRST_FRAME_TARGET_MS = 500
+
+# perf_counter() when startup began; main.py overwrites it with the time
+# taken before its own imports
+START = time.perf_counter()
+# startup milestone -> {'ms': ms since START, ...extra info}; first time only
+MARKS = {}
+
+_EXECUTOR = None
+# sound path -> Future[pygame.mixer.Sound]
+_SOUNDS = {}
+
+
+def init_subsystems(audio=True):
+    """Initialise only what the game uses (display, font and, with audio, the mixer).
+
+    pygame.init() would also bring up joystick, camera and the other
+    subsystems; they are never used and only add to startup time.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    if audio:
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+        except Exception:
+            # if mixer init fails, continue without sound
+            pass
+
+
+def submit(fn, *args):
+    """Run fn(*args) on the shared loader pool; returns a Future."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=max(1, PRELOAD_WORKERS), thread_name_prefix='preload')
+    return _EXECUTOR.submit(fn, *args)
+
+
+def _shutdown():
+    # let in-flight decodes finish before the mixer and display go away
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=True, cancel_futures=True)
+        _EXECUTOR = None
+    _SOUNDS.clear()
+
+
+pygame.register_quit(_shutdown)
+
+
+def prefetch_sounds(paths):
+    """Start decoding the existing files among `paths` in the background."""
+    if not pygame.mixer.get_init():
+        return
+    for path in paths:
+        if path and path not in _SOUNDS and os.path.exists(path):
+            _SOUNDS[path] = submit(pygame.mixer.Sound, path)
+
+
+def sound_ready(path):
+    """False only while a prefetched decode of `path` is still running."""
+    fut = _SOUNDS.get(path)
+    return fut is None or fut.done()
+
+
+def sound(path):
+    """pygame.mixer.Sound(path), taking the prefetched copy when there is one.
+
+    Waits for a decode still in flight; raises like Sound() if loading failed.
+    Each prefetched Sound is handed out once, later calls load it again.
+    """
+    fut = _SOUNDS.pop(path, None)
+    if fut is not None:
+        return fut.result()
+    return pygame.mixer.Sound(path)
+
+
+def mark(name, **info):
+    """Record startup milestone `name` (once) with optional extra info; returns its ms since START.
+
+    Used for 'first_frame', 'intro_interactive' and 'first_game_frame';
+    tools/bench_startup.py reads them.
+    """
+    entry = MARKS.get(name)
+    if entry is None:
+        entry = MARKS[name] = dict(info, ms=(time.perf_counter() - START) * 1000.0)
+    return entry['ms']
+
+
+def first_frame():
+    """Note that the first frame is on screen; logs the time since START once.
+
+    Returns the time-to-first-frame in ms.
+    """
+    if 'first_frame' in MARKS:
+        return MARKS['first_frame']['ms']
+    ms = mark('first_frame')
+    note = 'ok' if ms <= FIRST_FRAME_TARGET_MS else 'over target'
+    print(f"startup: first frame after {ms:.0f} ms (target {FIRST_FRAME_TARGET_MS} ms, {note})")
+    return ms
@@ -0,0 +1,47 @@
+# src/render.py
+# Dirty-rectangle presentation for the main game loop
+
+import pygame
+
+
+class DirtyRectRenderer:
+    """Restore and present only the screen areas that changed.
+
+    Each frame: begin_frame() copies the cached background back over every
+    rect drawn last frame, the caller draws and collects the rects it drew,
+    then present(rects) pushes old + new rects with display.update(). After
+    anything draws outside this scheme (modal overlays, full-screen fades)
+    call invalidate() so the next frame is a full background blit + flip.
+    """
+
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.background = background
+        self._bounds = screen.get_rect()
+        self._prev = []
+        self._full = True
+
+    def invalidate(self):
+        self._full = True
+
+    def begin_frame(self):
+        if self._full:
+            self.screen.blit(self.background, (0, 0))
+            return
+        bg = self.background
+        self.screen.blits([(bg, r, r) for r in self._prev], doreturn=False)
+
+    def present(self, rects):
+        drawn = []
+        for r in rects:
+            if r is None:
+                continue
+            r = self._bounds.clip(r)
+            if r.w and r.h:
+                drawn.append(r)
+        if self._full:
+            pygame.display.flip()
+            self._full = False
+        else:
+            pygame.display.update(self._prev + drawn)
+        self._prev = drawn
@@ -62,9 +62,9 @@ DROP_TIME_STAGE1_SCALE = 0.6
 # Per-level base speed increase (e.g. 0.10 means +10% base speed per level)
 LEVEL_SPEED_INCREASE_PER_LEVEL = 0.10
 
-# Spawn interval tuning (higher value => rarer spawns). This is used as the
-# upper bound in `random.randint(1, interval)` where a result of 1 spawns a drop.
-# The interval decreases over time to increase spawn frequency.
+# Spawn interval tuning (higher value => rarer spawns). The interval is the mean
+# number of simulation steps between spawns (a 1-in-interval chance per step,
+# sampled ahead of time by spawner.py). It decreases over time to increase spawn frequency.
 # Spawn interval tuning: higher value => rarer spawns. Increase base to
 # reduce overall spawn frequency slightly so coins are easier to notice.
 DROP_SPAWN_INTERVAL_BASE = 40
@@ -108,3 +108,62 @@ SOUND_MUTED = False
 # Whether to replay the Intro animation when returning to menu after a game session
 # If False, clicking Back to Menu -> ENTER GAME will start the game immediately without replaying the Intro.
 REPLAY_INTRO_ON_RETURN = False
+
+# Asset cache: maximum number of pre-scaled surfaces kept (least recently used are evicted)
+ASSET_CACHE_MAX_SURFACES = 128
+# Text cache: maximum number of rendered text surfaces kept (least recently used are evicted)
+TEXT_CACHE_MAX_SURFACES = 256
+
+# Rendering: when True the main loop restores and presents only changed rects
+# (pygame.display.update(rects)) instead of redrawing and flipping the full frame.
+# Helps most on low-power machines where a full-frame flip is the bottleneck.
+DIRTY_RECT_RENDERING = False
+
+# Fixed-timestep simulation: the game logic always advances in steps of
+# 1000 / SIM_TICK_RATE ms, independent of how fast frames are drawn. All speeds
+# above (PLAYER_SPEED, DROP_*_SPEED_*) and spawn intervals are per simulation step.
+SIM_TICK_RATE = 60
+SIM_STEP_MS = 1000.0 / SIM_TICK_RATE
+# Render frame-rate cap; lower it on weak machines without changing difficulty
+# (moving objects are interpolated between simulation steps)
+RENDER_FPS = 60
+# Longest frame the simulation catches up on; longer stalls are dropped
+MAX_FRAME_MS = 250
+
+# Drop storage: 'objects' keeps a list of Drop objects; 'numpy' keeps all drops in
+# NumPy arrays (drop_arrays.py) and moves/collides them in one vectorized step,
+# which scales better with hundreds of drops on screen. Requires numpy.
+DROP_ENGINE = 'objects'
+
+# Frame tracer (AIRDROP_TRACE=out.json or `python main.py --trace`): number of phase
+# spans kept in its ring buffer; the oldest are overwritten once it is full
+TRACE_BUFFER_EVENTS = 65536
+
+# Performance overlay (F3 in game): seconds of frame times behind the FPS and
+# p50/p95/p99 figures, and how often (ms) the overlay text and graph are redrawn
+PERF_HUD_WINDOW_SECONDS = 5
+PERF_HUD_REFRESH_MS = 250
+
+# Startup: threads decoding images and sounds in the background while the intro
+# is already drawing, and the time-to-first-frame target (ms from launch) that
+# main.py logs against ("startup: first frame after ...")
+PRELOAD_WORKERS = 2
+FIRST_FRAME_TARGET_MS = 500
+
+# Directory for generated audio (synthesized BGM and its variants, keyed by a
+# hash of the synthesis parameters, with an index.json); None = assets/cache/audio
+AUDIO_CACHE_DIR = None
+
+# Length (seconds) of the synthesized urgent BGM loop; it is generated block by
+# block, so minute-long non-repeating tracks cost no more memory than short ones
+URGENT_BGM_SECONDS = 8.0
+
+# Sound effects (soundbank.py): mixer channels reserved per category, so a burst
+# of pickups can't take the channels of explosions, and the time (ms) within
+# which a repeated trigger of the same sound is ignored
+SFX_CHANNEL_GROUPS = {'pickup': 4, 'hazard': 2}
+SFX_RETRIGGER_MS = 30
+
+# Music (music.py): default crossfade (ms) of transition_to(), e.g. the Intro's
+# plane fading into the game BGM; tracks are decoded in the background beforehand
+MUSIC_FADE_MS = 800
@@ -0,0 +1,168 @@
+# src/soundbank.py
+# Preloaded sound effects on reserved mixer channel groups, with per-sound voice caps and retrigger limits
+
+import time
+from collections import deque
+
+import pygame
+
+import preload
+
+try:
+    from settings import SFX_CHANNEL_GROUPS, SFX_RETRIGGER_MS
+except Exception:
+    SFX_CHANNEL_GROUPS = {'pickup': 4, 'hazard': 2}
+    SFX_RETRIGGER_MS = 30
+
+
+# key -> indices of the mixer channels reserve_channels() holds for it
+_reservations = {}
+
+
+def _apply_reservations():
+    # reserved channels are always the first ones: reserve up to the highest index held
+    top = max((i + 1 for held in _reservations.values() for i in held), default=0)
+    if pygame.mixer.get_num_channels() < top + 4:
+        # keep a few unreserved channels for plain Sound.play()
+        pygame.mixer.set_num_channels(top + 4)
+    pygame.mixer.set_reserved(top)
+
+
+def reserve_channels(key, n):
+    """Reserve `n` mixer channels for `key`; returns their Channel objects.
+
+    Reserved channels are never picked by Sound.play(). Asking again for
+    the same key returns the channels it already holds (re-reserved only if
+    `n` changed); release_channels() gives them back for reuse.
+    """
+    n = max(0, int(n))
+    held = _reservations.get(key)
+    if held is None or len(held) != n:
+        _reservations.pop(key, None)
+        taken = {i for other in _reservations.values() for i in other}
+        held = []
+        i = 0
+        while len(held) < n:
+            if i not in taken:
+                held.append(i)
+            i += 1
+        _reservations[key] = held
+    # also re-applies the reservation after the mixer was re-initialised
+    _apply_reservations()
+    return [pygame.mixer.Channel(i) for i in held]
+
+
+def release_channels(key):
+    """Give back the channels reserved for `key` (no-op if it holds none)."""
+    if _reservations.pop(key, None) is not None and pygame.mixer.get_init():
+        _apply_reservations()
+
+
+def _reset():
+    # a re-initialised mixer starts with no reserved channels
+    _reservations.clear()
+
+
+pygame.register_quit(_reset)
+
+
+class SoundBank:
+    """Named effects, each decoded once and played on its category's own channels.
+
+    Each category gets its own reserved mixer channels (reserve_channels),
+    so effects never compete with other categories, the music or
+    Sound.play() calls elsewhere (the Intro), and the number of voices mixed
+    at once is bounded by the group sizes however many triggers arrive.
+
+    play(name) is a no-op when the same sound was started less than
+    `retrigger_ms` ago. A sound already playing `max_voices` times, or a
+    group with no free channel, has its oldest voice stopped and reused.
+    """
+
+    def __init__(self, groups=None, retrigger_ms=None):
+        groups = dict(SFX_CHANNEL_GROUPS if groups is None else groups)
+        self.retrigger = (SFX_RETRIGGER_MS if retrigger_ms is None else retrigger_ms) / 1000.0
+        # name -> {'sound', 'group', 'max_voices', 'last', 'voices': deque[(started, Channel)]}
+        self._sounds = {}
+        self._groups = {}
+        self.closed = False
+        for group, n in groups.items():
+            self._groups[group] = reserve_channels(('sfx', group), n)
+
+    def load(self, name, path, group, volume=1.0, max_voices=2):
+        """Decode `path` (the prefetched copy if preload has one) as effect `name`; False if it fails."""
+        if group not in self._groups:
+            raise KeyError(f"unknown sound group {group!r}")
+        try:
+            sound = preload.sound(path)
+        except Exception:
+            return False
+        sound.set_volume(volume)
+        self._sounds[name] = {'sound': sound, 'group': group, 'max_voices': max(1, int(max_voices)),
+                              'last': None, 'voices': deque()}
+        return True
+
+    def has(self, name):
+        return name in self._sounds
+
+    def _free_channel(self, group):
+        for ch in self._groups[group]:
+            if not ch.get_busy():
+                return ch
+        return None
+
+    def _oldest_in_group(self, group):
+        oldest = None
+        for entry in self._sounds.values():
+            if entry['group'] == group and entry['voices']:
+                if oldest is None or entry['voices'][0][0] < oldest['voices'][0][0]:
+                    oldest = entry
+        return oldest
+
+    def play(self, name, loops=0, now=None):
+        """Start effect `name`; returns its Channel, or None if unknown, rate-limited or no channel."""
+        entry = self._sounds.get(name)
+        if entry is None:
+            return None
+        now = time.perf_counter() if now is None else now
+        if entry['last'] is not None and now - entry['last'] < self.retrigger:
+            return None
+        sound, voices = entry['sound'], entry['voices']
+        # forget voices that finished or whose channel was taken over
+        for v in list(voices):
+            if not v[1].get_busy() or v[1].get_sound() is not sound:
+                voices.remove(v)
+        if len(voices) >= entry['max_voices']:
+            ch = voices.popleft()[1]
+        else:
+            ch = self._free_channel(entry['group'])
+            if ch is None:
+                victim = self._oldest_in_group(entry['group'])
+                if victim is None:
+                    return None
+                ch = victim['voices'].popleft()[1]
+        ch.stop()
+        ch.play(sound, loops=loops)
+        voices.append((now, ch))
+        entry['last'] = now
+        return ch
+
+    def stop(self, name=None):
+        """Stop every voice of `name` (all effects with None)."""
+        entries = self._sounds.values() if name is None else [self._sounds.get(name)]
+        for entry in entries:
+            if entry is None:
+                continue
+            while entry['voices']:
+                _, ch = entry['voices'].popleft()
+                if ch.get_sound() is entry['sound']:
+                    ch.stop()
+
+    def close(self):
+        """Stop all effects and release the bank's channel groups."""
+        self.stop()
+        for group in self._groups:
+            release_channels(('sfx', group))
+        self._groups.clear()
+        self._sounds.clear()
+        self.closed = True
@@ -0,0 +1,90 @@
+# src/spawner.py
+# Event-driven drop spawning: sample when the next drop is due instead of rolling every step
+
+import heapq
+import math
+import random
+
+from settings import DROP_SPAWN_INTERVAL_BASE, DROP_SPAWN_INTERVAL_MIN, DROP_SPAWN_DECREASE_PER_MIN
+from settings import SIM_STEP_MS
+
+
+def spawn_interval(elapsed_seconds):
+    """Mean simulation steps between spawns at `elapsed_seconds` into a level."""
+    decrease = (elapsed_seconds / 60.0) * DROP_SPAWN_DECREASE_PER_MIN
+    return max(DROP_SPAWN_INTERVAL_MIN, int(DROP_SPAWN_INTERVAL_BASE - decrease))
+
+
+class SpawnScheduler:
+    """Spawn times for one level, sampled ahead and kept in a heap.
+
+    Equivalent to rolling a 1-in-spawn_interval() chance on every simulation
+    step: while the interval is constant the gap to the next spawn is
+    geometric, so it is sampled directly (inverse CDF). When a gap would
+    cross a step where the interval changes, sampling restarts there, which
+    is exact because the geometric distribution is memoryless.
+
+    Steps are counted from the level start; step n happens at n * step_ms.
+    """
+
+    def __init__(self, step_ms=SIM_STEP_MS, rng=random, lookahead=8):
+        self.step_ms = step_ms
+        self.rng = rng
+        self.lookahead = max(1, int(lookahead))
+        self.reset()
+
+    def reset(self):
+        """Start a new level: the first spawn roll is for step 1."""
+        self._heap = []
+        # first step not yet covered by a sampled gap
+        self._next_trial = 1
+
+    def _interval(self, step):
+        return spawn_interval(step * self.step_ms / 1000.0)
+
+    def _segment_end(self, step, interval):
+        """First step after `step` whose spawn interval differs from `interval`."""
+        if interval <= DROP_SPAWN_INTERVAL_MIN or DROP_SPAWN_DECREASE_PER_MIN <= 0:
+            return math.inf
+        # solve BASE - t/60 * DEC < interval for t, then fix float rounding
+        seconds = (DROP_SPAWN_INTERVAL_BASE - interval) * 60.0 / DROP_SPAWN_DECREASE_PER_MIN
+        end = max(step + 1, int(seconds * 1000.0 / self.step_ms))
+        while self._interval(end) == interval:
+            end += 1
+        while end - 1 > step and self._interval(end - 1) != interval:
+            end -= 1
+        return end
+
+    def _refill(self, upto):
+        # sample spawns until `lookahead` are queued and at least past `upto`
+        while len(self._heap) < self.lookahead or self._next_trial <= upto:
+            start = self._next_trial
+            interval = self._interval(start)
+            end = self._segment_end(start, interval)
+            if interval <= 1:
+                gap = 1
+            else:
+                u = 1.0 - self.rng.random()
+                gap = 1 + int(math.log(u) / math.log(1.0 - 1.0 / interval))
+            when = start + gap - 1
+            if when >= end:
+                # no spawn left in this segment; resample from where the rate changes
+                self._next_trial = end
+                continue
+            heapq.heappush(self._heap, when)
+            self._next_trial = when + 1
+
+    def due(self, step):
+        """Number of spawns scheduled at or before `step` (removed from the queue)."""
+        self._refill(step)
+        count = 0
+        heap = self._heap
+        while heap and heap[0] <= step:
+            heapq.heappop(heap)
+            count += 1
+        return count
+
+    def next_spawn(self):
+        """Step of the next scheduled spawn."""
+        self._refill(self._next_trial)
+        return self._heap[0]
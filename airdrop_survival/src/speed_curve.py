@@ -0,0 +1,70 @@
+# src/speed_curve.py
+# Drop fall-speed model compiled once per level (no pygame; usable from tools/)
+
+from settings import DROP_BASE_SPEED_MIN, DROP_BASE_SPEED_MAX, DROP_SPEED_INCREASE_PER_MIN
+from settings import DROP_TIME_SCALE_START, DROP_TIME_SCALE_RAMP_SEC, DROP_TIME_STAGE1_SEC, DROP_TIME_STAGE1_SCALE
+from settings import USE_PER_TYPE_SPEED_MULTIPLIERS, BOMB_SPEED_MULTIPLIER, COIN_SPEED_MULTIPLIER, HEALTH_SPEED_MULTIPLIER
+from settings import DROP_TYPES, SIM_STEP_MS
+
+
+def time_scale(elapsed_seconds):
+    """Slow-start multiplier: stage1 scale, then a ramp from DROP_TIME_SCALE_START to 1.0."""
+    if elapsed_seconds <= DROP_TIME_STAGE1_SEC:
+        return DROP_TIME_STAGE1_SCALE
+    ramp = float(DROP_TIME_SCALE_RAMP_SEC - DROP_TIME_STAGE1_SEC)
+    if ramp <= 0:
+        return 1.0
+    frac = min(1.0, (elapsed_seconds - DROP_TIME_STAGE1_SEC) / ramp)
+    return DROP_TIME_SCALE_START + (1.0 - DROP_TIME_SCALE_START) * frac
+
+
+def type_multipliers():
+    """Speed multiplier per drop type (per-type settings, or the legacy single multiplier)."""
+    mults = {t: BOMB_SPEED_MULTIPLIER for t in DROP_TYPES}
+    if USE_PER_TYPE_SPEED_MULTIPLIERS:
+        mults['coin'] = COIN_SPEED_MULTIPLIER
+        mults['health_pack'] = HEALTH_SPEED_MULTIPLIER
+    return mults
+
+
+class SpeedCurve:
+    """Fall speed (pixels per simulation step) as a function of time into a level.
+
+    speed = (base + increase(t)) * time_scale(t) * type_mult * level_mult, with
+    base uniform in [DROP_BASE_SPEED_MIN, DROP_BASE_SPEED_MAX]. Everything but
+    `base` is folded into a per-step table of (mul, add) so that
+    speed = (base * mul + add) * type_mult; times past the table fall back to
+    the closed form. Build one per level (level_speed_multiplier) and share it.
+    """
+
+    def __init__(self, level_speed_multiplier=1.0, duration_seconds=DROP_TIME_SCALE_RAMP_SEC, step_ms=SIM_STEP_MS):
+        self.level_speed_multiplier = float(level_speed_multiplier)
+        self.step_seconds = step_ms / 1000.0
+        self.multipliers = type_multipliers()
+        steps = int(max(duration_seconds, 0) / self.step_seconds) + 1
+        self._table = [self._factors(i * self.step_seconds) for i in range(steps + 1)]
+
+    def _factors(self, elapsed_seconds):
+        scale = time_scale(elapsed_seconds) * self.level_speed_multiplier
+        increase = (elapsed_seconds / 60.0) * DROP_SPEED_INCREASE_PER_MIN
+        return scale, increase * scale
+
+    def factors(self, elapsed_seconds):
+        """(mul, add) at `elapsed_seconds`, read from the table (nearest step)."""
+        i = int(elapsed_seconds / self.step_seconds + 0.5)
+        if 0 <= i < len(self._table):
+            return self._table[i]
+        return self._factors(elapsed_seconds)
+
+    def speed(self, elapsed_seconds, drop_type, base):
+        mul, add = self.factors(elapsed_seconds)
+        return (base * mul + add) * self.multipliers.get(drop_type, BOMB_SPEED_MULTIPLIER)
+
+    def expected_speed(self, elapsed_seconds, drop_type):
+        """Mean speed of a `drop_type` spawned at `elapsed_seconds`."""
+        return self.speed(elapsed_seconds, drop_type, (DROP_BASE_SPEED_MIN + DROP_BASE_SPEED_MAX) / 2.0)
+
+    def speed_range(self, elapsed_seconds, drop_type):
+        """(slowest, fastest) speed of a `drop_type` spawned at `elapsed_seconds`."""
+        return (self.speed(elapsed_seconds, drop_type, DROP_BASE_SPEED_MIN),
+                self.speed(elapsed_seconds, drop_type, DROP_BASE_SPEED_MAX))
@@ -0,0 +1,232 @@
+# src/synth.py
+# Block-based streaming synthesizer for the procedural BGM (numpy; pygame only for MixerStream)
+
+import os
+import wave
+
+import numpy as np
+
+import dsp
+
+# Samples per block produced by UrgentBgmSynth.blocks()
+BLOCK_SAMPLES = 4096
+# Gaussian values shared by the metallic hits (indexed by hit number and age)
+_HIT_NOISE_LEN = 1 << 16
+_TWO_PI = 2.0 * np.pi
+
+# Oscillator bank of the urgent BGM: (name, Hz)
+_OSCILLATORS = (
+    ('bass_lfo', 0.05), ('sub', 27.5), ('drone', 55.0), ('drone_beat', 58.5),
+    ('pulse', 2.8), ('low_a', 85.0), ('low_b', 95.0), ('low_lfo', 0.2),
+    ('kick', 60.0), ('kick_gate', 1.0), ('snare_gate', 4.0), ('shimmer_lfo', 0.15),
+    ('harm_a', 330.0), ('harm_b', 440.0), ('harm_lfo', 0.5), ('volume_lfo', 0.1),
+    ('detune', 55.0 * 0.997), ('hit_carrier', 900.0), ('hit_am', 60.0),
+)
+_OSC = {name: i for i, (name, _) in enumerate(_OSCILLATORS)}
+
+
+def _mix32(x):
+    """Integer hash (vectorized) used to vary the arpeggio per phrase."""
+    x = (x ^ (x >> 16)) * 0x45D9F3B & 0xFFFFFFFF
+    x = (x ^ (x >> 16)) * 0x45D9F3B & 0xFFFFFFFF
+    return x ^ (x >> 16)
+
+
+class UrgentBgmSynth:
+    """The urgent BGM as a stream of fixed-size float64 mono blocks.
+
+    All state needed to continue the signal lives on the instance: the
+    sample counter (which gives the oscillator phases and places arpeggio
+    steps and metallic hits, and so their envelopes), the noise generators,
+    the reverb delay line and the smoothing filter history. Memory use
+    therefore does not depend on how long the track is. Within a block the
+    arpeggio notes and hits are computed for all samples at once from the
+    sample positions.
+
+    `params` are audio.URGENT_BGM_PARAMS. Blocks are not normalized; see
+    render_wav() and MixerStream.
+    """
+
+    def __init__(self, params, block=BLOCK_SAMPLES):
+        self.params = params
+        self.sr = int(params['sample_rate'])
+        self.block = int(block)
+        seed = int(params['seed'])
+        noise_seeds = np.random.SeedSequence(seed).spawn(3)
+        self._snare_rng = np.random.default_rng(noise_seeds[0])
+        self._shimmer_rng = np.random.default_rng(noise_seeds[1])
+        self._hit_noise = np.random.default_rng(noise_seeds[2]).standard_normal(_HIT_NOISE_LEN)
+        self._freqs = [f for _, f in _OSCILLATORS]
+        self._bank = np.empty((len(_OSCILLATORS), self.block), dtype=np.float32)
+        self._n = 0
+        # arpeggio: one note per step, transposed per phrase of `arp_phrase` steps
+        self._step = max(1, int(self.sr * params['arp_step']))
+        self._arp_freqs = np.asarray(params['arp_freqs'], dtype=np.float64)
+        self._phrase = max(1, int(params.get('arp_phrase', 16)))
+        self._seed = seed & 0xFFFFFFFF
+        # metallic hits: every hit_interval, once per offset
+        self._hit_len = max(2, int(self.sr * params['hit_duration']))
+        self._hit_interval = float(params['hit_interval'])
+        self._hit_offsets = (0.0, 0.25)
+        # reverb delay line (input history) and smoothing FIR history
+        self._reverb = dsp.DelayLine(self.sr * params['reverb_delay'])
+        self._wet = np.empty(self.block)
+        kernel = np.hanning(32)
+        self._kernel = kernel / kernel.sum()
+        self._fir_hist = np.zeros(len(self._kernel) - 1)
+
+    def reset(self):
+        self.__init__(self.params, self.block)
+
+    def _oscillators(self, pos):
+        """sin() of every oscillator at sample positions `pos`, shape (oscillators, n).
+
+        Phases are taken from the sample counter rather than accumulated per
+        block: the rhythm gates test sin() > 0 right at zero crossings, and an
+        accumulated phase would flip them depending on the block size.
+        """
+        # phase reduced in float64, sin() in float32 (about 3x faster, error ~1e-7)
+        return dsp.osc_bank(self._bank[:, :len(pos)], self._freqs, self.sr, int(pos[0]))
+
+    def _arp(self, pos):
+        step = pos // self._step
+        age = pos - step * self._step
+        variation = _mix32((step // self._phrase + self._seed) & 0xFFFFFFFF) % len(self._arp_freqs)
+        k = step % len(self._arp_freqs)
+        freq = self._arp_freqs[(k + variation) % len(self._arp_freqs)] * (1.0 + 0.02 * (step % 3))
+        # phase from the absolute position keeps each note continuous across blocks
+        phase = (freq * pos / self.sr) % 1.0
+        env = np.exp(-3.0 * age / (self._step - 1))
+        return 0.09 * np.sin(_TWO_PI * phase) * env
+
+    def _hits(self, pos, carrier, am):
+        out = np.zeros(len(pos))
+        t = pos / self.sr
+        for j, offset in enumerate(self._hit_offsets):
+            m = np.floor((t - offset) / self._hit_interval)
+            start = ((offset + m * self._hit_interval) * self.sr).astype(np.int64)
+            age = pos - start
+            active = (m >= 0) & (age < self._hit_len)
+            if not active.any():
+                continue
+            hit_id = m.astype(np.int64) * len(self._hit_offsets) + j
+            idx = (hit_id * 7919 + age) % _HIT_NOISE_LEN
+            burst = self._hit_noise[idx] * np.exp(-5.0 * age / (self._hit_len - 1))
+            out += np.where(active, burst, 0.0)
+        return out * carrier * (1.0 + 0.3 * am) * 1.2
+
+    def next_block(self, n=None):
+        """Synthesize the next n (default: block) samples."""
+        n = self.block if n is None else min(int(n), self.block)
+        pos = self._n + np.arange(n, dtype=np.int64)
+        self._n += n
+        o = self._oscillators(pos)
+        s = lambda name: o[_OSC[name]]  # noqa: E731
+
+        bass_env = 0.6 + 0.4 * s('bass_lfo')
+        signal = (0.35 * s('sub') + 0.55 * s('drone') + 0.18 * s('drone_beat')) * bass_env
+        pulse = s('pulse')
+        signal += 0.28 * pulse * np.abs(pulse) ** 0.45
+        signal += self._arp(pos)
+        low = 0.2 * s('low_a') + 0.15 * s('low_b')
+        signal += low * (s('low_lfo') + 1.0) * 0.5
+        signal += 0.3 * s('kick') * (s('kick_gate') > 0)
+        signal += 0.15 * self._snare_rng.standard_normal(n) * (s('snare_gate') > 0)
+        signal += self._hits(pos, s('hit_carrier'), s('hit_am'))
+        signal += 0.08 * (self._shimmer_rng.standard_normal(n) * 0.4) * (s('shimmer_lfo') + 1.0)
+        harm = 0.1 * s('harm_a') + 0.08 * s('harm_b')
+        signal += harm * (s('harm_lfo') + 1.0) * 0.5
+        signal *= 0.85 + 0.15 * s('volume_lfo')
+
+        # reverb: add the input from `delay` samples ago (carried in the delay line)
+        wet = self._reverb.process(signal, self._wet[:n])
+        wet *= 0.3
+        signal += wet
+        # Hann smoothing as a streaming FIR
+        hist = np.concatenate((self._fir_hist, signal))
+        self._fir_hist = hist[-len(self._fir_hist):]
+        signal = np.convolve(hist, self._kernel, mode='valid')
+
+        signal += 0.06 * s('detune')
+        return signal
+
+    def blocks(self, total=None):
+        """Yield blocks until `total` samples (None: forever)."""
+        while total is None or self._n < total:
+            yield self.next_block(None if total is None else total - self._n)
+
+
+def total_samples(params):
+    return int(params['sample_rate'] * params['duration'])
+
+
+def render_wav(path, params, block=BLOCK_SAMPLES):
+    """Write the track as 16-bit mono WAV, peak-normalized to 0.95, block by block.
+
+    The peak is only known at the end, so blocks are first spilled as
+    float32 to a temporary file next to `path` and converted from there;
+    nothing but a block is held in memory however long the track is.
+    """
+    total = total_samples(params)
+    spill = path + '.f32'
+    try:
+        raw = np.memmap(spill, dtype=np.float32, mode='w+', shape=(max(1, total),))
+        peak = 0.0
+        i = 0
+        for b in UrgentBgmSynth(params, block).blocks(total):
+            raw[i:i + len(b)] = b
+            i += len(b)
+            peak = max(peak, float(np.max(np.abs(b))))
+        gain = 0.95 / peak if peak > 1e-9 else 1.0
+        with wave.open(path, 'wb') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(int(params['sample_rate']))
+            for i in range(0, total, block):
+                wf.writeframes(dsp.to_pcm16(raw[i:i + block], gain))
+        del raw
+    finally:
+        try:
+            os.remove(spill)
+        except OSError:
+            pass
+    return path
+
+
+class MixerStream:
+    """Play an endless synth on a pygame.mixer.Channel through its one-deep queue.
+
+    Call pump() every frame: whenever the channel has nothing queued, the
+    next `chunk_seconds` of audio are synthesized and queued. The synth must
+    run at the mixer's sample rate; `gain` replaces the peak normalization
+    of render_wav (a live stream has no known peak).
+    """
+
+    def __init__(self, synth, channel, gain=0.5, chunk_seconds=0.25):
+        import pygame
+        self._pygame = pygame
+        self.synth = synth
+        self.channel = channel
+        self.gain = float(gain)
+        freq, _, self.channels = pygame.mixer.get_init()
+        if freq != synth.sr:
+            raise ValueError(f"synth runs at {synth.sr} Hz but the mixer at {freq} Hz")
+        self.chunk = max(1, int(synth.sr * chunk_seconds))
+
+    def _next_sound(self):
+        parts = []
+        left = self.chunk
+        while left > 0:
+            b = self.synth.next_block(left)
+            parts.append(dsp.to_pcm16(b, self.gain, self.channels))
+            left -= len(b)
+        return self._pygame.mixer.Sound(buffer=b''.join(parts))
+
+    def pump(self):
+        if not self.channel.get_busy():
+            self.channel.play(self._next_sound())
+        if self.channel.get_queue() is None:
+            self.channel.queue(self._next_sound())
+
+    def stop(self):
+        self.channel.stop()
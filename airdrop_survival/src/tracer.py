@@ -0,0 +1,90 @@
+# src/tracer.py
+# Per-phase frame tracing into a fixed-size ring buffer, exported as Chrome trace JSON
+
+import json
+import os
+import time
+from array import array
+
+try:
+    from settings import TRACE_BUFFER_EVENTS
+except Exception:
+    TRACE_BUFFER_EVENTS = 65536
+
+# Environment variable naming the output file; main.py's --trace flag sets it too
+TRACE_ENV = 'AIRDROP_TRACE'
+
+# Phase ids recorded in the buffer (index into PHASES)
+FRAME, EVENTS, UPDATE, SPAWN, DROPS, POPS, LEVEL, DRAW, BACKGROUND, PLAYER, DROPS_DRAW, HUD, POPS_DRAW, HINT, PRESENT, TICK = range(16)
+PHASES = (
+    'frame', 'events', 'update', 'spawn', 'drop loop', 'pop pruning', 'level check',
+    'draw', 'background', 'player', 'drops', 'hud+countdown', 'pops', 'hint', 'present', 'clock.tick',
+)
+
+
+class FrameTracer:
+    """Records (phase, start, duration) spans into preallocated arrays.
+
+    Usage: t = tracer.now(); ...work...; t = tracer.span(PHASE, t) — span()
+    records from t to now and returns now so consecutive phases chain.
+    Spans nest by time (a phase recorded around others contains them).
+    Once `capacity` spans are recorded the oldest are overwritten.
+    """
+
+    def __init__(self, path, capacity=TRACE_BUFFER_EVENTS):
+        self.path = path
+        self.capacity = max(16, int(capacity))
+        self._phase = array('B', bytes(self.capacity))
+        self._start = array('q', [0]) * self.capacity
+        self._dur = array('q', [0]) * self.capacity
+        self._next = 0
+        self._count = 0
+        self._origin = time.perf_counter_ns()
+        self.now = time.perf_counter_ns
+
+    def span(self, phase, start):
+        end = self.now()
+        i = self._next
+        self._phase[i] = phase
+        self._start[i] = start
+        self._dur[i] = end - start
+        self._next = i + 1 if i + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+        return end
+
+    def events(self):
+        """Recorded spans oldest first as (phase_name, start_ns, duration_ns)."""
+        first = (self._next - self._count) % self.capacity
+        out = []
+        for k in range(self._count):
+            i = (first + k) % self.capacity
+            out.append((PHASES[self._phase[i]], self._start[i], self._dur[i]))
+        return out
+
+    def dump(self, path=None):
+        """Write the buffer as Chrome trace-event JSON (chrome://tracing, Perfetto)."""
+        path = path or self.path
+        origin = self._origin
+        trace = [{
+            'name': name, 'cat': 'game', 'ph': 'X', 'pid': 1, 'tid': 1,
+            'ts': (start - origin) / 1000.0, 'dur': dur / 1000.0,
+        } for name, start, dur in self.events()]
+        trace.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': 'main loop'}})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+        print(f"tracer: wrote {self._count} spans to {path}")
+        return path
+
+
+_TRACER = None
+
+
+def get_tracer():
+    """The shared tracer if tracing is enabled (AIRDROP_TRACE=path), else None."""
+    global _TRACER
+    if _TRACER is None:
+        path = os.environ.get(TRACE_ENV)
+        if path:
+            _TRACER = FrameTracer(path)
+    return _TRACER
@@ -1,18 +1,36 @@
 # src/ui.py
 
+from collections import OrderedDict
+
 import pygame
-import os
-from settings import WIDTH, HEIGHT, MAX_HEALTH
+import assets
+import fonts
+from settings import WIDTH, HEIGHT, MAX_HEALTH, LEVELS
 
-# Cached icon surfaces
+# Procedural fallback icons (registered with the asset cache as 'icon:heart'/'icon:coin')
 _HEART_ICON = None
 _COIN_ICON = None
-_IMG_COIN = None
-_IMG_HEALTH = None
-_IMG_STOMACH = None
-_STOMACH_ICON = None
-_IMG_BACKGROUND = None
-_IMG_CAN = None
+
+# Candidate asset names for each HUD image, in order of preference
+_COIN_IMAGES = ('money_icon.png', 'coin.png')
+_HEALTH_IMAGES = ('heart_icon.png', 'heart.png', 'life_icon.png', 'health_pack.png')
+_STOMACH_IMAGES = ('stomach.png', 'stomach_icon.png')
+_BACKGROUND_IMAGE = 'background.png'
+
+# Fully rendered backgrounds keyed by (width, height)
+_BACKGROUND_CACHE = {}
+
+# Sizes (px) the HUD and result panels draw their images at; tools/bake_assets.py
+# reads these so the baked sprites match exactly
+ICON_SIZE = 24
+CAN_ICON_SIZE = 40
+GOAL_COIN_SIZE = int(22 * 0.8)
+STOMACH_ICON_SIZE = 20
+RESULT_REWARD_SIZE = 96
+HINT_REWARD_SIZE = 72
+
+# Countdown turns red and blinks at or below this many seconds
+COUNTDOWN_WARNING_SECONDS = 5
 
 # Color constants used by the UI
 RED = (200, 30, 30)
@@ -20,57 +38,6 @@ GREEN = (50, 200, 50)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 
-def _load_status_images():
-    global _IMG_COIN, _IMG_HEALTH
-    global _IMG_BACKGROUND
-    global _IMG_STOMACH
-    base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-    base = os.path.normpath(base)
-    # try to load background
-    try:
-        pbg = os.path.join(base, 'background.png')
-        print(f"ui: loading background image from {pbg}")
-        _IMG_BACKGROUND = pygame.image.load(pbg).convert()
-    except Exception:
-        _IMG_BACKGROUND = None
-    def _try_load_alpha(candidates):
-        for name in candidates:
-            p = os.path.join(base, name)
-            try:
-                if os.path.exists(p):
-                    print(f"ui: loading image from {p}")
-                    return pygame.image.load(p).convert_alpha()
-            except Exception:
-                import traceback
-                print(f"ui: failed loading image from {p}")
-                traceback.print_exc()
-        return None
-
-    # coin image: prefer money_icon if available, then coin
-    _IMG_COIN = _try_load_alpha(['money_icon.png', 'coin.png'])
-
-    # health/heart image: prefer heart_icon if present, then heart, life_icon, then health_pack
-    _IMG_HEALTH = _try_load_alpha(['heart_icon.png', 'heart.png', 'life_icon.png', 'health_pack.png'])
-    # stomach image: accept stomach.png or stomach_icon.png
-    _IMG_STOMACH = _try_load_alpha(['stomach.png', 'stomach_icon.png'])
-    # can image for level reward
-    try:
-        can_path = os.path.join(base, 'can.png')
-        print(f"[can debug] can_path: {can_path}, exists: {os.path.exists(can_path)}")
-        if os.path.exists(can_path):
-            try:
-                _IMG_CAN = pygame.image.load(can_path).convert_alpha()
-                print("[can debug] can.png loaded successfully.")
-            except Exception as e:
-                print(f"[can debug] Failed to load can.png: {e}")
-                _IMG_CAN = None
-        else:
-            print("[can debug] can.png does not exist at path.")
-            _IMG_CAN = None
-    except Exception as e:
-        print(f"[can debug] Exception during can.png load: {e}")
-        _IMG_CAN = None
-
 def _create_icons(size=24):
     """Create simple heart and coin icon surfaces.
 
@@ -102,104 +69,274 @@ def _create_icons(size=24):
     return heart, coin
 
 
-def draw_status(screen, font, hearts, coins, hunger=None, time_left_seconds=None):
-    global _HEART_ICON, _COIN_ICON, _IMG_COIN, _IMG_HEALTH
-    if _IMG_COIN is None and _IMG_HEALTH is None:
-        _load_status_images()
-
+def _ensure_icons():
+    global _HEART_ICON, _COIN_ICON
     if _HEART_ICON is None or _COIN_ICON is None:
-        _HEART_ICON, _COIN_ICON = _create_icons(size=24)
+        _HEART_ICON, _COIN_ICON = _create_icons(size=ICON_SIZE)
+        assets.register('icon:heart', _HEART_ICON)
+        assets.register('icon:coin', _COIN_ICON)
+
+
+def atlas_keys():
+    """Sprite keys (name, size) the HUD draws with, for packing into the atlas."""
+    keys = []
+    health_name = assets.first(*_HEALTH_IMAGES)
+    if health_name:
+        keys.append((health_name, (ICON_SIZE, ICON_SIZE)))
+    coin_name = assets.first(*_COIN_IMAGES)
+    if coin_name:
+        keys.append((coin_name, (ICON_SIZE, ICON_SIZE)))
+        keys.append((coin_name, (GOAL_COIN_SIZE, GOAL_COIN_SIZE)))
+    stomach_name = assets.first(*_STOMACH_IMAGES)
+    if stomach_name:
+        keys.append((stomach_name, (STOMACH_ICON_SIZE, STOMACH_ICON_SIZE)))
+    if assets.exists('can.png'):
+        keys.append(('can.png', (CAN_ICON_SIZE, CAN_ICON_SIZE)))
+    return keys
+
+
+def _ellipse_icon(color, size):
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, color, (0, 0, size, size))
+    return surf
+
+
+def _status_items(font, hearts, coins, coins_required):
+    """Lay out hearts, coin count and the can/goal block as (surface, pos) pairs."""
+    _ensure_icons()
+    health_name = assets.first(*_HEALTH_IMAGES) or 'icon:heart'
+    coin_name = assets.first(*_COIN_IMAGES) or 'icon:coin'
+    items = []
 
     padding = 8
     x = 10
     y = 10
 
-    # Draw hearts: render MAX_HEALTH icons and dim ones above current hearts
+    # Hearts: render MAX_HEALTH icons and dim ones above current hearts
     heart_w = _HEART_ICON.get_width()
     heart_h = _HEART_ICON.get_height()
+    hs = assets.scaled(health_name, (heart_w, heart_h))
+    if hs is None:
+        # the image exists but didn't decode
+        hs = assets.scaled('icon:heart', (heart_w, heart_h))
+    dimmed = None
     for i in range(MAX_HEALTH):
         hx = x + i * (heart_w + 4)
-        if _IMG_HEALTH:
-            hs = pygame.transform.smoothscale(_IMG_HEALTH, (heart_w, heart_h))
-            if i < hearts:
-                screen.blit(hs, (hx, y))
-            else:
-                tmp = hs.copy()
-                tmp.fill((80, 80, 80, 150), special_flags=pygame.BLEND_RGBA_MULT)
-                screen.blit(tmp, (hx, y))
+        if i < hearts:
+            items.append((hs, (hx, y)))
         else:
-            if i < hearts:
-                screen.blit(_HEART_ICON, (hx, y))
-            else:
-                tmp = _HEART_ICON.copy()
-                tmp.fill((80, 80, 80, 150), special_flags=pygame.BLEND_RGBA_MULT)
-                screen.blit(tmp, (hx, y))
+            if dimmed is None:
+                dimmed = hs.copy()
+                dimmed.fill((80, 80, 80, 150), special_flags=pygame.BLEND_RGBA_MULT)
+            items.append((dimmed, (hx, y)))
 
     # move coins start to right of hearts block
     text_offset = MAX_HEALTH * (heart_w + 4)
 
-    # Blit coin icon and count (to the right of heart group)
+    # Coin icon and count (to the right of heart group)
     x2 = x + text_offset + padding * 2
-    if _IMG_COIN:
-        coin_s = pygame.transform.smoothscale(_IMG_COIN, (_COIN_ICON.get_width(), _COIN_ICON.get_height()))
-        screen.blit(coin_s, (x2, y))
-    else:
-        screen.blit(_COIN_ICON, (x2, y))
-    text2 = font.render(str(coins), True, BLACK)
-    screen.blit(text2, (x2 + _COIN_ICON.get_width() + 4, y + (_COIN_ICON.get_height() - text2.get_height()) // 2))
-
-
-    # ...existing code...
-
-    # Static can icon at top-right (always on top)
-    global _IMG_CAN
-    # Load the can image lazily on first use to avoid reloading every frame
-    if _IMG_CAN is None:
-        try:
-            base = os.path.join(os.path.dirname(__file__), '..', 'assets')
-            can_path = os.path.join(base, 'can.png')
-            if os.path.exists(can_path):
-                _IMG_CAN = pygame.image.load(can_path).convert_alpha()
-        except Exception:
-            _IMG_CAN = None
-    if _IMG_CAN is not None:
-        can_size = 40
-        can_img = pygame.transform.smoothscale(_IMG_CAN, (can_size, can_size))
-        can_x = WIDTH - can_size - 10
-        can_y = 10
-        screen.blit(can_img, (can_x, can_y))
-        # Draw "20" plus a coin icon under the can image
-    coin_size = int(22 * 0.8)
+    coin_s = assets.scaled(coin_name, _COIN_ICON.get_size())
+    if coin_s is None:
+        coin_s = assets.scaled('icon:coin', _COIN_ICON.get_size())
+    items.append((coin_s, (x2, y)))
+    text2 = fonts.render(font, str(coins), True, BLACK)
+    items.append((text2, (x2 + _COIN_ICON.get_width() + 4, y + (_COIN_ICON.get_height() - text2.get_height()) // 2)))
+
+    # Static can icon at top-right
+    can_size = CAN_ICON_SIZE
+    can_x = WIDTH - can_size - 10
+    can_y = 10
+    can_img = assets.scaled('can.png', (can_size, can_size))
+    if can_img is not None:
+        items.append((can_img, (can_x, can_y)))
+    # Coins required for the can, plus a coin icon, under the can image
+    coin_size = GOAL_COIN_SIZE
     coin_y = can_y + can_size + 4
-    coin_x = can_x + (can_size - coin_size) // 2 + 8
-    # Render black "20" in a small font
-    font_small = pygame.font.SysFont(None, 22)
-    label_surface = font_small.render("20", True, (0, 0, 0))
+    font_small = fonts.get_font(None, 22)
+    label_surface = fonts.render(font_small, str(coins_required), True, (0, 0, 0))
     space = 6  # gap spacing
     label_x = can_x + (can_size - coin_size) // 2 - label_surface.get_width() + 8
     label_y = coin_y + (coin_size - label_surface.get_height()) // 2
-    screen.blit(label_surface, (label_x, label_y))
+    items.append((label_surface, (label_x, label_y)))
     coin_x = label_x + label_surface.get_width() + space
-        # Draw coin icon
-    # global declaration is at the top of this function
-    coin_img = None
-    if _IMG_COIN:
-        coin_img = pygame.transform.smoothscale(_IMG_COIN, (coin_size, coin_size))
-    elif _COIN_ICON:
-        coin_img = pygame.transform.smoothscale(_COIN_ICON, (coin_size, coin_size))
+    coin_img = assets.scaled(coin_name, (coin_size, coin_size))
+    if coin_img is None:
+        coin_img = assets.scaled('icon:coin', (coin_size, coin_size))
     if coin_img:
-        screen.blit(coin_img, (coin_x, coin_y))
+        items.append((coin_img, (coin_x, coin_y)))
+    return items
+
+
+def _countdown_items(font, secs, blink_on):
+    """Lay out the centered 'XX seconds until starvation' line as (surface, pos) pairs.
+
+    blink_on is None outside the warning window, else which blink phase to show.
+    """
+    text = f"{secs} seconds until starvation"
+
+    color_normal = (10, 10, 10)
+    color_warning_a = RED
+    color_warning_b = (80, 10, 10)
+
+    is_warning = blink_on is not None
+    if is_warning:
+        txt_color = color_warning_a if blink_on else color_warning_b
+    else:
+        txt_color = color_normal
+
+    txt = fonts.render(font, text, True, txt_color)
+
+    # a small stomach icon to the left of the text for clarity
+    icon_size = STOMACH_ICON_SIZE
+    gap = 8
+    # compute combined width (icon + gap + text)
+    total_w = icon_size + gap + txt.get_width()
+    x0 = WIDTH // 2 - total_w // 2
+    y = 10
+    icon_pos = (x0, y + (txt.get_height() - icon_size) // 2)
+    icon_s = None
+    # icon (also tinted slightly when warning)
+    stomach_name = assets.first(*_STOMACH_IMAGES)
+    if stomach_name:
+        try:
+            icon_s = assets.scaled(stomach_name, (icon_size, icon_size))
+            if is_warning:
+                # tint the icon by blending a red surface on top to emphasize
+                tint = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
+                tint.fill((255, 80, 80, 120))
+                icon_s = icon_s.copy()
+                icon_s.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        except Exception:
+            icon_s = _ellipse_icon((100, 150, 200), icon_size)
+    else:
+        icon_s = _ellipse_icon((200, 60, 60) if is_warning else (100, 150, 200), icon_size)
+
+    return [(icon_s, icon_pos), (txt, (x0 + icon_size + gap, y))]
+
+
+def _blink_phase(secs):
+    """None when not warning, else True/False for the 400 ms blink of the last seconds."""
+    if secs is None or secs > COUNTDOWN_WARNING_SECONDS:
+        return None
+    return ((pygame.time.get_ticks() // 400) % 2) == 0
+
+
+def _items_rect(items):
+    rect = None
+    for surf, pos in items:
+        r = surf.get_rect(topleft=pos)
+        rect = r if rect is None else rect.union(r)
+    return rect
+
+
+def _compose(items):
+    """Flatten (surface, pos) items into one SRCALPHA surface; returns (surface, screen rect)."""
+    rect = _items_rect(items)
+    surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+    surf.blits([(s, (x - rect.x, y - rect.y)) for s, (x, y) in items], doreturn=False)
+    return surf, rect
+
+
+class StatusHud:
+    """Retained-mode HUD: hearts, coins, goal and the starvation countdown.
+
+    The HUD is composed into one surface, rebuilt only when hearts, coins,
+    coins_required, the displayed second or the warning blink phase change;
+    both blink phases stay cached, so toggling is free. Every frame is a
+    single blit of that surface.
+    """
+
+    MAX_LAYOUTS = 4
+
+    def __init__(self, font):
+        self.font = font
+        self._layouts = OrderedDict()
+        self._countdowns = OrderedDict()
+
+    def invalidate(self):
+        self._layouts.clear()
+        self._countdowns.clear()
+
+    def _remember(self, cache, key, value):
+        cache[key] = value
+        while len(cache) > self.MAX_LAYOUTS:
+            cache.popitem(last=False)
+        return value
+
+    def countdown(self, seconds_left):
+        """Return the countdown items for this second and blink phase (cached)."""
+        secs = max(0, int(seconds_left))
+        key = (secs, _blink_phase(secs))
+        items = self._countdowns.get(key)
+        if items is not None:
+            self._countdowns.move_to_end(key)
+            return items
+        return self._remember(self._countdowns, key, _countdown_items(self.font, secs, key[1]))
+
+    def layout(self, hearts, coins, coins_required=None, seconds_left=None):
+        """Return (surface, rect) for this HUD state, composing it on first use."""
+        if coins_required is None:
+            coins_required = _default_coins_required()
+        secs = None if seconds_left is None else max(0, int(seconds_left))
+        key = (hearts, coins, coins_required, secs, _blink_phase(secs))
+        cached = self._layouts.get(key)
+        if cached is not None:
+            self._layouts.move_to_end(key)
+            return cached
+        items = _status_items(self.font, hearts, coins, coins_required)
+        if secs is not None:
+            try:
+                items = items + self.countdown(secs)
+            except Exception:
+                pass
+        return self._remember(self._layouts, key, _compose(items))
+
+    def draw(self, screen, hearts, coins, coins_required=None, seconds_left=None):
+        """Draw the HUD; returns the screen rect it covers."""
+        surf, rect = self.layout(hearts, coins, coins_required, seconds_left)
+        screen.blit(surf, rect)
+        return rect
+
+
+def _default_coins_required():
+    try:
+        return LEVELS[0].get('coins_required', 20)
+    except Exception:
+        return 20
+
+
+# One retained HUD per font for the module-level draw_* helpers
+_HUDS = {}
+
+
+def _hud_for(font):
+    hud = _HUDS.get(font)
+    if hud is None:
+        hud = StatusHud(font)
+        _HUDS[font] = hud
+    return hud
+
+
+def draw_status(screen, font, hearts, coins, hunger=None, time_left_seconds=None, coins_required=None):
+    return _hud_for(font).draw(screen, hearts, coins, coins_required)
 
 
 def draw_gameover(screen, font, message, color):
-    text = font.render(message, True, color)
+    text = fonts.render(font, message, True, color)
     screen.blit(text, (400 - text.get_width() // 2, 300))
     pygame.display.flip()
     pygame.time.wait(3000)
 
 
+def _reward_surface(reward_image, size):
+    """Scale a reward image given either as an asset name or as a surface."""
+    if isinstance(reward_image, str):
+        return assets.scaled(reward_image, size)
+    return pygame.transform.smoothscale(reward_image, size)
+
+
 def draw_level_result(screen, font, message, success=True, reward_image=None):
-    """Display an end-of-level message. If success, show the reward_image (surface or None).
+    """Display an end-of-level message. If success, show the reward_image (asset name, surface or None).
 
     Blocks briefly to let the player read the message.
     """
@@ -209,12 +346,12 @@ def draw_level_result(screen, font, message, success=True, reward_image=None):
     screen.blit(overlay, (0, 0))
 
     color = GREEN if success else RED
-    text = font.render(message, True, color)
+    text = fonts.render(font, message, True, color)
     screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - 40))
 
     if success and reward_image is not None:
         try:
-            img_s = pygame.transform.smoothscale(reward_image, (96, 96))
+            img_s = _reward_surface(reward_image, (RESULT_REWARD_SIZE, RESULT_REWARD_SIZE))
             screen.blit(img_s, (WIDTH // 2 - img_s.get_width() // 2, HEIGHT // 2 + 10))
         except Exception:
             pass
@@ -233,12 +370,12 @@ def draw_level_start_hint(screen, font, coins_required, reward_text, reward_imag
     screen.blit(overlay, (0, 0))
 
     text = f"{coins_required} coins for {reward_text}"
-    txt = font.render(text, True, (255, 230, 180))
+    txt = fonts.render(font, text, True, (255, 230, 180))
     screen.blit(txt, (WIDTH // 2 - txt.get_width() // 2, HEIGHT // 2 - 30))
 
     if reward_image is not None:
         try:
-            img_s = pygame.transform.smoothscale(reward_image, (72, 72))
+            img_s = _reward_surface(reward_image, (HINT_REWARD_SIZE, HINT_REWARD_SIZE))
             screen.blit(img_s, (WIDTH // 2 - img_s.get_width() // 2, HEIGHT // 2 + 10))
         except Exception:
             pass
@@ -247,18 +384,32 @@ def draw_level_start_hint(screen, font, coins_required, reward_text, reward_imag
     pygame.time.wait(duration_ms)
 
 
-def draw_background(screen, width, height):
-    """Draw background: prefer loaded image, otherwise procedural gradient + ground."""
-    global _IMG_BACKGROUND
-    if _IMG_BACKGROUND is None:
-        # attempt to load status images (which also tries background)
-        _load_status_images()
+def _sky_gradient_column(sky_height, top_color, mid_color):
+    """Return a 1 x sky_height surface holding the top -> mid sky gradient."""
+    column = pygame.Surface((1, sky_height))
+    try:
+        import numpy as _np
+        from pygame import surfarray
+        t = _np.arange(sky_height, dtype=_np.float64) / max(sky_height - 1, 1)
+        top = _np.array(top_color, dtype=_np.float64)
+        mid = _np.array(mid_color, dtype=_np.float64)
+        rows = (top[None, :] * (1 - t)[:, None] + mid[None, :] * t[:, None]).astype(_np.int32)
+        surfarray.blit_array(column, rows[None, :, :])
+    except Exception:
+        for y in range(sky_height):
+            t = y / max(sky_height - 1, 1)
+            column.set_at((0, y), tuple(int(top_color[i] * (1 - t) + mid_color[i] * t) for i in range(3)))
+    return column
+
 
-    if _IMG_BACKGROUND:
+def _render_background(width, height):
+    """Render the full background once: image if present, else gradient sky + ground."""
+    # the asset cache remembers a missing background.png, so this only probes disk once
+    if assets.first(_BACKGROUND_IMAGE):
         try:
-            bg = pygame.transform.smoothscale(_IMG_BACKGROUND, (width, height))
-            screen.blit(bg, (0, 0))
-            return
+            bg = assets.scaled(_BACKGROUND_IMAGE, (width, height), alpha=False)
+            if bg is not None:
+                return bg
         except Exception:
             pass
 
@@ -270,69 +421,42 @@ def draw_background(screen, width, height):
 
     sky_height = int(height * 0.75)
 
-    # Draw sky gradient: top -> mid over sky_height
-    for y in range(sky_height):
-        t = y / max(sky_height - 1, 1)
-        r = int(top_color[0] * (1 - t) + mid_color[0] * t)
-        g = int(top_color[1] * (1 - t) + mid_color[1] * t)
-        b = int(top_color[2] * (1 - t) + mid_color[2] * t)
-        pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
+    surf = pygame.Surface((width, height))
+    try:
+        surf = surf.convert()
+    except pygame.error:
+        pass
+    # Sky gradient: build one column (vectorized with numpy when available) and
+    # stretch it horizontally; nearest-neighbour scaling keeps every row's exact color
+    if sky_height > 0:
+        column = _sky_gradient_column(sky_height, top_color, mid_color)
+        surf.blit(pygame.transform.scale(column, (width, sky_height)), (0, 0))
 
     # Ground
-    pygame.draw.rect(screen, ground_color, (0, sky_height, width, height - sky_height))
+    pygame.draw.rect(surf, ground_color, (0, sky_height, width, height - sky_height))
+    return surf
+
+
+def get_background(width, height):
+    """Return the cached background surface for this resolution (rendered on first use)."""
+    key = (width, height)
+    bg = _BACKGROUND_CACHE.get(key)
+    if bg is None:
+        bg = _render_background(width, height)
+        _BACKGROUND_CACHE[key] = bg
+    return bg
+
+
+def draw_background(screen, width, height):
+    """Draw background: prefer loaded image, otherwise procedural gradient + ground."""
+    screen.blit(get_background(width, height), (0, 0))
 
 
 def draw_center_countdown(screen, font, seconds_left):
     """Draw a centered countdown message in English: 'XX seconds until starvation'"""
     try:
-        # Prepare display text
-        secs = 0 if seconds_left is None else max(0, int(seconds_left))
-        text = f"{secs} seconds until starvation"
-
-        # Low-time visual warning: when <= WARNING_THRESHOLD, flash/change color
-        WARNING_THRESHOLD = 5
-        color_normal = (10, 10, 10)
-        color_warning_a = RED if 'RED' in globals() else (200, 30, 30)
-        color_warning_b = (80, 10, 10)
-
-        is_warning = secs <= WARNING_THRESHOLD
-        if is_warning:
-            # Blink frequency (ms)
-            t = pygame.time.get_ticks()
-            blink_on = ((t // 400) % 2) == 0
-            txt_color = color_warning_a if blink_on else color_warning_b
-        else:
-            txt_color = color_normal
-
-        txt = font.render(text, True, txt_color)
-
-        # render a small stomach icon to the left of the text for clarity
-        icon_size = 20
-        gap = 8
-        # compute combined width (icon + gap + text)
-        total_w = icon_size + gap + txt.get_width()
-        x0 = WIDTH // 2 - total_w // 2
-        y = 10
-        # draw icon (also tint slightly when warning)
-        if _IMG_STOMACH:
-            try:
-                icon_s = pygame.transform.smoothscale(_IMG_STOMACH, (icon_size, icon_size))
-                if is_warning:
-                    # tint the icon by blending a red surface on top to emphasize
-                    tint = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
-                    tint.fill((255, 80, 80, 120))
-                    tmp = icon_s.copy()
-                    tmp.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-                    screen.blit(tmp, (x0, y + (txt.get_height() - icon_size) // 2))
-                else:
-                    screen.blit(icon_s, (x0, y + (txt.get_height() - icon_size) // 2))
-            except Exception:
-                pygame.draw.ellipse(screen, (100, 150, 200), (x0, y + (txt.get_height() - icon_size) // 2, icon_size, icon_size))
-        else:
-            ic_color = (200, 60, 60) if is_warning else (100, 150, 200)
-            pygame.draw.ellipse(screen, ic_color, (x0, y + (txt.get_height() - icon_size) // 2, icon_size, icon_size))
-
-        # draw text to the right of the icon
-        screen.blit(txt, (x0 + icon_size + gap, y))
+        items = _hud_for(font).countdown(0 if seconds_left is None else seconds_left)
+        screen.blits(items, doreturn=False)
+        return _items_rect(items)
     except Exception:
-        pass
+        return None
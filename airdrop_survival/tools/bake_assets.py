@@ -0,0 +1,198 @@
+"""Bake runtime-sized copies of the game's images into assets/baked/.
+
+The source PNGs are several megabytes each but are only ever drawn at
+48-96 px. This script reads the draw sizes from settings.py / ui.py /
+intro.py / player.py, downscales each source once (resampling in
+premultiplied alpha so transparent edges don't bleed dark fringes) and
+writes small PNGs plus assets/baked/manifest.json. The gameplay and HUD
+sprites (drops, hearts/coins/stomach, can, player states) are also packed
+into assets/baked/atlas.png so the game decodes them in one go. At runtime
+src/assets.py serves atlas sprites and baked files whenever they match the
+requested size exactly and falls back to scaling the source otherwise.
+
+It also synthesizes the procedural fallback BGM into the audio cache
+(assets/cache/audio/, see src/audio.py) so a packaged install ships it
+instead of generating it on first launch.
+
+Re-run after changing sizes in settings.py or replacing a source image:
+
+    python tools/bake_assets.py
+"""
+import json
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+sys.path.insert(0, SRC)
+
+import assets  # noqa: E402
+import atlas  # noqa: E402
+import drop  # noqa: E402
+import intro  # noqa: E402
+import player  # noqa: E402
+import settings  # noqa: E402
+import ui  # noqa: E402
+
+MANIFEST_VERSION = 1
+ATLAS_FILE = 'atlas.png'
+
+
+def bake_targets():
+    """Map each source image to the sizes the game draws it at.
+
+    A size is either a fixed (w, h) or a callable taking the source (w, h).
+    """
+    drop_size = (settings.DROP_SIZE, settings.DROP_SIZE)
+    icon = (ui.ICON_SIZE, ui.ICON_SIZE)
+    goal = (ui.GOAL_COIN_SIZE, ui.GOAL_COIN_SIZE)
+    stomach = (ui.STOMACH_ICON_SIZE, ui.STOMACH_ICON_SIZE)
+    can_sizes = [
+        (ui.CAN_ICON_SIZE, ui.CAN_ICON_SIZE),
+        (intro.CAN_HINT_SIZE, intro.CAN_HINT_SIZE),
+        (ui.RESULT_REWARD_SIZE, ui.RESULT_REWARD_SIZE),
+        (ui.HINT_REWARD_SIZE, ui.HINT_REWARD_SIZE),
+    ]
+
+    def player_size(src_size):
+        return player.sprite_draw_size(src_size, (settings.PLAYER_WIDTH, settings.PLAYER_HEIGHT))
+
+    def plane_size(src_size):
+        return int(src_size[0] * intro.PLANE_SCALE), int(src_size[1] * intro.PLANE_SCALE)
+
+    return {
+        'bomb.png': [drop_size],
+        'coin.png': [drop_size, icon, goal],
+        'health_pack.png': [drop_size, icon],
+        'heart_icon.png': [icon],
+        'money_icon.png': [icon, goal],
+        'stomach_icon.png': [stomach],
+        settings.CAN_IMAGE: can_sizes,
+        'player.png': [player_size],
+        'player_hurt.png': [player_size],
+        'player_dead.png': [player_size],
+        'airplane.png': [plane_size],
+    }
+
+
+def _unpremultiply(surf):
+    """Undo premul_alpha() in place. Returns False if numpy is unavailable."""
+    try:
+        import numpy as np
+        from pygame import surfarray
+    except Exception:
+        return False
+    rgb = surfarray.pixels3d(surf)
+    alpha = surfarray.pixels_alpha(surf)
+    a = alpha.astype(np.float32)[..., None]
+    fixed = np.where(a > 0, rgb.astype(np.float32) * 255.0 / np.maximum(a, 1.0), 0.0)
+    rgb[...] = np.clip(fixed + 0.5, 0, 255).astype(np.uint8)
+    del rgb, alpha
+    return True
+
+
+def bake_one(src, size, premultiply):
+    if premultiply:
+        scaled = pygame.transform.smoothscale(src.premul_alpha(), size)
+        if _unpremultiply(scaled):
+            return scaled
+    return pygame.transform.smoothscale(src, size)
+
+
+def atlas_keys():
+    """The sprites the game packs into its atlas (same list Game uses at runtime)."""
+    return drop.atlas_keys() + ui.atlas_keys() + player.atlas_keys()
+
+
+def bake(base=assets.ASSETS_DIR):
+    out_dir = os.path.join(base, assets.BAKED_DIR_NAME)
+    os.makedirs(out_dir, exist_ok=True)
+    premultiply = hasattr(pygame.Surface, 'premul_alpha')
+    images = {}
+    written = set()
+    baked = {}
+    for name, sizes in bake_targets().items():
+        path = os.path.join(base, name)
+        if not os.path.exists(path):
+            print('skip, not found', path)
+            continue
+        try:
+            src = pygame.image.load(path).convert_alpha()
+        except Exception as e:
+            print('failed to load', path, e)
+            continue
+        src_size = src.get_size()
+        variants = {}
+        for size in sizes:
+            w, h = size(src_size) if callable(size) else size
+            key = f"{w}x{h}"
+            if key in variants:
+                continue
+            out_name = f"{os.path.splitext(name)[0]}_{key}.png"
+            surf = bake_one(src, (w, h), premultiply)
+            pygame.image.save(surf, os.path.join(out_dir, out_name))
+            baked[(name, (w, h))] = surf
+            variants[key] = out_name
+            written.add(out_name)
+            print('wrote', os.path.join(out_dir, out_name))
+        images[name] = {
+            'source_size': list(src_size),
+            'source_bytes': os.path.getsize(path),
+            'variants': variants,
+        }
+
+    sprites = {}
+    for key in atlas_keys():
+        if key in baked:
+            sprites[key] = baked[key]
+        else:
+            print('not baked, left out of atlas:', assets.atlas_key_name(key))
+    atlas_entry = None
+    if sprites:
+        sheet, rects = atlas.pack(sprites)
+        pygame.image.save(sheet, os.path.join(out_dir, ATLAS_FILE))
+        written.add(ATLAS_FILE)
+        print('wrote', os.path.join(out_dir, ATLAS_FILE), sheet.get_size())
+        atlas_entry = {
+            'file': ATLAS_FILE,
+            'sprites': {assets.atlas_key_name(k): [r.x, r.y, r.w, r.h] for k, r in rects.items()},
+        }
+
+    # remove variants left over from earlier bakes at sizes no longer used
+    for fn in os.listdir(out_dir):
+        if fn.endswith('.png') and fn not in written:
+            os.remove(os.path.join(out_dir, fn))
+            print('removed stale', fn)
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'premultiplied_resample': premultiply,
+        'images': images,
+    }
+    if atlas_entry is not None:
+        manifest['atlas'] = atlas_entry
+    with open(os.path.join(out_dir, assets.MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    print('wrote', os.path.join(out_dir, assets.MANIFEST_NAME))
+
+
+def warm_audio_cache():
+    try:
+        import audio
+        for path in audio.warm_cache():
+            print('audio cache', path)
+    except Exception as e:
+        print('audio cache not warmed:', e)
+
+
+if __name__ == '__main__':
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    bake()
+    warm_audio_cache()
+    pygame.quit()
@@ -0,0 +1,327 @@
+"""Monte Carlo balancing: play thousands of headless sessions per settings variant.
+
+Each configuration is a set of overrides for src/settings.py. Every one is
+played for --sessions seeded sessions by a scripted bot, spread over all
+cores with a process pool. The same seeds are used for every configuration,
+so differences between them are not just luck. Results are appended to a
+JSONL (or .csv) file one chunk of seeds at a time as they finish. Every row
+records the run parameters (--policy, --seed, --max-ticks, --chunk), and
+re-running the same command skips the chunks already in the file for those
+parameters, so a long sweep can be stopped with Ctrl-C and resumed.
+
+Overrides are `NAME=<python literal list of values>`; nested entries use
+dots, e.g. `LEVELS.0.coins_required`. --grid runs the full cross product,
+--sample N a random subset of it:
+
+    python tools/balance.py --grid "DROP_WEIGHTS=[[6, 4, 0.5], [5, 5, 0.5]]" \\
+        --grid "LEVELS.0.coins_required=[15, 20, 25]" --sessions 2000 --out sweep.jsonl
+    python tools/balance.py --summary sweep.jsonl
+"""
+import argparse
+import ast
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+sys.path.insert(0, SRC)
+
+# Counters summed over the sessions of a chunk (and over chunks in the summary)
+TOTALS = ('sessions', 'wins', 'timeouts', 'deaths', 'levels_reached', 'levels_cleared',
+          'coins_collected', 'hearts_lost', 'final_hearts', 'ticks')
+# Run parameters stored in every row: chunks only count as done, and rows are
+# only summarized together, when these match
+RUN_FIELDS = ('policy', 'seed', 'max_ticks', 'chunk_size')
+CSV_FIELDS = ('config',) + RUN_FIELDS + ('chunk', 'seed_start', 'seed_stop') + TOTALS
+
+
+def apply_overrides(settings, overrides):
+    """Set settings values; 'A.0.b' walks into lists/dicts of settings.A."""
+    for path, value in overrides.items():
+        parts = path.split('.')
+        if len(parts) == 1:
+            setattr(settings, path, value)
+            continue
+        target = getattr(settings, parts[0])
+        for part in parts[1:-1]:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        last = parts[-1]
+        if isinstance(target, list):
+            target[int(last)] = value
+        else:
+            target[last] = value
+
+
+def bot_policy(game):
+    """Dodge bombs about to land on the player, otherwise chase the lowest coin.
+
+    Health packs count as targets while hearts are missing. Returns -1/0/1.
+    """
+    from settings import DROP_SIZE, PLAYER_SPEED, WIDTH
+    p = game.player.rect
+    drops = game.drops
+    if hasattr(drops, 'snapshot'):
+        entries = drops.snapshot()
+    else:
+        entries = [(d.type, d.x, d.y) for d in drops]
+    half = DROP_SIZE / 2.0
+    threats = [x + half for t, x, y in entries
+               if t == 'bomb' and y + DROP_SIZE > p.top - 140 and y < p.bottom
+               and x < p.right + 20 and x + DROP_SIZE > p.left - 20]
+    if threats:
+        cx = min(threats, key=lambda c: abs(c - p.centerx))
+        direction = 1 if p.centerx >= cx else -1
+        # pinned against a wall: run the other way
+        if (direction < 0 and p.left <= 0) or (direction > 0 and p.right >= WIDTH):
+            direction = -direction
+        return direction
+    targets = [(y, x + half) for t, x, y in entries
+               if y < p.bottom and (t == 'coin' or (t == 'health_pack' and game.hearts < 3))]
+    if not targets:
+        return 0
+    _, cx = max(targets)
+    dx = cx - p.centerx
+    if abs(dx) < PLAYER_SPEED:
+        return 0
+    return 1 if dx > 0 else -1
+
+
+def idle_policy(game):
+    return 0
+
+
+POLICIES = {'bot': bot_policy, 'idle': idle_policy}
+
+
+def run_chunk(overrides, seeds, max_ticks, policy_name):
+    """Worker: play sessions for `seeds` under `overrides`; returns summed counters.
+
+    Runs in a fresh process (the settings are read at import time), so the
+    overrides are applied before the game modules are imported.
+    """
+    import settings
+    apply_overrides(settings, overrides)
+    import game
+
+    policy = POLICIES[policy_name]
+    totals = dict.fromkeys(TOTALS, 0)
+    for seed in seeds:
+        g = game.Game(headless=True, seed=seed)
+        st = g.step(max_ticks, policy)
+        totals['sessions'] += 1
+        totals['wins'] += st['outcome'] == 'cleared'
+        totals['timeouts'] += st['outcome'] == 'timeout'
+        totals['deaths'] += st['outcome'] == 'died'
+        totals['levels_reached'] += st['level']
+        totals['levels_cleared'] += st['levels_cleared']
+        totals['coins_collected'] += st['coins_collected']
+        totals['hearts_lost'] += st['bombs_hit']
+        totals['final_hearts'] += st['hearts']
+        totals['ticks'] += st['ticks']
+    return totals
+
+
+def config_key(overrides):
+    return json.dumps(overrides, sort_keys=True)
+
+
+def run_key(row):
+    """(policy, seed, max_ticks, chunk_size) of a row or run; None for rows written without them."""
+    return tuple(row.get(k) for k in RUN_FIELDS)
+
+
+def parse_grid(specs):
+    """['NAME=[v1, v2]', ...] -> {NAME: [v1, v2]}"""
+    grid = {}
+    for spec in specs:
+        name, sep, values = spec.partition('=')
+        if not sep:
+            raise SystemExit(f"bad --grid {spec!r}: expected NAME=[values]")
+        values = ast.literal_eval(values.strip())
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        grid[name.strip()] = list(values)
+    return grid
+
+
+def configurations(grid, sample=None, sample_seed=0):
+    names = sorted(grid)
+    combos = [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+    if sample is not None and sample < len(combos):
+        combos = random.Random(sample_seed).sample(combos, sample)
+    return combos
+
+
+def read_rows(path):
+    """Rows already written to `path` (JSONL or CSV); [] if it doesn't exist."""
+    if not os.path.exists(path):
+        return []
+    rows = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            for row in csv.DictReader(f):
+                for k in ('seed', 'max_ticks', 'chunk_size', 'chunk', 'seed_start', 'seed_stop') + TOTALS:
+                    if row.get(k) not in (None, ''):
+                        row[k] = int(row[k])
+                rows.append(row)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        # a line cut short by an interrupted run; that chunk is redone
+                        continue
+    return rows
+
+
+class ResultWriter:
+    """Append one row per finished chunk, flushed immediately."""
+
+    def __init__(self, path):
+        self.path = path
+        self.csv = path.endswith('.csv')
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if self.csv and not new:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                header = next(csv.reader(f), [])
+            if tuple(header) != CSV_FIELDS:
+                raise SystemExit(f"{path} has different columns (written by an older version?); "
+                                 f"use a new --out file")
+        self.f = open(path, 'a', encoding='utf-8', newline='')
+        if self.csv:
+            self.writer = csv.DictWriter(self.f, fieldnames=CSV_FIELDS)
+            if new:
+                self.writer.writeheader()
+
+    def write(self, row):
+        if self.csv:
+            self.writer.writerow(row)
+        else:
+            self.f.write(json.dumps(row, sort_keys=True) + '\n')
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+
+def summarize(rows):
+    """Aggregate rows per configuration and run parameters into rates and per-session means."""
+    from settings import SIM_TICK_RATE
+    by_config = {}
+    for row in rows:
+        acc = by_config.setdefault((row['config'], run_key(row)), dict.fromkeys(TOTALS, 0))
+        for k in TOTALS:
+            acc[k] += int(row[k])
+    summary = []
+    for (key, run), acc in by_config.items():
+        n = max(1, acc['sessions'])
+        summary.append({
+            'config': key,
+            'policy': run[0] or '?',
+            'sessions': acc['sessions'],
+            'win_rate': acc['wins'] / n,
+            'timeout_rate': acc['timeouts'] / n,
+            'death_rate': acc['deaths'] / n,
+            'coins_per_level': acc['coins_collected'] / max(1, acc['levels_reached']),
+            'hearts_lost': acc['hearts_lost'] / n,
+            'survival_seconds': acc['ticks'] / n / SIM_TICK_RATE,
+        })
+    summary.sort(key=lambda s: -s['win_rate'])
+    return summary
+
+
+def print_summary(summary):
+    print(f"{'win%':>6} {'died%':>6} {'coins/lvl':>9} {'hearts-':>7} {'alive s':>7} {'n':>6} {'policy':>6}  config")
+    for s in summary:
+        print(f"{s['win_rate'] * 100:6.1f} {s['death_rate'] * 100:6.1f} {s['coins_per_level']:9.2f} "
+              f"{s['hearts_lost']:7.2f} {s['survival_seconds']:7.1f} {s['sessions']:6d} {s['policy']:>6}  "
+              f"{s['config']}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--grid', action='append', default=[], metavar='NAME=[values]',
+                    help='settings override candidates (repeatable); cross product is swept')
+    ap.add_argument('--sample', type=int, help='run only N random configurations from the grid')
+    ap.add_argument('--sample-seed', type=int, default=0)
+    ap.add_argument('--sessions', type=int, default=1000, help='sessions per configuration')
+    ap.add_argument('--chunk', type=int, default=100, help='sessions per worker task / output row')
+    ap.add_argument('--seed', type=int, default=0, help='first session seed')
+    ap.add_argument('--max-ticks', type=int, default=60 * 60 * 30, help='step cap per session')
+    ap.add_argument('--policy', choices=sorted(POLICIES), default='bot')
+    ap.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    ap.add_argument('--out', default='balance.jsonl', help='results file (.jsonl or .csv), appended to')
+    ap.add_argument('--summary', metavar='FILE', help='only print the summary of an existing results file')
+    args = ap.parse_args(argv)
+
+    if args.summary:
+        print_summary(summarize(read_rows(args.summary)))
+        return 0
+
+    configs = configurations(parse_grid(args.grid), args.sample, args.sample_seed)
+    keys = {config_key(c) for c in configs}
+    params = {'policy': args.policy, 'seed': args.seed, 'max_ticks': args.max_ticks, 'chunk_size': args.chunk}
+    run = run_key(params)
+    done = set()
+    other_runs = 0
+    for row in read_rows(args.out):
+        if run_key(row) == run:
+            done.add((row['config'], int(row['chunk'])))
+        else:
+            other_runs += 1
+    tasks = []
+    for overrides in configs:
+        key = config_key(overrides)
+        for chunk, start in enumerate(range(0, args.sessions, args.chunk)):
+            if (key, chunk) in done:
+                continue
+            stop = min(args.sessions, start + args.chunk)
+            tasks.append((key, overrides, chunk, args.seed + start, args.seed + stop))
+    skipped = sum(1 for key, _ in done if key in keys)
+    print(f"{len(configs)} configuration(s), {len(tasks)} chunk(s) to run, {skipped} already in {args.out}")
+    if other_runs:
+        print(f"note: {other_runs} row(s) in {args.out} are from runs with other --policy/--seed/"
+              f"--max-ticks/--chunk values; they are not reused or included in this summary")
+
+    writer = ResultWriter(args.out)
+    # settings are read at import time, so every task gets a fresh process
+    ctx = multiprocessing.get_context('spawn')
+    pool = ProcessPoolExecutor(max_workers=max(1, args.workers), mp_context=ctx, max_tasks_per_child=1)
+    try:
+        futures = {
+            pool.submit(run_chunk, overrides, range(seed_start, seed_stop), args.max_ticks, args.policy):
+                (key, chunk, seed_start, seed_stop)
+            for key, overrides, chunk, seed_start, seed_stop in tasks
+        }
+        for i, fut in enumerate(as_completed(futures), 1):
+            key, chunk, seed_start, seed_stop = futures[fut]
+            row = {'config': key, **params, 'chunk': chunk, 'seed_start': seed_start, 'seed_stop': seed_stop}
+            row.update(fut.result())
+            writer.write(row)
+            print(f"[{i}/{len(tasks)}] {key} chunk {chunk}: {row['wins']}/{row['sessions']} won")
+    except KeyboardInterrupt:
+        print('interrupted; finished chunks are saved, re-run the same command to resume')
+        pool.shutdown(wait=False, cancel_futures=True)
+        writer.close()
+        return 1
+    pool.shutdown()
+    writer.close()
+
+    print_summary(summarize([r for r in read_rows(args.out) if r['config'] in keys and run_key(r) == run]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
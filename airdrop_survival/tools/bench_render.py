@@ -0,0 +1,197 @@
+"""Micro-benchmarks for the rendering hot paths (runs under the SDL dummy driver).
+
+Times the background, HUD, countdown, single drop, batched drops, player
+(with and without outline), coin pops and a full Game.draw with N drops, and
+reports per-call percentiles. Results can be saved as JSON and compared with
+a stored baseline; any case whose median got slower than --tolerance makes
+the script exit with status 1:
+
+    python tools/bench_render.py --update-baseline      # record tools/bench_render_baseline.json
+    python tools/bench_render.py --out bench.json       # run, save, compare with the baseline
+
+Baselines are machine-specific: record one on the machine you compare on.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+sys.path.insert(0, SRC)
+
+import pygame  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_render_baseline.json')
+
+
+def percentile(sorted_values, q):
+    """Linear-interpolated percentile of an already sorted list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def measure(fn, samples, inner, warmup):
+    """Call fn() warmup times, then time `samples` batches of `inner` calls.
+
+    Returns per-call statistics in microseconds.
+    """
+    for _ in range(warmup):
+        fn()
+    per_call = []
+    clock = time.perf_counter_ns
+    for _ in range(samples):
+        t0 = clock()
+        for _ in range(inner):
+            fn()
+        per_call.append((clock() - t0) / inner / 1000.0)
+    per_call.sort()
+    return {
+        'p50_us': percentile(per_call, 50),
+        'p95_us': percentile(per_call, 95),
+        'p99_us': percentile(per_call, 99),
+        'mean_us': sum(per_call) / len(per_call),
+        'min_us': per_call[0],
+        'samples': samples,
+        'inner': inner,
+    }
+
+
+def build_cases(n_drops):
+    """Return [(name, fn, inner)] sharing one Game set up with `n_drops` drops."""
+    import drop as drop_module
+    import game as game_module
+    import ui
+    from settings import WIDTH, HEIGHT
+
+    random.seed(1234)
+    g = game_module.Game()
+    screen = g.screen
+    # the control hint only shows for the first seconds of play; leave it out
+    g.control_hint_end = 0
+    # spread the drops over the screen (list of Drop objects or DropArrays)
+    for _ in range(n_drops):
+        drop_module.spawn_drop(g.drops, elapsed_seconds=30.0)
+    if isinstance(g.drops, list):
+        for d in g.drops:
+            d.y = d.prev_y = random.uniform(0, HEIGHT - 60)
+            d.rect.y = d.y
+    else:
+        n = len(g.drops)
+        g.drops.y[:n] = [random.uniform(0, HEIGHT - 60) for _ in range(n)]
+        g.drops.prev_y[:n] = g.drops.y[:n]
+    single = drop_module.Drop(elapsed_seconds=30.0)
+    single.y = single.prev_y = HEIGHT // 2
+    coins_required = g._coins_required()
+    g.coin_pops = [(WIDTH // 2 + i * 40, HEIGHT // 2, g.sim_ticks - i * 100, '+1') for i in range(5)]
+
+    outlined = g.player
+    plain = game_module.Player(WIDTH // 2, HEIGHT - 100)
+    plain.outline = False
+
+    return [
+        ('ui.draw_background', lambda: ui.draw_background(screen, WIDTH, HEIGHT), 20),
+        ('ui.draw_status', lambda: ui.draw_status(screen, g.font, 2, 13, time_left_seconds=42,
+                                                  coins_required=coins_required), 50),
+        ('ui.draw_center_countdown', lambda: ui.draw_center_countdown(screen, g.font, 4), 50),
+        ('Drop.draw', lambda: single.draw(screen), 200),
+        (f'draw_drops[{n_drops}]', lambda: drop_module.draw_drops(screen, g.drops, 0.5), 20),
+        ('Player.draw outline', lambda: outlined.draw(screen, (0, 0, 0), now=0), 200),
+        ('Player.draw no outline', lambda: plain.draw(screen, (0, 0, 0), now=0), 200),
+        ('Game.draw_pops[5]', g.draw_pops, 50),
+        (f'Game.draw[{n_drops} drops]', lambda: (ui.draw_background(screen, WIDTH, HEIGHT), g.draw(0.5)), 10),
+    ]
+
+
+def run(samples, n_drops, only=None):
+    results = {}
+    for name, fn, inner in build_cases(n_drops):
+        if only and not any(o in name for o in only):
+            continue
+        results[name] = measure(fn, samples, inner, warmup=max(3, inner))
+        r = results[name]
+        print(f"{name:28s} p50 {r['p50_us']:9.1f} us  p95 {r['p95_us']:9.1f}  p99 {r['p99_us']:9.1f}")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print current vs baseline medians; return the names that regressed."""
+    regressed = []
+    base = baseline.get('results', {})
+    print(f"\n{'case':28s} {'base p50':>10} {'now p50':>10} {'change':>8}")
+    for name, r in results.items():
+        b = base.get(name)
+        if b is None or not b.get('p50_us'):
+            print(f"{name:28s} {'-':>10} {r['p50_us']:10.1f} {'new':>8}")
+            continue
+        change = r['p50_us'] / b['p50_us'] - 1.0
+        flag = ''
+        if change > tolerance:
+            regressed.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:28s} {b['p50_us']:10.1f} {r['p50_us']:10.1f} {change * 100:+7.1f}%{flag}")
+    return regressed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--samples', type=int, default=200, help='timed batches per case')
+    ap.add_argument('--drops', type=int, default=100, help='drops on screen for the batched/full-frame cases')
+    ap.add_argument('--only', action='append', help='run only cases whose name contains this (repeatable)')
+    ap.add_argument('--out', help='write results JSON here')
+    ap.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline JSON to compare against')
+    ap.add_argument('--update-baseline', action='store_true', help='save these results as the baseline')
+    ap.add_argument('--tolerance', type=float, default=0.25, help='allowed median slowdown (0.25 = 25%%)')
+    args = ap.parse_args(argv)
+
+    results = run(args.samples, args.drops, args.only)
+    report = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+            'samples': args.samples,
+            'drops': args.drops,
+        },
+        'results': results,
+    }
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('wrote', args.out)
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('wrote baseline', args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressed = compare(results, baseline, args.tolerance)
+    if regressed:
+        print(f"\nFAIL: {len(regressed)} case(s) slower than baseline by more than {args.tolerance:.0%}: "
+              + ', '.join(regressed))
+        return 1
+    print('\nOK: no regressions beyond tolerance')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Startup benchmark: import times and time to first frame / interactive / gameplay.
+
+Launches src/main.py in fresh subprocesses under the SDL dummy drivers:
+
+* an import-only run (`python -X importtime -c "import main"`) gives the
+  cumulative import time of game, drop, ui, intro, audio, pygame and numpy
+  (a module that isn't imported at startup is reported as null);
+* full runs play the Intro until its ENTER GAME button is up, click it and
+  quit after the first gameplay frame. Milestones are read from
+  preload.MARKS and reported in ms since the subprocess was launched:
+  first_flip (first Intro frame), intro_interactive (button clickable),
+  first_game_frame, plus enter_to_game_frame (click to first game frame).
+
+Each metric's median over --runs is reported. The report is written as JSON
+(--out); --history appends a one-line summary to a JSONL file for trends:
+
+    python tools/bench_startup.py --runs 5 --out startup.json --history startup_history.jsonl
+
+The Intro animation plays in real time, so a full run takes about ten seconds.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+
+# Modules whose cumulative import time is reported
+IMPORT_MODULES = ('game', 'drop', 'ui', 'intro', 'audio', 'pygame', 'numpy')
+MILESTONES = ('first_flip', 'intro_interactive', 'first_game_frame', 'enter_to_game_frame')
+
+
+def child_env():
+    env = dict(os.environ)
+    env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    return env
+
+
+def parse_importtime(stderr):
+    """Cumulative import ms of IMPORT_MODULES from `-X importtime` output (first import wins)."""
+    found = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        name = parts[2].strip()
+        if name in IMPORT_MODULES and name not in found:
+            try:
+                found[name] = int(parts[1]) / 1000.0
+            except ValueError:
+                continue
+    return {m: found.get(m) for m in IMPORT_MODULES}
+
+
+def measure_imports(timeout):
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'], cwd=SRC,
+                          env=child_env(), capture_output=True, text=True, timeout=timeout)
+    if proc.returncode != 0:
+        raise RuntimeError(f"import run failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def child(report_path):
+    """Subprocess side of a full run: play main.py, click through the Intro, quit in game."""
+    t0 = time.perf_counter()
+    launched = time.time()
+    os.chdir(SRC)
+    sys.path.insert(0, SRC)
+    import runpy
+    import preload
+    import pygame
+
+    mark = preload.mark
+
+    def driving_mark(name, **info):
+        ms = mark(name, **info)
+        if name == 'intro_interactive':
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=info['button']))
+            mark('enter_clicked')
+        elif name == 'first_game_frame':
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return ms
+
+    preload.mark = driving_mark
+    runpy.run_path(os.path.join(SRC, 'main.py'), run_name='__main__')
+    # MARKS are relative to preload.START (main.py's own start); rebase them on t0
+    offset = (preload.START - t0) * 1000.0
+    marks = {name: entry['ms'] + offset for name, entry in preload.MARKS.items()}
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({'launched': launched, 'marks': marks}, f)
+
+
+def measure_run(timeout):
+    """One full startup; milestones in ms since the subprocess was spawned."""
+    fd, path = tempfile.mkstemp(suffix='.json', prefix='bench_startup_')
+    os.close(fd)
+    try:
+        spawned = time.time()
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', path], cwd=SRC,
+                              env=child_env(), capture_output=True, text=True, timeout=timeout)
+        if proc.returncode != 0:
+            raise RuntimeError(f"startup run failed:\n{proc.stderr[-2000:]}")
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    finally:
+        os.remove(path)
+    interp_ms = (data['launched'] - spawned) * 1000.0
+    marks = {name: ms + interp_ms for name, ms in data['marks'].items()}
+    result = {
+        'interpreter_start': interp_ms,
+        'first_flip': marks.get('first_frame'),
+        'intro_interactive': marks.get('intro_interactive'),
+        'first_game_frame': marks.get('first_game_frame'),
+        'enter_to_game_frame': None,
+    }
+    if 'enter_clicked' in marks and 'first_game_frame' in marks:
+        result['enter_to_game_frame'] = marks['first_game_frame'] - marks['enter_clicked']
+    return result
+
+
+def median(values):
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--runs', type=int, default=3, help='full startup runs (median reported)')
+    ap.add_argument('--import-runs', type=int, default=5, help='import-only runs (median reported)')
+    ap.add_argument('--timeout', type=float, default=120.0, help='seconds allowed per subprocess')
+    ap.add_argument('--out', help='write the JSON report here')
+    ap.add_argument('--history', help='append a one-line JSON summary to this JSONL file')
+    ap.add_argument('--child', metavar='REPORT', help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        child(args.child)
+        return 0
+
+    imports = [measure_imports(args.timeout) for _ in range(max(1, args.import_runs))]
+    import_ms = {m: median([r[m] for r in imports]) for m in IMPORT_MODULES}
+    for m in IMPORT_MODULES:
+        shown = '-' if import_ms[m] is None else f"{import_ms[m]:7.1f} ms"
+        print(f"import {m:28s} {shown}")
+
+    runs = []
+    for i in range(max(1, args.runs)):
+        runs.append(measure_run(args.timeout))
+        print(f"run {i + 1}/{args.runs}: " + ', '.join(
+            f"{k} {v:.0f} ms" for k, v in runs[-1].items() if v is not None))
+    startup_ms = {k: median([r[k] for r in runs]) for k in ('interpreter_start',) + MILESTONES}
+    for k, v in startup_ms.items():
+        print(f"{k:35s} {'-' if v is None else f'{v:7.1f} ms'}")
+
+    meta = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'video_driver': child_env().get('SDL_VIDEODRIVER'),
+        'runs': args.runs,
+        'import_runs': args.import_runs,
+    }
+    try:
+        meta['git_commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                            capture_output=True, text=True).stdout.strip() or None
+    except Exception:
+        meta['git_commit'] = None
+    if args.out:
+        report = {'meta': meta, 'import_ms': import_ms, 'startup_ms': startup_ms,
+                  'runs': runs, 'import_runs': imports}
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('wrote', args.out)
+    if args.history:
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'meta': meta, 'import_ms': import_ms, 'startup_ms': startup_ms},
+                               sort_keys=True) + '\n')
+        print('appended to', args.history)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())